@@ -8,7 +8,6 @@ import asyncio
 import subprocess
 import json
 import logging
-import aiohttp
 import aiofiles
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Tuple
@@ -16,6 +15,8 @@ from pathlib import Path
 import shutil
 import tempfile
 
+from .http_client import HTTPClientFactory
+
 logger = logging.getLogger(__name__)
 
 class ActionResult:
@@ -64,9 +65,10 @@ class BaseAction:
 class GitHubAction(BaseAction):
     """Base class for GitHub-related actions"""
     
-    def __init__(self, name: str, config: Dict[str, Any]):
+    def __init__(self, name: str, config: Dict[str, Any], http_client: HTTPClientFactory):
         super().__init__(name, config)
         self.github_token = config.get('github_token')
+        self.http = http_client
         self.session = None
     
     async def _ensure_session(self):
@@ -77,10 +79,7 @@ class GitHubAction(BaseAction):
                 headers['Authorization'] = f'Bearer {self.github_token}'
                 headers['Accept'] = 'application/vnd.github.v3+json'
             
-            self.session = aiohttp.ClientSession(
-                headers=headers,
-                timeout=aiohttp.ClientTimeout(total=30)
-            )
+            self.session = self.http.session(f"action:{self.name}", headers=headers, timeout=30)
     
     async def close(self):
         """Close HTTP session"""
@@ -498,9 +497,12 @@ class CreateIssueAction(GitHubAction):
 class ActionExecutor:
     """Main executor for autonomous actions with safety guardrails"""
     
-    def __init__(self, action_config: Dict[str, Any], rep_validator = None):
+    def __init__(self, action_config: Dict[str, Any], rep_validator = None,
+                 http_client: Optional[HTTPClientFactory] = None):
         self.config = action_config
         self.rep_validator = rep_validator
+        self.http = http_client or HTTPClientFactory()
+        self._owns_http = http_client is None
         self.actions = {}
         self.enabled = action_config.get('enabled', True)
         self.max_actions_per_hour = action_config.get('max_actions_per_hour', 5)
@@ -522,8 +524,8 @@ class ActionExecutor:
         
         # GitHub actions
         github_config = self.config.get('github', {})
-        self.actions['merge_safe_pr'] = MergeSafePRAction('merge_safe_pr', github_config)
-        self.actions['create_issue'] = CreateIssueAction('create_issue', github_config)
+        self.actions['merge_safe_pr'] = MergeSafePRAction('merge_safe_pr', github_config, self.http)
+        self.actions['create_issue'] = CreateIssueAction('create_issue', github_config, self.http)
         
         # Development actions
         self.actions['update_dependencies'] = UpdateDependenciesAction('update_dependencies', {})
@@ -724,6 +726,9 @@ class ActionExecutor:
             if hasattr(action, 'close'):
                 await action.close()
         
+        if self._owns_http:
+            await self.http.close()
+        
         logger.info("Action executor closed")
 
 # Testing
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+PADA Benchmark - End-to-end throughput harness against a local GitHub stand-in
+Drives PADAService (monitor -> REP validation -> database -> notifications) and reports stage latencies
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import tempfile
+import time
+import tracemalloc
+from collections import defaultdict
+from functools import wraps
+from pathlib import Path
+from typing import Dict, List, Optional, Any
+
+from .github_standin import GitHubStandIn
+from .pada_main import PADAService
+
+logger = logging.getLogger(__name__)
+
+class StageTimer:
+    """Collects per-stage wall-clock durations"""
+    
+    def __init__(self):
+        self.samples: Dict[str, List[float]] = defaultdict(list)
+    
+    def instrument(self, stage: str, obj: Any, method_name: str):
+        """Replace an async method on one instance with a timed wrapper"""
+        
+        method = getattr(obj, method_name)
+        
+        @wraps(method)
+        async def timed(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return await method(*args, **kwargs)
+            finally:
+                self.samples[stage].append((time.perf_counter() - started) * 1000)
+        
+        setattr(obj, method_name, timed)
+    
+    @staticmethod
+    def _percentile(ordered: List[float], q: float) -> float:
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+    
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        result = {}
+        for stage, samples in self.samples.items():
+            ordered = sorted(samples)
+            result[stage] = {
+                'count': len(ordered),
+                'p50_ms': round(self._percentile(ordered, 0.50), 3),
+                'p95_ms': round(self._percentile(ordered, 0.95), 3),
+                'p99_ms': round(self._percentile(ordered, 0.99), 3),
+                'max_ms': round(ordered[-1], 3)
+            }
+        return result
+
+def _benchmark_config(workdir: Path, api_url: str, repositories: List[str],
+                      fetch_mode: str = 'rest') -> Dict[str, Any]:
+    """Service configuration that keeps everything local and unthrottled"""
+    
+    owners_and_names = [name.split('/', 1) for name in repositories]
+    
+    return {
+        'github': {
+            'token': None,
+            'api_url': api_url,
+            'repositories': [
+                {'owner': owner, 'name': name, 'priority': 'HIGH',
+                 'events': ['push', 'pull_request', 'issues', 'workflow_run']}
+                for owner, name in owners_and_names
+            ],
+            'priority_intervals': {'HIGH': 1, 'MEDIUM': 1, 'LOW': 1},
+            'min_poll_interval_seconds': 1,
+            'max_poll_interval_seconds': 1,
+            'rate_limit_reserve': 0,
+            'response_cache_file': None,
+            'poll_state_file': None,
+            'fetch_mode': fetch_mode
+        },
+        'notifications': {
+            'channels': [{'name': 'file', 'log_file': str(workdir / 'notifications.log')}],
+            'max_notifications_per_hour': 10 ** 9,
+            'outbox_file': str(workdir / 'notification_outbox.jsonl'),
+            'quiet_hours': {'start': '00:00', 'end': '00:00'}
+        },
+        # Autonomous actions would call GitHub for real; REP validation still runs
+        'actions': {'enabled': False},
+        'database': {'url': f"sqlite:///{workdir / 'benchmark.db'}"},
+        'retention': {'enabled': False}
+    }
+
+async def run_benchmark(repositories: int = 10, items_per_second: float = 0.5, latency_ms: float = 20.0,
+                        latency_jitter_ms: float = 5.0, duration_seconds: float = 30.0,
+                        fixtures_dir: Optional[str] = None, workdir: Optional[str] = None,
+                        fetch_mode: str = 'rest') -> Dict[str, Any]:
+    """Run the pipeline against the stand-in for ``duration_seconds`` and report throughput"""
+    
+    repository_names = [f"bench/repo{index}" for index in range(repositories)]
+    workdir = Path(workdir or tempfile.mkdtemp(prefix='pada_benchmark_'))
+    workdir.mkdir(parents=True, exist_ok=True)
+    
+    standin = GitHubStandIn(
+        repository_names,
+        items_per_second=items_per_second,
+        latency_ms=latency_ms,
+        latency_jitter_ms=latency_jitter_ms,
+        fixtures_dir=fixtures_dir
+    )
+    api_url = await standin.start()
+    
+    config_path = workdir / 'pada_config.json'
+    config_path.write_text(json.dumps(_benchmark_config(workdir, api_url, repository_names, fetch_mode), indent=2))
+    
+    service = PADAService(str(config_path))
+    
+    timer = StageTimer()
+    timer.instrument('github_poll', service.github_monitor, 'get_new_events')
+    timer.instrument('process_event', service, 'process_event')
+    timer.instrument('db_store', service.db, 'store_event')
+    timer.instrument('preference_check', service.preference_learner, 'should_notify')
+    timer.instrument('notification', service.notification_manager, 'send_notification')
+    timer.instrument('rep_validation', service.rep_validator, 'validate_action')
+    
+    await service.db.initialize()
+    await service.github_monitor.start()
+    
+    tracemalloc.start()
+    memory_start, _ = tracemalloc.get_traced_memory()
+    
+    events_processed = 0
+    started = time.perf_counter()
+    deadline = started + duration_seconds
+    
+    try:
+        # Same loop as PADAService.event_processor, without its error back-off
+        while time.perf_counter() < deadline:
+            events = await service.github_monitor.get_new_events()
+            
+            for event in events:
+                await service.process_event(event)
+            events_processed += len(events)
+            
+            service.github_monitor.commit_events(events)
+            await service.github_monitor.save_poll_state()
+            await asyncio.sleep(service.github_monitor.next_poll_delay(1.0))
+        
+        elapsed = time.perf_counter() - started
+        memory_end, memory_peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        await service.stop()
+        await standin.stop()
+    
+    return {
+        'repositories': repositories,
+        'fetch_mode': fetch_mode,
+        'duration_seconds': round(elapsed, 2),
+        'events_processed': events_processed,
+        'events_per_second': round(events_processed / elapsed, 2),
+        'stages': timer.summary(),
+        'memory': {
+            'start_kb': round(memory_start / 1024, 1),
+            'end_kb': round(memory_end / 1024, 1),
+            'peak_kb': round(memory_peak / 1024, 1),
+            'growth_kb': round((memory_end - memory_start) / 1024, 1)
+        },
+        'http': service.http.get_statistics(),
+        'standin': standin.get_statistics(),
+        'workdir': str(workdir)
+    }
+
+def main():
+    """Run the benchmark from the command line and print a JSON report"""
+    
+    parser = argparse.ArgumentParser(description="PADA end-to-end benchmark against a local GitHub stand-in")
+    parser.add_argument('--repositories', type=int, default=10)
+    parser.add_argument('--items-per-second', type=float, default=0.5,
+                        help="New items per second on each listing endpoint of each repository")
+    parser.add_argument('--latency-ms', type=float, default=20.0)
+    parser.add_argument('--latency-jitter-ms', type=float, default=5.0)
+    parser.add_argument('--duration', type=float, default=30.0)
+    parser.add_argument('--fixtures-dir', help="Directory of recorded responses (commits.json, pulls.json, ...)")
+    parser.add_argument('--workdir')
+    parser.add_argument('--fetch-mode', choices=['rest', 'graphql'], default='rest',
+                        help="GitHubMonitor fetch mode: one request per endpoint, or batched GraphQL queries")
+    args = parser.parse_args()
+    
+    logging.getLogger().setLevel(logging.WARNING)
+    
+    report = asyncio.run(run_benchmark(
+        repositories=args.repositories,
+        items_per_second=args.items_per_second,
+        latency_ms=args.latency_ms,
+        latency_jitter_ms=args.latency_jitter_ms,
+        duration_seconds=args.duration,
+        fixtures_dir=args.fixtures_dir,
+        workdir=args.workdir,
+        fetch_mode=args.fetch_mode
+    ))
+    
+    print(json.dumps(report, indent=2, default=str))
+
+if __name__ == "__main__":
+    main()
@@ -6,21 +6,300 @@ SQLite-based async database for storing events, actions, learning data, and metr
 
 import aiosqlite
 import json
+from abc import ABC, abstractmethod
 import logging
-from datetime import datetime, timedelta
+import os
+from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional, Any, Tuple
 from pathlib import Path
 import uuid
 
 # Import PADA core types
-from .pada_main import Event, ActionResult
+from .models import Event, ActionResult
 
 logger = logging.getLogger(__name__)
 
-class PADADatabase:
+# Health series resolutions: name -> bucket width in seconds (0 = raw samples)
+HEALTH_RESOLUTIONS = {
+    'raw': 0,
+    '1m': 60,
+    '1h': 3600
+}
+
+# Default retention per health series resolution, in days
+DEFAULT_HEALTH_RETENTION_DAYS = {
+    'raw': 1,
+    '1m': 7,
+    '1h': 365
+}
+
+# Hot keys of events.data emitted by GitHubMonitor, indexed by expression
+# (json_extract on SQLite, ->> on PostgreSQL) together with (timestamp, id)
+INDEXED_EVENT_FIELDS = {
+    'repository': 'text',
+    'pr_number': 'integer',
+    'issue_number': 'integer',
+    'workflow_name': 'text',
+    'run_id': 'integer',
+    'commit_sha': 'text'
+}
+
+# Tables subject to retention, in safe deletion order (referencing tables first).
+# time_format is 'iso' for Python isoformat() values, 'sql' for CURRENT_TIMESTAMP defaults.
+RETENTION_TABLES = {
+    'notifications': {
+        'time_column': 'sent_at',
+        'time_format': 'sql',
+        'key_column': 'id',
+        'referenced_by': []
+    },
+    'user_feedback': {
+        'time_column': 'timestamp',
+        'time_format': 'sql',
+        'key_column': 'id',
+        'referenced_by': []
+    },
+    'action_results': {
+        'time_column': 'timestamp',
+        'time_format': 'iso',
+        'key_column': 'action_id',
+        'referenced_by': [('user_feedback', 'action_id')]
+    },
+    'events': {
+        'time_column': 'timestamp',
+        'time_format': 'iso',
+        'key_column': 'id',
+        'referenced_by': [('notifications', 'event_id'), ('action_results', 'event_id'), ('user_feedback', 'event_id')]
+    }
+}
+
+class DatabaseBackend(ABC):
+    """Base class for PADA storage backends
+    
+    Backends implement the async storage API below; ``create_database`` picks
+    the implementation from the database URL scheme. Every storage method
+    is abstract, so an incomplete backend fails when it is instantiated.
+    """
+    
+    def __init__(self, database_url: str, health_retention_days: Optional[Dict[str, float]] = None):
+        self.database_url = database_url
+        self.health_retention_days = {**DEFAULT_HEALTH_RETENTION_DAYS, **(health_retention_days or {})}
+    
+    @abstractmethod
+    async def initialize(self):
+        """Connect and create the schema"""
+        raise NotImplementedError
+    
+    @abstractmethod
+    async def store_event(self, event: Event):
+        """Store an event"""
+        raise NotImplementedError
+    
+    @abstractmethod
+    async def store_events(self, events: List[Event]) -> int:
+        """Bulk-store events, skipping ids already stored; returns rows inserted"""
+        raise NotImplementedError
+    
+    @abstractmethod
+    async def store_action_result(self, action_result: ActionResult):
+        """Store an action result"""
+        raise NotImplementedError
+    
+    @abstractmethod
+    async def track_notification(self, event_id: str, status: str, channel: str = "default"):
+        """Record the latest delivery status of an event's notification on one channel"""
+        raise NotImplementedError
+    
+    @abstractmethod
+    async def store_user_feedback(self, event_id: str, feedback_type: str, helpful: bool,
+                                action_id: Optional[str] = None, rating: Optional[int] = None,
+                                comment: Optional[str] = None):
+        """Store user feedback for learning"""
+        raise NotImplementedError
+    
+    @abstractmethod
+    async def store_health_metrics(self, health_data: Dict[str, Any]):
+        """Store system health metrics as time-series samples"""
+        raise NotImplementedError
+    
+    @abstractmethod
+    async def get_health_series(self, component: str, start: datetime, end: Optional[datetime] = None,
+                               resolution: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get health samples for a component within [start, end)"""
+        raise NotImplementedError
+    
+    @abstractmethod
+    async def prune_health_series(self) -> int:
+        """Delete health samples older than their resolution's retention window"""
+        raise NotImplementedError
+    
+    @abstractmethod
+    async def get_statistics(self) -> Dict[str, Any]:
+        """Get comprehensive statistics"""
+        raise NotImplementedError
+    
+    @abstractmethod
+    async def get_events(self, limit: int = 100, offset: int = 0,
+                        event_type: Optional[str] = None, severity: Optional[str] = None,
+                        cursor: Optional[Tuple[str, str]] = None,
+                        projection: str = 'full',
+                        data_filters: Optional[Dict[str, Any]] = None) -> List[Event]:
+        """Get events with optional filtering, newest first"""
+        raise NotImplementedError
+    
+    @abstractmethod
+    async def get_event_rows(self, limit: int = 100, event_type: Optional[str] = None,
+                            severity: Optional[str] = None,
+                            cursor: Optional[Tuple[str, str]] = None,
+                            data_filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """Get events as plain rows with ``data`` left as JSON text"""
+        raise NotImplementedError
+    
+    @abstractmethod
+    async def get_event_data(self, event_id: str) -> Dict[str, Any]:
+        """Load and decode the ``data`` payload of a single event"""
+        raise NotImplementedError
+    
+    @abstractmethod
+    async def get_event_key(self, event_id: str) -> Optional[Tuple[str, str, str]]:
+        """(source, type, severity) of a single event, or None if it is not stored"""
+        raise NotImplementedError
+    
+    @abstractmethod
+    async def event_exists(self, event_type: Optional[str] = None,
+                          data_filters: Optional[Dict[str, Any]] = None) -> bool:
+        """Check whether any event matches the type and indexed data fields"""
+        raise NotImplementedError
+    
+    @abstractmethod
+    async def get_learning_data(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Get data for machine learning"""
+        raise NotImplementedError
+    
+    @abstractmethod
+    async def store_learning_pattern(self, pattern_type: str, pattern_data: Dict[str, Any],
+                                   confidence_score: float, pattern_id: Optional[str] = None):
+        """Store a learned pattern; an existing ``pattern_id`` is overwritten"""
+        raise NotImplementedError
+    
+    @abstractmethod
+    async def get_learning_patterns(self, pattern_type: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get stored learning patterns"""
+        raise NotImplementedError
+    
+    @abstractmethod
+    async def get_expired_rows(self, table: str, cutoff: datetime, limit: int) -> List[Dict[str, Any]]:
+        """Get unreferenced rows of a retention table older than ``cutoff``"""
+        raise NotImplementedError
+    
+    @abstractmethod
+    async def delete_rows(self, table: str, keys: List[str]) -> int:
+        """Delete rows of a retention table by primary key"""
+        raise NotImplementedError
+    
+    async def incremental_vacuum(self, max_pages: int) -> int:
+        """Reclaim free space; returns pages reclaimed (optional, a no-op by default)"""
+        return 0
+    
+    @abstractmethod
+    async def health_check(self) -> bool:
+        """Check database health"""
+        raise NotImplementedError
+    
+    @abstractmethod
+    async def close(self):
+        """Close database connections"""
+        raise NotImplementedError
+    
+    @staticmethod
+    def event_cursor(event: Event) -> Tuple[str, str]:
+        """Build the keyset cursor that continues a listing after ``event``"""
+        return (event.timestamp.isoformat(), event.id)
+    
+    @staticmethod
+    def _validate_data_filters(data_filters: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Reject filters on data keys that have no expression index"""
+        
+        data_filters = data_filters or {}
+        unindexed = set(data_filters) - set(INDEXED_EVENT_FIELDS)
+        
+        if unindexed:
+            raise ValueError(f"Event data fields not indexed: {sorted(unindexed)}")
+        
+        return data_filters
+    
+    @staticmethod
+    def _epoch(value: datetime) -> int:
+        """Convert a naive UTC or aware datetime to unix epoch seconds"""
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return int(value.timestamp())
+    
+    def _health_samples(self, health_data: Dict[str, Any]) -> List[Tuple[str, int, int, float, int]]:
+        """Expand health data into (component, resolution, bucket, value, critical) samples
+        
+        Each numeric or boolean component yields one sample per resolution, so
+        raw, 1m and 1h series are all written together. Non-numeric values are
+        skipped.
+        """
+        
+        now = self._epoch(datetime.utcnow())
+        samples = []
+        
+        for component, value in health_data.items():
+            if isinstance(value, bool):
+                metric_value = 1.0 if value else 0.0
+                critical = 0 if value else 1
+            elif isinstance(value, (int, float)):
+                metric_value = float(value)
+                critical = 0
+            else:
+                continue
+            
+            for resolution in HEALTH_RESOLUTIONS.values():
+                bucket = now - (now % resolution) if resolution else now
+                samples.append((component, resolution, bucket, metric_value, critical))
+        
+        return samples
+    
+    def _resolve_health_resolution(self, start: datetime, resolution: Optional[str]) -> int:
+        """Pick the bucket width for a health range query
+        
+        When ``resolution`` is omitted, the finest resolution whose retention
+        window still covers ``start`` is used.
+        """
+        
+        if resolution is None:
+            age_days = (self._epoch(datetime.utcnow()) - self._epoch(start)) / 86400
+            resolution = next(
+                (name for name in HEALTH_RESOLUTIONS if self.health_retention_days[name] >= age_days),
+                '1h'
+            )
+        
+        if resolution not in HEALTH_RESOLUTIONS:
+            raise ValueError(f"Unknown health series resolution: {resolution}")
+        
+        return HEALTH_RESOLUTIONS[resolution]
+    
+    @staticmethod
+    def _health_point(row) -> Dict[str, Any]:
+        """Convert a health_series row to its API representation"""
+        return {
+            'timestamp': datetime.utcfromtimestamp(row[0]).isoformat(),
+            'samples': row[1],
+            'avg': row[2] / row[1],
+            'min': row[3],
+            'max': row[4],
+            'last': row[5],
+            'critical_count': row[6]
+        }
+
+class PADADatabase(DatabaseBackend):
     """Async SQLite database for PADA data storage"""
     
-    def __init__(self, database_url: str):
+    def __init__(self, database_url: str, health_retention_days: Optional[Dict[str, float]] = None):
+        super().__init__(database_url, health_retention_days)
+        
         # Parse database URL (supports sqlite:///path format)
         if database_url.startswith('sqlite:///'):
             self.db_path = database_url[10:]  # Remove 'sqlite:///'
@@ -34,6 +313,7 @@ class PADADatabase:
         db_file.parent.mkdir(parents=True, exist_ok=True)
         
         self.db = None
+        self.incremental_vacuum_enabled = False
         logger.info(f"PADA database initialized: {self.db_path}")
     
     async def initialize(self):
@@ -47,16 +327,68 @@ class PADADatabase:
         # Enable foreign keys
         await self.db.execute("PRAGMA foreign_keys = ON")
         
+        # Incremental auto-vacuum only takes effect on a fresh database (or after a full VACUUM)
+        await self.db.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        cursor = await self.db.execute("PRAGMA auto_vacuum")
+        self.incremental_vacuum_enabled = (await cursor.fetchone())[0] == 2
+        
+        if not self.incremental_vacuum_enabled:
+            logger.info("Incremental auto-vacuum not active - run a one-time VACUUM to enable it")
+        
         # Create tables
         await self._create_tables()
         
         # Create indexes for performance
         await self._create_indexes()
         
+        # Move samples from the pre-time-series health table
+        await self._migrate_health_metrics()
+        
         await self.db.commit()
         
         logger.info("PADA database initialized successfully")
     
+    async def _migrate_health_metrics(self):
+        """Roll the legacy health_metrics table up into hourly health_series buckets, then drop it
+        
+        Only numeric and boolean samples carry over (as the live writer
+        stores them); hours already present in health_series are kept.
+        """
+        
+        cursor = await self.db.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'health_metrics'")
+        if await cursor.fetchone() is None:
+            return
+        
+        cursor = await self.db.execute('''
+            INSERT INTO health_series (
+                component, resolution, bucket, sample_count, value_sum,
+                value_min, value_max, value_last, critical_count
+            )
+            SELECT
+                component, 3600, bucket, COUNT(*), SUM(metric_value),
+                MIN(metric_value), MAX(metric_value),
+                (
+                    SELECT latest.metric_value FROM health_metrics latest
+                    WHERE latest.component = samples.component
+                      AND latest.metric_value IS NOT NULL
+                      AND CAST(strftime('%s', latest.timestamp) AS INTEGER) / 3600 * 3600 = samples.bucket
+                    ORDER BY latest.timestamp DESC LIMIT 1
+                ),
+                SUM(status = 'critical')
+            FROM (
+                SELECT component, metric_value, status,
+                       CAST(strftime('%s', timestamp) AS INTEGER) / 3600 * 3600 AS bucket
+                FROM health_metrics
+                WHERE metric_value IS NOT NULL
+            ) samples
+            GROUP BY component, bucket
+            ON CONFLICT (component, resolution, bucket) DO NOTHING
+        ''')
+        migrated = cursor.rowcount
+        
+        await self.db.execute('DROP TABLE health_metrics')
+        logger.info(f"Migrated legacy health_metrics into {migrated} hourly health_series buckets")
+    
     async def _create_tables(self):
         """Create all database tables"""
         
@@ -98,7 +430,7 @@ class PADADatabase:
                 id TEXT PRIMARY KEY,
                 event_id TEXT NOT NULL,
                 channel TEXT NOT NULL,
-                status TEXT NOT NULL,  -- sent, delivered, failed, dismissed
+                status TEXT NOT NULL,  -- sent, retrying, dead, delivered, failed, dismissed
                 sent_at DATETIME DEFAULT CURRENT_TIMESTAMP,
                 delivered_at DATETIME,
                 user_action TEXT,  -- dismissed, clicked, ignored
@@ -136,17 +468,21 @@ class PADADatabase:
             )
         ''')
         
-        # Health metrics table - system health tracking
+        # Health series table - time-series health tracking, one row per
+        # (component, resolution, bucket) with raw samples rolled up on write
         await self.db.execute('''
-            CREATE TABLE IF NOT EXISTS health_metrics (
-                id TEXT PRIMARY KEY,
-                timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+            CREATE TABLE IF NOT EXISTS health_series (
                 component TEXT NOT NULL,
-                metric_name TEXT NOT NULL,
-                metric_value REAL,
-                status TEXT,  -- healthy, warning, critical
-                details TEXT  -- JSON details
-            )
+                resolution INTEGER NOT NULL,  -- bucket width in seconds, 0 = raw sample
+                bucket INTEGER NOT NULL,  -- bucket start, unix epoch seconds
+                sample_count INTEGER NOT NULL,
+                value_sum REAL NOT NULL,
+                value_min REAL NOT NULL,
+                value_max REAL NOT NULL,
+                value_last REAL NOT NULL,
+                critical_count INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (component, resolution, bucket)
+            ) WITHOUT ROWID
         ''')
         
         # Statistics table - aggregated statistics
@@ -163,12 +499,26 @@ class PADADatabase:
     async def _create_indexes(self):
         """Create database indexes for performance"""
         
-        # Events indexes
-        await self.db.execute('CREATE INDEX IF NOT EXISTS idx_events_timestamp ON events (timestamp)')
-        await self.db.execute('CREATE INDEX IF NOT EXISTS idx_events_type ON events (type)')
-        await self.db.execute('CREATE INDEX IF NOT EXISTS idx_events_severity ON events (severity)')
+        # Events indexes - composite (filter..., timestamp, id) indexes serve every
+        # get_events filter combination plus the keyset ORDER BY without a sort step
+        await self.db.execute('CREATE INDEX IF NOT EXISTS idx_events_ts_id ON events (timestamp, id)')
+        await self.db.execute('CREATE INDEX IF NOT EXISTS idx_events_type_ts ON events (type, timestamp, id)')
+        await self.db.execute('CREATE INDEX IF NOT EXISTS idx_events_severity_ts ON events (severity, timestamp, id)')
+        await self.db.execute('CREATE INDEX IF NOT EXISTS idx_events_type_severity_ts ON events (type, severity, timestamp, id)')
         await self.db.execute('CREATE INDEX IF NOT EXISTS idx_events_source ON events (source)')
         
+        # Expression indexes on hot events.data keys; queries must use the same expression
+        for field in INDEXED_EVENT_FIELDS:
+            await self.db.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_events_data_{field} "
+                f"ON events (json_extract(data, '$.{field}'), timestamp, id)"
+            )
+        
+        # Single-column indexes superseded by the composite indexes above
+        await self.db.execute('DROP INDEX IF EXISTS idx_events_timestamp')
+        await self.db.execute('DROP INDEX IF EXISTS idx_events_type')
+        await self.db.execute('DROP INDEX IF EXISTS idx_events_severity')
+        
         # Action results indexes
         await self.db.execute('CREATE INDEX IF NOT EXISTS idx_actions_timestamp ON action_results (timestamp)')
         await self.db.execute('CREATE INDEX IF NOT EXISTS idx_actions_type ON action_results (action_type)')
@@ -182,9 +532,8 @@ class PADADatabase:
         await self.db.execute('CREATE INDEX IF NOT EXISTS idx_feedback_timestamp ON user_feedback (timestamp)')
         await self.db.execute('CREATE INDEX IF NOT EXISTS idx_feedback_type ON user_feedback (feedback_type)')
         
-        # Health metrics indexes
-        await self.db.execute('CREATE INDEX IF NOT EXISTS idx_health_timestamp ON health_metrics (timestamp)')
-        await self.db.execute('CREATE INDEX IF NOT EXISTS idx_health_component ON health_metrics (component)')
+        # Health series index for retention sweeps (primary key serves range queries)
+        await self.db.execute('CREATE INDEX IF NOT EXISTS idx_health_series_bucket ON health_series (resolution, bucket)')
     
     async def store_event(self, event: Event):
         """Store an event in the database"""
@@ -210,6 +559,40 @@ class PADADatabase:
         await self.db.commit()
         logger.debug(f"Stored event: {event.id}")
     
+    async def store_events(self, events: List[Event]) -> int:
+        """Bulk-store events in one transaction, skipping ids already stored"""
+        
+        if not events:
+            return 0
+        
+        before = self.db.total_changes
+        
+        await self.db.executemany('''
+            INSERT OR IGNORE INTO events (
+                id, source, type, title, description, severity, 
+                timestamp, data, requires_action, suggested_actions
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', [
+            (
+                event.id,
+                event.source,
+                event.type,
+                event.title,
+                event.description,
+                event.severity,
+                event.timestamp.isoformat(),
+                json.dumps(event.data) if event.data else None,
+                event.requires_action,
+                json.dumps(event.suggested_actions) if event.suggested_actions else None
+            ) for event in events
+        ])
+        
+        await self.db.commit()
+        
+        inserted = self.db.total_changes - before
+        logger.debug(f"Stored {inserted}/{len(events)} events")
+        return inserted
+    
     async def store_action_result(self, action_result: ActionResult):
         """Store an action result in the database"""
         
@@ -232,14 +615,17 @@ class PADADatabase:
         logger.debug(f"Stored action result: {action_result.action_id}")
     
     async def track_notification(self, event_id: str, status: str, channel: str = "default"):
-        """Track notification delivery status"""
+        """Track notification delivery status; one row per event and channel"""
         
-        notification_id = f"notif_{event_id}_{int(datetime.utcnow().timestamp())}"
+        notification_id = f"notif_{event_id}_{channel}"
         
         await self.db.execute('''
-            INSERT INTO notifications (id, event_id, channel, status)
-            VALUES (?, ?, ?, ?)
-        ''', (notification_id, event_id, channel, status))
+            INSERT INTO notifications (id, event_id, channel, status, delivered_at)
+            VALUES (?, ?, ?, ?, CASE WHEN ? = 'sent' THEN CURRENT_TIMESTAMP END)
+            ON CONFLICT (id) DO UPDATE SET
+                status = excluded.status,
+                delivered_at = COALESCE(excluded.delivered_at, delivered_at)
+        ''', (notification_id, event_id, channel, status, status))
         
         await self.db.commit()
         logger.debug(f"Tracked notification: {notification_id}")
@@ -261,39 +647,80 @@ class PADADatabase:
         logger.debug(f"Stored user feedback: {feedback_id}")
     
     async def store_health_metrics(self, health_data: Dict[str, Any]):
-        """Store system health metrics"""
+        """Store system health metrics as time-series samples
+        
+        Raw samples are rolled up into their 1m and 1h buckets in the same
+        transaction, so downsampled series are always current.
+        """
+        
+        rows = [
+            (component, resolution, bucket, value, value, value, value, critical)
+            for component, resolution, bucket, value, critical in self._health_samples(health_data)
+        ]
+        
+        await self.db.executemany('''
+            INSERT INTO health_series (
+                component, resolution, bucket, sample_count, value_sum,
+                value_min, value_max, value_last, critical_count
+            ) VALUES (?, ?, ?, 1, ?, ?, ?, ?, ?)
+            ON CONFLICT (component, resolution, bucket) DO UPDATE SET
+                sample_count = sample_count + 1,
+                value_sum = value_sum + excluded.value_sum,
+                value_min = MIN(value_min, excluded.value_min),
+                value_max = MAX(value_max, excluded.value_max),
+                value_last = excluded.value_last,
+                critical_count = critical_count + excluded.critical_count
+        ''', rows)
+        
+        await self.db.commit()
+        logger.debug(f"Stored health metrics: {len(rows) // len(HEALTH_RESOLUTIONS)} components")
+    
+    async def get_health_series(self, component: str, start: datetime, end: Optional[datetime] = None,
+                               resolution: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get health samples for a component within [start, end)
         
-        timestamp = datetime.utcnow()
+        When ``resolution`` is omitted, the finest resolution whose retention
+        window still covers ``start`` is used.
+        """
         
-        for component, value in health_data.items():
-            metric_id = f"health_{component}_{int(timestamp.timestamp())}"
-            
-            # Determine status based on value type
-            status = "healthy"
-            metric_value = None
-            
-            if isinstance(value, bool):
-                status = "healthy" if value else "critical"
-                metric_value = 1.0 if value else 0.0
-            elif isinstance(value, (int, float)):
-                metric_value = float(value)
-                status = "healthy"
-            
-            await self.db.execute('''
-                INSERT INTO health_metrics (
-                    id, component, metric_name, metric_value, status, details
-                ) VALUES (?, ?, ?, ?, ?, ?)
-            ''', (
-                metric_id,
-                component,
-                component,
-                metric_value,
-                status,
-                json.dumps({'original_value': value}) if not isinstance(value, (bool, int, float)) else None
-            ))
+        end = end or datetime.utcnow()
+        bucket_width = self._resolve_health_resolution(start, resolution)
+        
+        cursor = await self.db.execute('''
+            SELECT bucket, sample_count, value_sum, value_min, value_max, value_last, critical_count
+            FROM health_series
+            WHERE component = ? AND resolution = ? AND bucket >= ? AND bucket < ?
+            ORDER BY bucket
+        ''', (
+            component,
+            bucket_width,
+            self._epoch(start),
+            self._epoch(end)
+        ))
+        rows = await cursor.fetchall()
+        
+        return [self._health_point(row) for row in rows]
+    
+    async def prune_health_series(self) -> int:
+        """Delete health samples older than their resolution's retention window"""
+        
+        now = self._epoch(datetime.utcnow())
+        deleted = 0
+        
+        for name, resolution in HEALTH_RESOLUTIONS.items():
+            cutoff = int(now - self.health_retention_days[name] * 86400)
+            cursor = await self.db.execute(
+                'DELETE FROM health_series WHERE resolution = ? AND bucket < ?',
+                (resolution, cutoff)
+            )
+            deleted += cursor.rowcount
         
         await self.db.commit()
-        logger.debug(f"Stored health metrics: {len(health_data)} components")
+        
+        if deleted:
+            logger.debug(f"Pruned {deleted} expired health samples")
+        
+        return deleted
     
     async def get_statistics(self) -> Dict[str, Any]:
         """Get comprehensive statistics"""
@@ -372,16 +799,16 @@ class PADADatabase:
             'avg_rating': round(feedback_stats[2] or 0, 1)
         }
         
-        # System uptime (approximate from health metrics)
+        # System uptime (approximate from health series)
         cursor = await self.db.execute('''
-            SELECT MIN(timestamp) as earliest_health_check
-            FROM health_metrics
-            WHERE timestamp > datetime('now', '-7 days')
-        ''')
+            SELECT MIN(bucket) as earliest_health_check
+            FROM health_series
+            WHERE resolution = ? AND bucket > CAST(strftime('%s', 'now', '-7 days') AS INTEGER)
+        ''', (HEALTH_RESOLUTIONS['1m'],))
         uptime_result = await cursor.fetchone()
         
         if uptime_result[0]:
-            earliest = datetime.fromisoformat(uptime_result[0])
+            earliest = datetime.utcfromtimestamp(uptime_result[0])
             uptime_hours = (datetime.utcnow() - earliest).total_seconds() / 3600
             stats['system'] = {
                 'uptime_hours': round(uptime_hours, 1)
@@ -392,33 +819,34 @@ class PADADatabase:
         return stats
     
     async def get_events(self, limit: int = 100, offset: int = 0, 
-                        event_type: Optional[str] = None, severity: Optional[str] = None) -> List[Event]:
-        """Get events with optional filtering"""
+                        event_type: Optional[str] = None, severity: Optional[str] = None,
+                        cursor: Optional[Tuple[str, str]] = None,
+                        projection: str = 'full',
+                        data_filters: Optional[Dict[str, Any]] = None) -> List[Event]:
+        """Get events with optional filtering, newest first
         
-        query = '''
-            SELECT id, source, type, title, description, severity, 
-                   timestamp, data, requires_action, suggested_actions
-            FROM events
-        '''
-        params = []
-        conditions = []
+        Pass ``cursor`` (see ``event_cursor``) instead of ``offset`` to page through
+        deep history: keyset pagination seeks straight to the position in the
+        (timestamp, id) index rather than scanning and discarding ``offset`` rows.
         
-        if event_type:
-            conditions.append('type = ?')
-            params.append(event_type)
+        ``projection='summary'`` skips reading and decoding the ``data`` column
+        (``Event.data`` is left empty); use ``get_event_data`` to load it on demand.
         
-        if severity:
-            conditions.append('severity = ?')
-            params.append(severity)
+        ``data_filters`` matches keys of ``data`` listed in ``INDEXED_EVENT_FIELDS``
+        (e.g. ``{'repository': 'owner/repo'}``) through their expression indexes.
+        """
         
-        if conditions:
-            query += ' WHERE ' + ' AND '.join(conditions)
+        if projection not in ('full', 'summary'):
+            raise ValueError(f"Unknown event projection: {projection}")
         
-        query += ' ORDER BY timestamp DESC LIMIT ? OFFSET ?'
-        params.extend([limit, offset])
+        columns = 'id, source, type, title, description, severity, timestamp, requires_action, suggested_actions'
+        if projection == 'full':
+            columns += ', data'
         
-        cursor = await self.db.execute(query, params)
-        rows = await cursor.fetchall()
+        query, params = self._build_events_query(columns, limit, offset, event_type, severity, cursor, data_filters)
+        
+        cursor_result = await self.db.execute(query, params)
+        rows = await cursor_result.fetchall()
         
         events = []
         for row in rows:
@@ -430,14 +858,111 @@ class PADADatabase:
                 description=row[4],
                 severity=row[5],
                 timestamp=datetime.fromisoformat(row[6]),
-                data=json.loads(row[7]) if row[7] else {},
-                requires_action=bool(row[8]),
-                suggested_actions=json.loads(row[9]) if row[9] else []
+                data=json.loads(row[9]) if projection == 'full' and row[9] else {},
+                requires_action=bool(row[7]),
+                suggested_actions=json.loads(row[8]) if row[8] else []
             )
             events.append(event)
         
         return events
     
+    async def get_event_rows(self, limit: int = 100, event_type: Optional[str] = None,
+                            severity: Optional[str] = None,
+                            cursor: Optional[Tuple[str, str]] = None,
+                            data_filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """Get events as plain rows with ``data`` left as the stored JSON text
+        
+        Intended for pass-through consumers (API responses, exports) that never
+        need the decoded payload.
+        """
+        
+        columns = 'id, source, type, title, description, severity, timestamp, requires_action, suggested_actions, data'
+        query, params = self._build_events_query(columns, limit, 0, event_type, severity, cursor, data_filters)
+        
+        cursor_result = await self.db.execute(query, params)
+        rows = await cursor_result.fetchall()
+        
+        return [
+            {
+                'id': row[0],
+                'source': row[1],
+                'type': row[2],
+                'title': row[3],
+                'description': row[4],
+                'severity': row[5],
+                'timestamp': row[6],
+                'requires_action': bool(row[7]),
+                'suggested_actions': row[8],
+                'data': row[9]
+            } for row in rows
+        ]
+    
+    async def get_event_data(self, event_id: str) -> Dict[str, Any]:
+        """Load and decode the ``data`` payload of a single event"""
+        
+        cursor = await self.db.execute('SELECT data FROM events WHERE id = ?', (event_id,))
+        row = await cursor.fetchone()
+        
+        return json.loads(row[0]) if row and row[0] else {}
+    
+    async def get_event_key(self, event_id: str) -> Optional[Tuple[str, str, str]]:
+        """(source, type, severity) of a single event, or None if it is not stored"""
+        
+        cursor = await self.db.execute('SELECT source, type, severity FROM events WHERE id = ?', (event_id,))
+        row = await cursor.fetchone()
+        
+        return tuple(row) if row else None
+    
+    async def event_exists(self, event_type: Optional[str] = None,
+                          data_filters: Optional[Dict[str, Any]] = None) -> bool:
+        """Check whether any event matches the type and indexed data fields
+        
+        Used for dedup checks, e.g. ``event_exists('workflow_failure', {'run_id': 123})``.
+        """
+        
+        query, params = self._build_events_query('1', 1, 0, event_type, None, None, data_filters)
+        
+        cursor = await self.db.execute(query, params)
+        return await cursor.fetchone() is not None
+    
+    def _build_events_query(self, columns: str, limit: int, offset: int,
+                            event_type: Optional[str], severity: Optional[str],
+                            cursor: Optional[Tuple[str, str]],
+                            data_filters: Optional[Dict[str, Any]] = None) -> Tuple[str, List[Any]]:
+        """Build the filtered, keyset-ordered events query shared by the listing methods"""
+        
+        query = f'SELECT {columns} FROM events'
+        params = []
+        conditions = []
+        
+        if event_type:
+            conditions.append('type = ?')
+            params.append(event_type)
+        
+        if severity:
+            conditions.append('severity = ?')
+            params.append(severity)
+        
+        for field, value in self._validate_data_filters(data_filters).items():
+            conditions.append(f"json_extract(data, '$.{field}') = ?")
+            params.append(value)
+        
+        if cursor:
+            conditions.append('(timestamp, id) < (?, ?)')
+            params.extend(cursor)
+        
+        if conditions:
+            query += ' WHERE ' + ' AND '.join(conditions)
+        
+        query += ' ORDER BY timestamp DESC, id DESC LIMIT ?'
+        params.append(limit)
+        
+        if offset:
+            query += ' OFFSET ?'
+            params.append(offset)
+        
+        return query, params
+    
     async def get_learning_data(self) -> Dict[str, List[Dict[str, Any]]]:
         """Get data for machine learning"""
         
@@ -482,15 +1007,19 @@ class PADADatabase:
         }
     
     async def store_learning_pattern(self, pattern_type: str, pattern_data: Dict[str, Any], 
-                                   confidence_score: float):
-        """Store a learned pattern"""
+                                   confidence_score: float, pattern_id: Optional[str] = None):
+        """Store a learned pattern; an existing ``pattern_id`` is overwritten"""
         
-        pattern_id = str(uuid.uuid4())
+        pattern_id = pattern_id or str(uuid.uuid4())
         
         await self.db.execute('''
             INSERT INTO learning_patterns (
                 id, pattern_type, pattern_data, confidence_score
             ) VALUES (?, ?, ?, ?)
+            ON CONFLICT (id) DO UPDATE SET
+                pattern_data = excluded.pattern_data,
+                confidence_score = excluded.confidence_score,
+                updated_at = CURRENT_TIMESTAMP
         ''', (pattern_id, pattern_type, json.dumps(pattern_data), confidence_score))
         
         await self.db.commit()
@@ -536,6 +1065,81 @@ class PADADatabase:
         
         return patterns
     
+    async def get_expired_rows(self, table: str, cutoff: datetime, limit: int) -> List[Dict[str, Any]]:
+        """Get up to ``limit`` rows of a retention table older than ``cutoff``, oldest first
+        
+        Rows still referenced by another table are skipped so they can be
+        deleted without violating foreign keys.
+        """
+        
+        spec = RETENTION_TABLES[table]
+        time_column = spec['time_column']
+        key_column = spec['key_column']
+        
+        if spec['time_format'] == 'iso':
+            cutoff_value = cutoff.isoformat()
+        else:
+            cutoff_value = cutoff.strftime('%Y-%m-%d %H:%M:%S')
+        
+        conditions = [f'{time_column} < ?']
+        for ref_table, ref_column in spec['referenced_by']:
+            conditions.append(
+                f'NOT EXISTS (SELECT 1 FROM {ref_table} r WHERE r.{ref_column} = {table}.{key_column})'
+            )
+        
+        cursor = await self.db.execute(f'''
+            SELECT * FROM {table}
+            WHERE {' AND '.join(conditions)}
+            ORDER BY {time_column}
+            LIMIT ?
+        ''', (cutoff_value, limit))
+        
+        columns = [description[0] for description in cursor.description]
+        rows = await cursor.fetchall()
+        
+        return [dict(zip(columns, row)) for row in rows]
+    
+    async def delete_rows(self, table: str, keys: List[str]) -> int:
+        """Delete rows of a retention table by primary key"""
+        
+        if not keys:
+            return 0
+        
+        key_column = RETENTION_TABLES[table]['key_column']
+        placeholders = ', '.join('?' for _ in keys)
+        
+        cursor = await self.db.execute(
+            f'DELETE FROM {table} WHERE {key_column} IN ({placeholders})',
+            keys
+        )
+        await self.db.commit()
+        
+        return cursor.rowcount
+    
+    async def incremental_vacuum(self, max_pages: int) -> int:
+        """Return up to ``max_pages`` free pages to the filesystem
+        
+        Returns the number of pages reclaimed (0 when incremental auto-vacuum
+        is not active for this database).
+        """
+        
+        if not self.incremental_vacuum_enabled:
+            return 0
+        
+        cursor = await self.db.execute('PRAGMA freelist_count')
+        free_before = (await cursor.fetchone())[0]
+        
+        if not free_before:
+            return 0
+        
+        cursor = await self.db.execute(f'PRAGMA incremental_vacuum({int(max_pages)})')
+        await cursor.fetchall()
+        
+        cursor = await self.db.execute('PRAGMA freelist_count')
+        free_after = (await cursor.fetchone())[0]
+        
+        return free_before - free_after
+    
     async def health_check(self) -> bool:
         """Check database health"""
         
@@ -562,15 +1166,43 @@ class PADADatabase:
             await self.db.close()
             logger.info("Database connection closed")
 
+def create_database(database_url: str, **options) -> DatabaseBackend:
+    """Create the storage backend for a database URL
+    
+    ``postgresql://`` / ``postgres://`` URLs use the asyncpg backend (pool
+    options ``max_connections``, ``connection_timeout`` and ``command_timeout``
+    apply); anything else is treated as an SQLite path or ``sqlite://`` URL.
+    """
+    
+    health_retention_days = options.get('health_retention_days')
+    
+    if database_url.startswith(('postgresql://', 'postgres://')):
+        # Imported lazily so asyncpg stays an optional dependency
+        from .postgres_backend import PostgresDatabase
+        return PostgresDatabase(
+            database_url,
+            health_retention_days=health_retention_days,
+            max_connections=options.get('max_connections', 10),
+            connection_timeout=options.get('connection_timeout', 30),
+            command_timeout=options.get('command_timeout', 60)
+        )
+    
+    return PADADatabase(database_url, health_retention_days=health_retention_days)
+
 # Testing and utilities
 async def test_database():
-    """Test database functionality"""
+    """Test database functionality
+    
+    Runs against SQLite by default; set PADA_TEST_DATABASE_URL to a
+    postgresql:// URL to exercise the PostgreSQL backend instead.
+    """
     
     print("🗄️  Testing PADA Database")
     print("=" * 40)
     
     # Initialize test database
-    db = PADADatabase("test_pada.db")
+    database_url = os.environ.get('PADA_TEST_DATABASE_URL', 'test_pada.db')
+    db = create_database(database_url)
     await db.initialize()
     
     # Test event storage
@@ -590,6 +1222,14 @@ async def test_database():
     await db.store_event(test_event)
     print("✅ Event storage test passed")
     
+    # Test bulk storage skips already-stored events
+    inserted = await db.store_events([test_event])
+    print(f"{'✅' if inserted == 0 else '❌'} Bulk storage dedup test: {inserted} duplicate rows inserted")
+    
+    # Test keyset listing
+    events = await db.get_events(limit=10, projection='summary')
+    print(f"{'✅' if events and events[0].id == test_event.id else '❌'} Event listing test: {len(events)} events")
+    
     # Test statistics
     stats = await db.get_statistics()
     print(f"📊 Statistics: {stats}")
@@ -599,10 +1239,10 @@ async def test_database():
     print(f"🏥 Health check: {'✅ Healthy' if health else '❌ Issues'}")
     
     # Cleanup
+    await db.delete_rows('events', [test_event.id])
     await db.close()
     
     # Remove test database
-    import os
     if os.path.exists("test_pada.db"):
         os.remove("test_pada.db")
     
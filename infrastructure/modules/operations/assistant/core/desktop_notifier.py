@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+PADA Desktop Notifier - Long-lived helper process for desktop notifications
+Reads one JSON notification per line on stdin and answers one JSON acknowledgement per line on stdout
+"""
+
+import json
+import sys
+
+def main():
+    """Show notifications until stdin closes
+    
+    plyer is imported once and its backend (D-Bus where available) is reused
+    for every notification, instead of a fresh process per toast.
+    """
+    
+    try:
+        from plyer import notification
+    except ImportError:
+        notification = None
+    
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        
+        try:
+            if notification is None:
+                raise RuntimeError("plyer not available")
+            
+            request = json.loads(line)
+            notification.notify(
+                title=request['title'],
+                message=request['message'],
+                timeout=request.get('timeout', 5),
+                app_name=request.get('app_name', 'Personal AI Development Assistant')
+            )
+            reply = {'ok': True}
+        except Exception as e:
+            reply = {'ok': False, 'error': str(e)}
+        
+        sys.stdout.write(json.dumps(reply) + '\n')
+        sys.stdout.flush()
+
+if __name__ == "__main__":
+    main()
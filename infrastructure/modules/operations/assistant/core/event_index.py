@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+PADA Event Index - Bounded memory of already-emitted event IDs
+Skips duplicate events before they reach processing and the database
+"""
+
+import base64
+import hashlib
+import math
+from collections import OrderedDict
+from typing import Dict, Any, Optional
+
+class BloomFilter:
+    """Fixed-size Bloom filter over string keys"""
+    
+    def __init__(self, capacity: int, error_rate: float):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+    
+    def _positions(self, key: str):
+        """Bit positions for a key using double hashing over one digest"""
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hash_count))
+    
+    def add(self, key: str):
+        for position in self._positions(key):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+    
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'capacity': self.capacity,
+            'error_rate': self.error_rate,
+            'count': self.count,
+            'bits': base64.b64encode(bytes(self.bits)).decode('ascii')
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'BloomFilter':
+        bloom = cls(data['capacity'], data['error_rate'])
+        bits = base64.b64decode(data['bits'])
+        if len(bits) == len(bloom.bits):
+            bloom.bits = bytearray(bits)
+            bloom.count = data['count']
+        return bloom
+
+class SeenEventIndex:
+    """Remembers event IDs in a recent exact set backed by rotating Bloom filters
+    
+    The exact set answers for the most recent ``recent_size`` IDs. Older IDs
+    are answered by two Bloom filter generations: when the current one
+    holds ``capacity`` IDs it becomes the previous one and the oldest is
+    dropped, so memory stays fixed and each ID is remembered for at least
+    ``capacity`` further insertions. A Bloom false positive (up to about
+    twice ``error_rate`` with both generations full) drops a genuinely new
+    event, so keep the rate small.
+    """
+    
+    def __init__(self, capacity: int = 50000, error_rate: float = 1e-5, recent_size: int = 5000):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.recent_size = recent_size
+        
+        self.recent: OrderedDict = OrderedDict()
+        self.current = BloomFilter(capacity, error_rate)
+        self.previous: Optional[BloomFilter] = None
+        
+        self.duplicates_skipped = 0
+    
+    def __contains__(self, event_id: str) -> bool:
+        if event_id in self.recent:
+            return True
+        return event_id in self.current or (self.previous is not None and event_id in self.previous)
+    
+    def add(self, event_id: str) -> bool:
+        """Record an ID; returns False if it was already seen"""
+        
+        if event_id in self:
+            self.duplicates_skipped += 1
+            return False
+        
+        self.recent[event_id] = None
+        if len(self.recent) > self.recent_size:
+            self.recent.popitem(last=False)
+        
+        if self.current.count >= self.capacity:
+            self.previous = self.current
+            self.current = BloomFilter(self.capacity, self.error_rate)
+        self.current.add(event_id)
+        
+        return True
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'recent': list(self.recent),
+            'current': self.current.to_dict(),
+            'previous': self.previous.to_dict() if self.previous else None
+        }
+    
+    def load(self, data: Dict[str, Any]):
+        """Restore persisted state; filters sized for other settings are discarded"""
+        
+        self.recent = OrderedDict.fromkeys(data.get('recent', [])[-self.recent_size:])
+        
+        for attr in ('current', 'previous'):
+            bloom_data = data.get(attr)
+            if bloom_data and bloom_data['capacity'] == self.capacity and bloom_data['error_rate'] == self.error_rate:
+                setattr(self, attr, BloomFilter.from_dict(bloom_data))
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        return {
+            'recent_ids': len(self.recent),
+            'current_generation_ids': self.current.count,
+            'previous_generation_ids': self.previous.count if self.previous else 0,
+            'memory_bytes': len(self.current.bits) * 2,
+            'duplicates_skipped': self.duplicates_skipped
+        }
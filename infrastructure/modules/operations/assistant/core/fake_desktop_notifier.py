@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+PADA Fake Desktop Notifier - Stand-in for desktop_notifier.py in tests
+Speaks the same JSON-lines protocol, records requests instead of showing them and can exit on cue
+"""
+
+import argparse
+import json
+import sys
+
+def main():
+    """Acknowledge notifications until stdin closes or ``--exit-after`` is reached
+    
+    Titles containing ``reject`` are answered with a failed acknowledgement;
+    every request is appended to ``--log`` as one JSON line.
+    """
+    
+    parser = argparse.ArgumentParser(description="Fake PADA desktop notification helper")
+    parser.add_argument('--log', help="File to append received requests to")
+    parser.add_argument('--exit-after', type=int, help="Exit after acknowledging this many notifications")
+    args = parser.parse_args()
+    
+    acknowledged = 0
+    
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        
+        request = json.loads(line)
+        
+        if args.log:
+            with open(args.log, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(request) + '\n')
+        
+        if 'reject' in request['title']:
+            reply = {'ok': False, 'error': 'rejected by fake helper'}
+        else:
+            reply = {'ok': True}
+        
+        sys.stdout.write(json.dumps(reply) + '\n')
+        sys.stdout.flush()
+        
+        acknowledged += 1
+        if args.exit_after and acknowledged >= args.exit_after:
+            break
+
+if __name__ == "__main__":
+    main()
@@ -5,19 +5,56 @@ Monitors Omar's GitHub repositories for development workflow events
 """
 
 import asyncio
-import aiohttp
+import hashlib
+import hmac
 import logging
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Any, AsyncIterator, Callable, Tuple
+from dataclasses import dataclass, field
 from pathlib import Path
+from urllib.parse import urlsplit
 import json
 
 # Import PADA core types
-from .pada_main import Event
+from .models import Event
+from .poll_scheduler import PollScheduler
+from .event_index import SeenEventIndex
+from .http_client import HTTPClientFactory, PooledSession
+from .triage import TriageRules
 
 logger = logging.getLogger(__name__)
 
+# Webhook event name -> monitored event type
+WEBHOOK_EVENT_TYPES = {
+    'push': 'push',
+    'pull_request': 'pull_request',
+    'issues': 'issues',
+    'workflow_run': 'workflow_run',
+    'dependabot_alert': 'security_alert',
+    'repository_vulnerability_alert': 'security_alert'
+}
+
+# Listing responses meaning "nothing to report" rather than a failed poll
+SKIPPED_STATUSES = {404, 410}
+
+# GraphQL MergeableState -> REST mergeable flag
+GRAPHQL_MERGEABLE = {
+    'MERGEABLE': True,
+    'CONFLICTING': False,
+    'UNKNOWN': None
+}
+
+def verify_webhook_signature(secret: str, body: bytes, signature: Optional[str]) -> bool:
+    """Check an X-Hub-Signature-256 header against the raw request body"""
+    
+    if not secret or not signature or not signature.startswith('sha256='):
+        return False
+    
+    # Compare bytes: headers arrive latin-1 decoded and str comparison
+    # rejects non-ASCII input with a TypeError
+    expected = hmac.new(secret.encode('utf-8'), body, hashlib.sha256).hexdigest().encode('ascii')
+    return hmac.compare_digest(expected, signature[len('sha256='):].encode('latin-1'))
+
 @dataclass
 class GitHubRepository:
     """GitHub repository configuration"""
@@ -27,18 +64,69 @@ class GitHubRepository:
     monitored_events: List[str]
     priority: str  # HIGH, MEDIUM, LOW
     last_checked: datetime
+    webhook: bool = False  # Events arrive by webhook; polling only reconciles
+    triage: TriageRules = field(default=None, repr=False)
 
 class GitHubMonitor:
     """Monitor GitHub repositories for development workflow events"""
     
-    def __init__(self, github_config: Dict[str, Any]):
+    def __init__(self, github_config: Dict[str, Any], http_client: Optional[HTTPClientFactory] = None):
         self.config = github_config
         self.api_token = github_config.get('token')
-        self.base_url = 'https://api.github.com'
+        self.base_url = github_config.get('api_url', 'https://api.github.com').rstrip('/')
+        self.graphql_url = f"{self.base_url}/graphql"
         self.repositories = []
-        self.session: Optional[aiohttp.ClientSession] = None
+        self.session: Optional[PooledSession] = None
+        
+        # Shared HTTP client; a private one is created when running standalone
+        self.http = http_client or HTTPClientFactory()
+        self._owns_http = http_client is None
         self.is_running = False
-        self.last_poll_time = {}
+        
+        # Durable poll state: per repository and endpoint cursors plus the IDs
+        # of events already processed. Cursors from a poll are staged until
+        # commit_events confirms its whole batch was processed.
+        self.poll_cursors: Dict[str, datetime] = {}
+        self._pending_cursors: Dict[str, datetime] = {}
+        self.seen_events = SeenEventIndex(
+            capacity=github_config.get('dedup_capacity', 50000),
+            error_rate=github_config.get('dedup_error_rate', 1e-5),
+            recent_size=github_config.get('dedup_recent_size', 5000)
+        )
+        state_file = github_config.get('poll_state_file', 'pada_github_state.json')
+        self.poll_state_file = Path(state_file) if state_file else None
+        self._poll_state_dirty = False
+        self._load_poll_state()
+        
+        # Concurrency limits: in-flight monitor requests and concurrent requests to the API host
+        self.max_concurrent_requests = github_config.get('max_concurrent_requests', 10)
+        self.max_requests_per_host = github_config.get('max_requests_per_host', 5)
+        self.max_pages_per_fetch = github_config.get('max_pages_per_fetch', 10)
+        
+        # 'graphql' fetches whole batches of repositories in one aliased query
+        self.fetch_mode = github_config.get('fetch_mode', 'rest')
+        self.graphql_batch_size = github_config.get('graphql_batch_size', 20)
+        self.graphql_page_size = github_config.get('graphql_page_size', 25)
+        self._request_semaphore: Optional[asyncio.Semaphore] = None
+        
+        # Conditional request cache: request key -> {etag, last_modified, body}
+        cache_file = github_config.get('response_cache_file', 'pada_github_cache.json')
+        self.response_cache_file = Path(cache_file) if cache_file else None
+        self.response_cache: Dict[str, Dict[str, Any]] = {}
+        self._response_cache_dirty = False
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._load_response_cache()
+        
+        # Adaptive, rate-limit-aware per-repository scheduling
+        self.scheduler = PollScheduler(github_config)
+        
+        # Webhook ingestion: repositories with webhooks are only swept occasionally
+        self.webhook_secret = github_config.get('webhook_secret')
+        self.reconciliation_interval = github_config.get('reconciliation_interval_seconds', 3600)
+        self.webhook_deliveries = 0
+        self.webhook_replays = 0
+        self._inflight_deliveries: set = set()
         
         # Initialize repositories from config
         self._load_repositories()
@@ -49,6 +137,10 @@ class GitHubMonitor:
         """Load repository list from config"""
         repo_configs = self.config.get('repositories', [])
         
+        # Triage rules are compiled once; only repositories with overrides get their own
+        default_rules = self.config.get('triage_rules') or {}
+        self.triage = TriageRules(default_rules)
+        
         for repo_config in repo_configs:
             repo = GitHubRepository(
                 owner=repo_config['owner'],
@@ -58,10 +150,18 @@ class GitHubMonitor:
                     'push', 'pull_request', 'issues', 'workflow_run', 'security_alert'
                 ]),
                 priority=repo_config.get('priority', 'MEDIUM'),
-                last_checked=datetime.utcnow() - timedelta(hours=1)
+                last_checked=datetime.utcnow() - timedelta(hours=1),
+                webhook=repo_config.get('webhook', False),
+                triage=TriageRules({**default_rules, **repo_config['triage_rules']})
+                if repo_config.get('triage_rules') else self.triage
             )
             self.repositories.append(repo)
-            self.last_poll_time[repo.full_name] = repo.last_checked
+            self.scheduler.register(
+                repo.full_name,
+                repo.priority,
+                len(repo.monitored_events),
+                interval=self.reconciliation_interval if repo.webhook else None
+            )
     
     async def start(self):
         """Start GitHub monitoring"""
@@ -73,12 +173,9 @@ class GitHubMonitor:
             headers['Authorization'] = f'Bearer {self.api_token}'
             headers['Accept'] = 'application/vnd.github.v3+json'
         
-        connector = aiohttp.TCPConnector(limit_per_host=5)
-        self.session = aiohttp.ClientSession(
-            headers=headers,
-            connector=connector,
-            timeout=aiohttp.ClientTimeout(total=30)
-        )
+        self._request_semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+        self.http.set_host_limit(urlsplit(self.base_url).hostname, self.max_requests_per_host)
+        self.session = self.http.session('github_monitor', headers=headers, timeout=30)
         
         self.is_running = True
         logger.info("GitHub monitor started")
@@ -92,100 +189,375 @@ class GitHubMonitor:
         if self.session:
             await self.session.close()
         
+        if self._owns_http:
+            await self.http.close()
+        
+        await self._save_response_cache()
+        await self.save_poll_state()
+        
         logger.info("GitHub monitor stopped")
     
     async def get_new_events(self) -> List[Event]:
-        """Get new events from all monitored repositories"""
+        """Get new events from the monitored repositories that are due
+        
+        The scheduler selects repositories by priority, recent activity and
+        remaining rate limit. They are polled concurrently; a failing
+        repository is logged and skipped without affecting the others.
+        
+        Returned events are not remembered as seen, and cursors do not move,
+        until they are passed to ``commit_events``.
+        """
         
         if not self.session:
             logger.warning("GitHub monitor not started")
             return []
         
         all_events = []
+        emitted = set()
+        self._pending_cursors = {}
         
-        for repo in self.repositories:
-            try:
-                repo_events = await self._get_repository_events(repo)
-                all_events.extend(repo_events)
-            except Exception as e:
-                logger.error(f"Error getting events for {repo.full_name}: {e}")
+        due = set(self.scheduler.due_repositories())
+        repositories = [repo for repo in self.repositories if repo.full_name in due]
         
-        logger.info(f"Retrieved {len(all_events)} new GitHub events")
+        if self.fetch_mode == 'graphql' and repositories:
+            results = await self._get_graphql_events(repositories)
+        else:
+            results = await asyncio.gather(
+                *(self._get_repository_events(repo) for repo in repositories),
+                return_exceptions=True
+            )
+        
+        for repo, result in zip(repositories, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error getting events for {repo.full_name}: {result}")
+                self.scheduler.record_poll(repo.full_name, 0)
+            else:
+                new_events = self._unseen(result, emitted)
+                all_events.extend(new_events)
+                self.scheduler.record_poll(repo.full_name, len(new_events))
+        
+        await self._save_response_cache()
+        
+        logger.info(f"Retrieved {len(all_events)} new GitHub events "
+                    f"(conditional cache: {self.cache_hits} hits, {self.cache_misses} misses; "
+                    f"{self.seen_events.duplicates_skipped} duplicates skipped)")
         return all_events
     
+    def _unseen(self, events: List[Event], emitted: Optional[set] = None) -> List[Event]:
+        """Drop events already processed or already emitted by this poll"""
+        
+        emitted = set() if emitted is None else emitted
+        new_events = []
+        
+        for event in events:
+            if event.id in self.seen_events or event.id in emitted:
+                self.seen_events.duplicates_skipped += 1
+                continue
+            emitted.add(event.id)
+            new_events.append(event)
+        
+        return new_events
+    
+    def commit_events(self, events: List[Event], complete: bool = True):
+        """Remember processed events and, if the whole poll was processed, advance its cursors
+        
+        After a partial batch the staged cursors are dropped: the next poll
+        reads the same windows again and the processed events are skipped
+        as seen, so only the unprocessed ones are emitted again.
+        """
+        
+        self._mark_seen(events)
+        
+        if complete and self._pending_cursors:
+            self.poll_cursors.update(self._pending_cursors)
+            self._poll_state_dirty = True
+        
+        self._pending_cursors = {}
+    
+    def _mark_seen(self, events: List[Event]):
+        for event in events:
+            self.seen_events.add(event.id)
+        
+        if events:
+            self._poll_state_dirty = True
+    
     async def _get_repository_events(self, repo: GitHubRepository) -> List[Event]:
-        """Get events for a specific repository"""
+        """Get events for a specific repository, fetching event types concurrently"""
         
         events = []
-        since_time = self.last_poll_time.get(repo.full_name, datetime.utcnow() - timedelta(hours=1))
+        
+        # Anything updated while this poll is in flight is picked up by the next one
+        poll_started = datetime.utcnow()
+        
+        fetchers = {
+            'push': self._get_push_events,
+            'pull_request': self._get_pr_events,
+            'issues': self._get_issue_events,
+            'workflow_run': self._get_workflow_events,
+            'security_alert': self._get_security_events
+        }
         
         # Get different types of events based on configuration
-        for event_type in repo.monitored_events:
-            try:
-                if event_type == 'push':
-                    events.extend(await self._get_push_events(repo, since_time))
-                elif event_type == 'pull_request':
-                    events.extend(await self._get_pr_events(repo, since_time))
-                elif event_type == 'issues':
-                    events.extend(await self._get_issue_events(repo, since_time))
-                elif event_type == 'workflow_run':
-                    events.extend(await self._get_workflow_events(repo, since_time))
-                elif event_type == 'security_alert':
-                    events.extend(await self._get_security_events(repo, since_time))
-            except Exception as e:
-                logger.error(f"Error getting {event_type} events for {repo.full_name}: {e}")
-        
-        # Update last poll time
-        self.last_poll_time[repo.full_name] = datetime.utcnow()
+        event_types = [event_type for event_type in repo.monitored_events if event_type in fetchers]
+        
+        results = await asyncio.gather(
+            *(self._limited(fetchers[event_type], repo, self._cursor(repo, event_type)) for event_type in event_types),
+            return_exceptions=True
+        )
+        
+        for event_type, result in zip(event_types, results):
+            if isinstance(result, Exception):
+                # Cursor stays put so the next poll retries the same window
+                logger.error(f"Error getting {event_type} events for {repo.full_name}: {result}")
+            else:
+                events.extend(result)
+                self._pending_cursors[f"{repo.full_name}:{event_type}"] = poll_started
         
         return events
     
+    def _cursor(self, repo: GitHubRepository, event_type: str) -> datetime:
+        """Time up to which an endpoint has been polled for a repository"""
+        return self.poll_cursors.get(f"{repo.full_name}:{event_type}", repo.last_checked)
+    
+    async def _limited(self, fetcher, repo: GitHubRepository, since: datetime) -> List[Event]:
+        """Run a fetcher under the global request semaphore"""
+        async with self._request_semaphore:
+            return await fetcher(repo, since)
+    
+    @staticmethod
+    def _parse_time(value: str) -> datetime:
+        """Parse a GitHub ISO 8601 timestamp"""
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    
+    @staticmethod
+    def _aware(value: datetime) -> datetime:
+        """Treat naive poll timestamps as UTC so they compare with GitHub's aware ones"""
+        return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
+    
+    async def _get_json(self, url: str, params: Optional[Dict[str, Any]] = None) -> Optional[Any]:
+        """GET a JSON resource using the conditional request cache"""
+        body, _ = await self._get_page(url, params)
+        return body
+    
+    async def _get_page(self, url: str, params: Optional[Dict[str, Any]] = None,
+                        conditional: bool = True) -> Tuple[Optional[Any], Optional[str]]:
+        """GET one page of a JSON resource and the URL of the next page
+        
+        With ``conditional`` set, sends If-None-Match / If-Modified-Since from
+        the cached entry. A 304 returns the cached, already-parsed body and
+        next link (and costs no rate-limit budget). Returns (None, None) for
+        ``SKIPPED_STATUSES`` and raises for any other non-200 response, so
+        the caller's poll cursor is not advanced past a window it never read.
+        """
+        
+        cache_key = url + '?' + '&'.join(f"{k}={v}" for k, v in sorted((params or {}).items()))
+        entry = self.response_cache.get(cache_key) if conditional else None
+        
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        
+        async with self.session.get(url, params=params, headers=headers) as response:
+            self.scheduler.update_rate_limit(response.headers, response.status)
+            
+            if response.status == 304 and entry:
+                self.cache_hits += 1
+                return entry['body'], entry.get('next')
+            
+            if response.status in SKIPPED_STATUSES:
+                logger.debug(f"GitHub API {url} returned {response.status}")
+                return None, None
+            
+            if response.status != 200:
+                raise RuntimeError(f"GitHub API {url} returned {response.status}")
+            
+            self.cache_misses += 1
+            body = await response.json()
+            
+            next_link = response.links.get('next')
+            next_url = str(next_link['url']) if next_link else None
+            
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+            
+            if conditional and (etag or last_modified):
+                self.response_cache[cache_key] = {
+                    'etag': etag,
+                    'last_modified': last_modified,
+                    'next': next_url,
+                    'body': body
+                }
+                self._response_cache_dirty = True
+            
+            return body, next_url
+    
+    async def _paginate(self, url: str, params: Dict[str, Any], since: datetime,
+                        timestamp: Callable[[Dict[str, Any]], str],
+                        items_key: Optional[str] = None) -> AsyncIterator[Dict[str, Any]]:
+        """Yield items from a newest-first listing, following Link rel=next lazily
+        
+        Stops at the first item whose ``timestamp`` is not after ``since``, so
+        later pages are only requested during bursts. Only the first page
+        uses the conditional request cache; deeper pages shift as new items
+        arrive and would rarely revalidate.
+        """
+        
+        since = self._aware(since)
+        page_url, page_params = url, params
+        
+        for page in range(self.max_pages_per_fetch):
+            body, next_url = await self._get_page(page_url, page_params, conditional=page == 0)
+            
+            items = (body or {}).get(items_key, []) if items_key else body or []
+            
+            for item in items:
+                if self._parse_time(timestamp(item)) <= since:
+                    return
+                yield item
+            
+            if not next_url:
+                return
+            
+            # The next link carries the query string already
+            page_url, page_params = next_url, None
+        
+        logger.warning(f"Stopped paging {url} after {self.max_pages_per_fetch} pages")
+    
+    def _load_response_cache(self):
+        """Load the persisted conditional request cache"""
+        
+        if not self.response_cache_file or not self.response_cache_file.exists():
+            return
+        
+        try:
+            with open(self.response_cache_file, 'r', encoding='utf-8') as f:
+                self.response_cache = json.load(f)
+            logger.info(f"Loaded {len(self.response_cache)} cached GitHub responses")
+        except Exception as e:
+            logger.warning(f"Could not load GitHub response cache: {e}")
+            self.response_cache = {}
+    
+    async def _save_response_cache(self):
+        """Persist the conditional request cache if it changed"""
+        
+        if not self.response_cache_file or not self._response_cache_dirty:
+            return
+        
+        self._response_cache_dirty = False
+        
+        try:
+            payload = json.dumps(self.response_cache)
+            await asyncio.to_thread(self._write_atomic, self.response_cache_file, payload)
+        except Exception as e:
+            logger.warning(f"Could not save GitHub response cache: {e}")
+    
+    def _load_poll_state(self):
+        """Load persisted poll cursors and the seen event index"""
+        
+        if not self.poll_state_file or not self.poll_state_file.exists():
+            return
+        
+        try:
+            with open(self.poll_state_file, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            self.poll_cursors = {
+                key: datetime.fromisoformat(value) for key, value in state.get('cursors', {}).items()
+            }
+            self.seen_events.load(state.get('seen_events', {}))
+            logger.info(f"Resuming from {len(self.poll_cursors)} persisted poll cursors")
+        except Exception as e:
+            logger.warning(f"Could not load GitHub poll state: {e}")
+            self.poll_cursors = {}
+    
+    async def save_poll_state(self):
+        """Persist poll cursors and the seen event index if they changed
+        
+        Call after ``commit_events``: a crash before this point replays the
+        poll on restart rather than losing its events.
+        """
+        
+        if not self.poll_state_file or not self._poll_state_dirty:
+            return
+        
+        self._poll_state_dirty = False
+        
+        try:
+            payload = json.dumps({
+                'cursors': {key: value.isoformat() for key, value in self.poll_cursors.items()},
+                'seen_events': self.seen_events.to_dict()
+            })
+            await asyncio.to_thread(self._write_atomic, self.poll_state_file, payload)
+        except Exception as e:
+            logger.warning(f"Could not save GitHub poll state: {e}")
+    
+    @staticmethod
+    def _write_atomic(path: Path, payload: str):
+        """Atomically replace a state file"""
+        
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = path.with_suffix('.tmp')
+        tmp_file.write_text(payload, encoding='utf-8')
+        tmp_file.replace(path)
+    
     async def _get_push_events(self, repo: GitHubRepository, since: datetime) -> List[Event]:
         """Get push events that might need attention"""
         events = []
         
-        # Get recent commits
+        # Get recent commits - no 'since' parameter so the URL stays stable for
+        # conditional requests; paging stops at the first commit committed
+        # before 'since'. Committer dates, unlike author dates, are reset by
+        # rebases and cherry-picks, so rewritten commits are not skipped.
         url = f"{self.base_url}/repos/{repo.full_name}/commits"
         params = {
-            'since': since.isoformat() + 'Z',
             'per_page': 10
         }
         
-        async with self.session.get(url, params=params) as response:
-            if response.status == 200:
-                commits = await response.json()
-                
-                for commit in commits:
-                    # Look for potentially problematic commits
-                    commit_msg = commit['commit']['message'].lower()
-                    
-                    is_important = any(keyword in commit_msg for keyword in [
-                        'fix', 'bug', 'error', 'crash', 'security', 'urgent', 'hotfix'
-                    ])
-                    
-                    if is_important:
-                        event = Event(
-                            id=f"push_{commit['sha'][:8]}",
-                            source="github",
-                            type="push_important",
-                            title=f"Important commit in {repo.name}",
-                            description=f"Commit: {commit['commit']['message'][:100]}",
-                            severity="IMPORTANT" if any(word in commit_msg for word in ['security', 'urgent', 'hotfix']) else "HELPFUL",
-                            timestamp=datetime.fromisoformat(commit['commit']['author']['date'].replace('Z', '+00:00')),
-                            data={
-                                'repository': repo.full_name,
-                                'commit_sha': commit['sha'],
-                                'commit_message': commit['commit']['message'],
-                                'author': commit['commit']['author']['name'],
-                                'url': commit['html_url']
-                            },
-                            requires_action=False,
-                            suggested_actions=[]
-                        )
-                        events.append(event)
+        async for commit in self._paginate(url, params, since, lambda c: c['commit']['committer']['date']):
+            event = self._build_push_event(
+                repo,
+                sha=commit['sha'],
+                message=commit['commit']['message'],
+                author=commit['commit']['author']['name'],
+                url=commit['html_url'],
+                committed_at=self._parse_time(commit['commit']['committer']['date'])
+            )
+            if event:
+                events.append(event)
         
         return events
     
+    def _build_push_event(self, repo: GitHubRepository, sha: str, message: str, author: str,
+                          url: str, committed_at: datetime) -> Optional[Event]:
+        """Build an event for a commit, or None if the commit is not worth attention"""
+        
+        # Look for potentially problematic commits
+        rule = repo.triage.commit.match(message)
+        
+        if not rule:
+            return None
+        
+        return Event(
+            id=f"push_{sha[:8]}",
+            source="github",
+            type="push_important",
+            title=f"Important commit in {repo.name}",
+            description=f"Commit: {message[:100]}",
+            severity=rule['severity'],
+            timestamp=committed_at,
+            data={
+                'repository': repo.full_name,
+                'commit_sha': sha,
+                'commit_message': message,
+                'author': author,
+                'url': url
+            },
+            requires_action=rule.get('requires_action', False),
+            suggested_actions=list(rule.get('suggested_actions', []))
+        )
+    
     async def _get_pr_events(self, repo: GitHubRepository, since: datetime) -> List[Event]:
         """Get pull request events requiring attention"""
         events = []
@@ -195,62 +567,58 @@ class GitHubMonitor:
         params = {
             'state': 'open',
             'sort': 'updated',
+            'direction': 'desc',
             'per_page': 20
         }
         
-        async with self.session.get(url, params=params) as response:
-            if response.status == 200:
-                prs = await response.json()
-                
-                for pr in prs:
-                    updated_at = datetime.fromisoformat(pr['updated_at'].replace('Z', '+00:00'))
-                    
-                    if updated_at > since:
-                        # Check if PR needs attention
-                        requires_action = False
-                        suggested_actions = []
-                        severity = "HELPFUL"
-                        
-                        # PR ready for merge
-                        if pr.get('mergeable') and not pr.get('draft'):
-                            # Check if it's a safe merge candidate
-                            pr_title = pr['title'].lower()
-                            if any(safe_word in pr_title for safe_word in [
-                                'typo', 'readme', 'docs', 'comment', 'test'
-                            ]):
-                                requires_action = True
-                                suggested_actions = ['merge_safe_pr']
-                                severity = "IMPORTANT"
-                        
-                        # PR has conflicts
-                        elif pr.get('mergeable') is False:
-                            severity = "IMPORTANT"
-                            suggested_actions = ['rebase_branch']
-                        
-                        event = Event(
-                            id=f"pr_{pr['number']}_{int(updated_at.timestamp())}",
-                            source="github",
-                            type="pull_request",
-                            title=f"PR #{pr['number']}: {pr['title']}",
-                            description=f"PR in {repo.name} updated: {pr['title'][:100]}",
-                            severity=severity,
-                            timestamp=updated_at,
-                            data={
-                                'repository': repo.full_name,
-                                'pr_number': pr['number'],
-                                'pr_title': pr['title'],
-                                'author': pr['user']['login'],
-                                'mergeable': pr.get('mergeable'),
-                                'draft': pr.get('draft'),
-                                'url': pr['html_url']
-                            },
-                            requires_action=requires_action,
-                            suggested_actions=suggested_actions
-                        )
-                        events.append(event)
+        async for pr in self._paginate(url, params, since, lambda p: p['updated_at']):
+            events.append(self._build_pr_event(repo, pr, self._parse_time(pr['updated_at'])))
         
         return events
     
+    def _build_pr_event(self, repo: GitHubRepository, pr: Dict[str, Any], updated_at: datetime) -> Event:
+        """Build an event for an updated pull request"""
+        
+        # Check if PR needs attention
+        requires_action = False
+        suggested_actions = []
+        severity = "HELPFUL"
+        
+        # PR ready for merge
+        if pr.get('mergeable') and not pr.get('draft'):
+            # Check if it's a safe merge candidate
+            rule = repo.triage.pull_request.match(pr['title'])
+            if rule:
+                requires_action = rule.get('requires_action', False)
+                suggested_actions = list(rule.get('suggested_actions', []))
+                severity = rule['severity']
+        
+        # PR has conflicts
+        elif pr.get('mergeable') is False:
+            severity = "IMPORTANT"
+            suggested_actions = ['rebase_branch']
+        
+        return Event(
+            id=f"pr_{pr['number']}_{int(updated_at.timestamp())}",
+            source="github",
+            type="pull_request",
+            title=f"PR #{pr['number']}: {pr['title']}",
+            description=f"PR in {repo.name} updated: {pr['title'][:100]}",
+            severity=severity,
+            timestamp=updated_at,
+            data={
+                'repository': repo.full_name,
+                'pr_number': pr['number'],
+                'pr_title': pr['title'],
+                'author': pr['user']['login'],
+                'mergeable': pr.get('mergeable'),
+                'draft': pr.get('draft'),
+                'url': pr['html_url']
+            },
+            requires_action=requires_action,
+            suggested_actions=suggested_actions
+        )
+    
     async def _get_workflow_events(self, repo: GitHubRepository, since: datetime) -> List[Event]:
         """Get GitHub Actions workflow failures"""
         events = []
@@ -262,38 +630,41 @@ class GitHubMonitor:
             'per_page': 10
         }
         
-        async with self.session.get(url, params=params) as response:
-            if response.status == 200:
-                runs = await response.json()
-                
-                for run in runs.get('workflow_runs', []):
-                    updated_at = datetime.fromisoformat(run['updated_at'].replace('Z', '+00:00'))
-                    
-                    if updated_at > since:
-                        # Workflow failure - always important
-                        event = Event(
-                            id=f"workflow_{run['id']}",
-                            source="github",
-                            type="workflow_failure",
-                            title=f"Workflow failed: {run['name']}",
-                            description=f"GitHub Actions workflow '{run['name']}' failed in {repo.name}",
-                            severity="CRITICAL",
-                            timestamp=updated_at,
-                            data={
-                                'repository': repo.full_name,
-                                'workflow_name': run['name'],
-                                'run_id': run['id'],
-                                'conclusion': run['conclusion'],
-                                'branch': run['head_branch'],
-                                'url': run['html_url']
-                            },
-                            requires_action=True,
-                            suggested_actions=['fix_linting', 'rebase_branch']
-                        )
-                        events.append(event)
+        # Runs are listed newest created first, so paging stops on created_at;
+        # the extra hour keeps runs that started before 'since' but failed after it
+        async for run in self._paginate(url, params, since - timedelta(hours=1), lambda r: r['created_at'],
+                                        items_key='workflow_runs'):
+            updated_at = self._parse_time(run['updated_at'])
+            
+            if updated_at > self._aware(since):
+                events.append(self._build_workflow_event(repo, run, updated_at))
         
         return events
     
+    def _build_workflow_event(self, repo: GitHubRepository, run: Dict[str, Any], updated_at: datetime) -> Event:
+        """Build an event for a failed workflow run"""
+        
+        # Workflow failure - always important
+        return Event(
+            id=f"workflow_{run['id']}",
+            source="github",
+            type="workflow_failure",
+            title=f"Workflow failed: {run['name']}",
+            description=f"GitHub Actions workflow '{run['name']}' failed in {repo.name}",
+            severity="CRITICAL",
+            timestamp=updated_at,
+            data={
+                'repository': repo.full_name,
+                'workflow_name': run['name'],
+                'run_id': run['id'],
+                'conclusion': run['conclusion'],
+                'branch': run['head_branch'],
+                'url': run['html_url']
+            },
+            requires_action=True,
+            suggested_actions=['fix_linting', 'rebase_branch']
+        )
+    
     async def _get_issue_events(self, repo: GitHubRepository, since: datetime) -> List[Event]:
         """Get important issue updates"""
         events = []
@@ -303,53 +674,47 @@ class GitHubMonitor:
         params = {
             'state': 'open',
             'sort': 'updated',
+            'direction': 'desc',
             'per_page': 10
         }
         
-        async with self.session.get(url, params=params) as response:
-            if response.status == 200:
-                issues = await response.json()
-                
-                for issue in issues:
-                    # Skip pull requests (GitHub API returns PRs as issues)
-                    if 'pull_request' in issue:
-                        continue
-                    
-                    updated_at = datetime.fromisoformat(issue['updated_at'].replace('Z', '+00:00'))
-                    
-                    if updated_at > since:
-                        # Check severity based on labels
-                        severity = "HELPFUL"
-                        labels = [label['name'].lower() for label in issue.get('labels', [])]
-                        
-                        if any(label in ['bug', 'critical', 'urgent', 'security'] for label in labels):
-                            severity = "CRITICAL"
-                        elif any(label in ['enhancement', 'feature'] for label in labels):
-                            severity = "IMPORTANT"
-                        
-                        event = Event(
-                            id=f"issue_{issue['number']}_{int(updated_at.timestamp())}",
-                            source="github",
-                            type="issue_update",
-                            title=f"Issue #{issue['number']}: {issue['title']}",
-                            description=f"Issue updated in {repo.name}: {issue['title'][:100]}",
-                            severity=severity,
-                            timestamp=updated_at,
-                            data={
-                                'repository': repo.full_name,
-                                'issue_number': issue['number'],
-                                'issue_title': issue['title'],
-                                'labels': labels,
-                                'author': issue['user']['login'],
-                                'url': issue['html_url']
-                            },
-                            requires_action=False,
-                            suggested_actions=[]
-                        )
-                        events.append(event)
+        async for issue in self._paginate(url, params, since, lambda i: i['updated_at']):
+            # Skip pull requests (GitHub API returns PRs as issues)
+            if 'pull_request' in issue:
+                continue
+            
+            events.append(self._build_issue_event(repo, issue, self._parse_time(issue['updated_at'])))
         
         return events
     
+    def _build_issue_event(self, repo: GitHubRepository, issue: Dict[str, Any], updated_at: datetime) -> Event:
+        """Build an event for an updated issue"""
+        
+        # Check severity based on labels
+        labels = [label['name'].lower() for label in issue.get('labels', [])]
+        rule = repo.triage.issue_labels.match(labels)
+        severity = rule['severity'] if rule else "HELPFUL"
+        
+        return Event(
+            id=f"issue_{issue['number']}_{int(updated_at.timestamp())}",
+            source="github",
+            type="issue_update",
+            title=f"Issue #{issue['number']}: {issue['title']}",
+            description=f"Issue updated in {repo.name}: {issue['title'][:100]}",
+            severity=severity,
+            timestamp=updated_at,
+            data={
+                'repository': repo.full_name,
+                'issue_number': issue['number'],
+                'issue_title': issue['title'],
+                'labels': labels,
+                'author': issue['user']['login'],
+                'url': issue['html_url']
+            },
+            requires_action=False,
+            suggested_actions=[]
+        )
+    
     async def _get_security_events(self, repo: GitHubRepository, since: datetime) -> List[Event]:
         """Get security alerts (requires appropriate GitHub permissions)"""
         events = []
@@ -359,24 +724,10 @@ class GitHubMonitor:
         
         try:
             async with self.session.get(url) as response:
+                self.scheduler.update_rate_limit(response.headers, response.status)
+                
                 if response.status == 200:
-                    # Security alerts are always critical
-                    event = Event(
-                        id=f"security_{repo.full_name}_{int(datetime.utcnow().timestamp())}",
-                        source="github",
-                        type="security_alert",
-                        title=f"Security alerts in {repo.name}",
-                        description=f"Dependabot security alerts detected in {repo.name}",
-                        severity="CRITICAL",
-                        timestamp=datetime.utcnow(),
-                        data={
-                            'repository': repo.full_name,
-                            'url': f"https://github.com/{repo.full_name}/security"
-                        },
-                        requires_action=True,
-                        suggested_actions=['update_dependencies']
-                    )
-                    events.append(event)
+                    events.append(self._build_security_event(repo))
                 elif response.status != 404:  # 404 means no alerts
                     logger.warning(f"Could not access security alerts for {repo.full_name}: {response.status}")
         except Exception as e:
@@ -384,6 +735,336 @@ class GitHubMonitor:
         
         return events
     
+    def _build_security_event(self, repo: GitHubRepository) -> Event:
+        """Build an event for open security alerts on a repository"""
+        
+        # Security alerts are always critical
+        return Event(
+            id=f"security_{repo.full_name}_{int(datetime.utcnow().timestamp())}",
+            source="github",
+            type="security_alert",
+            title=f"Security alerts in {repo.name}",
+            description=f"Dependabot security alerts detected in {repo.name}",
+            severity="CRITICAL",
+            timestamp=datetime.utcnow(),
+            data={
+                'repository': repo.full_name,
+                'url': f"https://github.com/{repo.full_name}/security"
+            },
+            requires_action=True,
+            suggested_actions=['update_dependencies']
+        )
+    
+    async def _get_graphql_events(self, repositories: List[GitHubRepository]) -> List[Any]:
+        """Poll repositories in batches of aliased GraphQL queries
+        
+        Returns one entry per repository, aligned with ``repositories``:
+        its events, or the exception that failed its batch.
+        """
+        
+        batches = [
+            repositories[start:start + self.graphql_batch_size]
+            for start in range(0, len(repositories), self.graphql_batch_size)
+        ]
+        
+        batch_results = await asyncio.gather(
+            *(self._get_graphql_batch(batch) for batch in batches),
+            return_exceptions=True
+        )
+        
+        results = []
+        for batch, batch_result in zip(batches, batch_results):
+            for repo in batch:
+                if isinstance(batch_result, Exception):
+                    results.append(batch_result)
+                else:
+                    results.append(batch_result[repo.full_name])
+        
+        return results
+    
+    async def _get_graphql_batch(self, batch: List[GitHubRepository]) -> Dict[str, List[Event]]:
+        """Fetch every monitored event type for a batch of repositories in one query"""
+        
+        poll_started = datetime.utcnow()
+        query, variables = self._build_graphql_query(batch)
+        
+        async with self._request_semaphore:
+            # Read-only query, so safe to retry despite being a POST
+            async with self.session.post(self.graphql_url, json={'query': query, 'variables': variables},
+                                         retry=True) as response:
+                self.scheduler.update_rate_limit(response.headers, response.status)
+                
+                if response.status != 200:
+                    raise RuntimeError(f"GitHub GraphQL request failed: {response.status}")
+                
+                body = await response.json()
+        
+        # Errors can be partial (e.g. no permission for vulnerability alerts);
+        # the affected fields come back null and are skipped below
+        for error in body.get('errors') or []:
+            logger.warning(f"GitHub GraphQL error: {error.get('message')}")
+        
+        data = body.get('data') or {}
+        results = {}
+        
+        for index, repo in enumerate(batch):
+            node = data.get(f"r{index}")
+            
+            if node is None:
+                logger.error(f"GitHub GraphQL returned no data for {repo.full_name}")
+                results[repo.full_name] = []
+                continue
+            
+            events = []
+            for event_type, section_events in self._map_graphql_repository(repo, node).items():
+                events.extend(section_events)
+                self._pending_cursors[f"{repo.full_name}:{event_type}"] = poll_started
+            
+            results[repo.full_name] = events
+        
+        return results
+    
+    def _build_graphql_query(self, batch: List[GitHubRepository]) -> Tuple[str, Dict[str, Any]]:
+        """Build one aliased query (r0, r1, ...) selecting only each repository's monitored types"""
+        
+        declarations = []
+        selections = []
+        variables = {}
+        page_size = self.graphql_page_size
+        
+        for index, repo in enumerate(batch):
+            declarations += [f"$owner{index}: String!", f"$name{index}: String!"]
+            variables[f"owner{index}"] = repo.owner
+            variables[f"name{index}"] = repo.name
+            fields = []
+            
+            if 'push' in repo.monitored_events:
+                declarations.append(f"$commitsSince{index}: GitTimestamp!")
+                variables[f"commitsSince{index}"] = self._aware(self._cursor(repo, 'push')).isoformat()
+                fields.append(
+                    f"commits: defaultBranchRef {{ target {{ ... on Commit {{ "
+                    f"history(first: {page_size}, since: $commitsSince{index}) {{ nodes {{ "
+                    f"oid message committedDate url author {{ name }} }} }} }} }} }}"
+                )
+            
+            if 'workflow_run' in repo.monitored_events:
+                fields.append(
+                    f"runs: defaultBranchRef {{ name target {{ ... on Commit {{ "
+                    f"history(first: 10) {{ nodes {{ checkSuites(first: 10) {{ nodes {{ "
+                    f"conclusion updatedAt workflowRun {{ databaseId url workflow {{ name }} }} }} }} }} }} }} }} }}"
+                )
+            
+            if 'pull_request' in repo.monitored_events:
+                fields.append(
+                    f"pullRequests(states: OPEN, first: {page_size}, orderBy: {{field: UPDATED_AT, direction: DESC}}) {{ "
+                    f"nodes {{ number title updatedAt isDraft mergeable url author {{ login }} }} }}"
+                )
+            
+            if 'issues' in repo.monitored_events:
+                declarations.append(f"$issuesSince{index}: DateTime!")
+                variables[f"issuesSince{index}"] = self._aware(self._cursor(repo, 'issues')).isoformat()
+                fields.append(
+                    f"issues(states: OPEN, first: {page_size}, orderBy: {{field: UPDATED_AT, direction: DESC}}, "
+                    f"filterBy: {{since: $issuesSince{index}}}) {{ "
+                    f"nodes {{ number title updatedAt url author {{ login }} labels(first: 20) {{ nodes {{ name }} }} }} }}"
+                )
+            
+            if 'security_alert' in repo.monitored_events:
+                fields.append("vulnerabilityAlerts(states: OPEN, first: 1) { totalCount }")
+            
+            selections.append(f"r{index}: repository(owner: $owner{index}, name: $name{index}) {{ {' '.join(fields)} }}")
+        
+        query = f"query({', '.join(declarations)}) {{ {' '.join(selections)} }}"
+        return query, variables
+    
+    def _map_graphql_repository(self, repo: GitHubRepository, node: Dict[str, Any]) -> Dict[str, List[Event]]:
+        """Map one repository's GraphQL result to events per monitored type
+        
+        Nodes are reshaped into the REST fields the event builders read.
+        Types whose field came back null are left out so their cursors stay put.
+        """
+        
+        results = {}
+        
+        commits = node.get('commits')
+        if 'push' in repo.monitored_events and commits and commits.get('target'):
+            since = self._aware(self._cursor(repo, 'push'))
+            events = []
+            for commit in commits['target']['history']['nodes']:
+                committed_at = self._parse_time(commit['committedDate'])
+                if committed_at <= since:
+                    continue
+                event = self._build_push_event(
+                    repo,
+                    sha=commit['oid'],
+                    message=commit['message'],
+                    author=(commit.get('author') or {}).get('name'),
+                    url=commit['url'],
+                    committed_at=committed_at
+                )
+                if event:
+                    events.append(event)
+            results['push'] = events
+        
+        runs = node.get('runs')
+        if 'workflow_run' in repo.monitored_events and runs and runs.get('target'):
+            since = self._aware(self._cursor(repo, 'workflow_run'))
+            events = {}
+            for commit in runs['target']['history']['nodes']:
+                for suite in commit['checkSuites']['nodes']:
+                    workflow_run = suite.get('workflowRun')
+                    if suite.get('conclusion') != 'FAILURE' or not workflow_run:
+                        continue
+                    updated_at = self._parse_time(suite['updatedAt'])
+                    if updated_at <= since:
+                        continue
+                    run = {
+                        'id': workflow_run['databaseId'],
+                        'name': workflow_run['workflow']['name'],
+                        'conclusion': 'failure',
+                        'head_branch': runs['name'],
+                        'html_url': workflow_run['url']
+                    }
+                    events[run['id']] = self._build_workflow_event(repo, run, updated_at)
+            results['workflow_run'] = list(events.values())
+        
+        pull_requests = node.get('pullRequests')
+        if 'pull_request' in repo.monitored_events and pull_requests:
+            since = self._aware(self._cursor(repo, 'pull_request'))
+            events = []
+            for pr in pull_requests['nodes']:
+                updated_at = self._parse_time(pr['updatedAt'])
+                if updated_at <= since:
+                    break
+                pr_fields = {
+                    'number': pr['number'],
+                    'title': pr['title'],
+                    'user': {'login': (pr.get('author') or {}).get('login', 'ghost')},
+                    'mergeable': GRAPHQL_MERGEABLE.get(pr['mergeable']),
+                    'draft': pr['isDraft'],
+                    'html_url': pr['url']
+                }
+                events.append(self._build_pr_event(repo, pr_fields, updated_at))
+            results['pull_request'] = events
+        
+        issues = node.get('issues')
+        if 'issues' in repo.monitored_events and issues:
+            events = []
+            for issue in issues['nodes']:
+                issue_fields = {
+                    'number': issue['number'],
+                    'title': issue['title'],
+                    'labels': issue['labels']['nodes'],
+                    'user': {'login': (issue.get('author') or {}).get('login', 'ghost')},
+                    'html_url': issue['url'],
+                    'updated_at': issue['updatedAt']
+                }
+                events.append(self._build_issue_event(repo, issue_fields, self._parse_time(issue['updatedAt'])))
+            results['issues'] = events
+        
+        alerts = node.get('vulnerabilityAlerts')
+        if 'security_alert' in repo.monitored_events and alerts is not None:
+            results['security_alert'] = [self._build_security_event(repo)] if alerts['totalCount'] else []
+        
+        return results
+    
+    def verify_webhook(self, body: bytes, signature: Optional[str]) -> bool:
+        """Verify a webhook delivery against the configured secret"""
+        return verify_webhook_signature(self.webhook_secret, body, signature)
+    
+    def handle_webhook(self, event_name: str, payload: Dict[str, Any], delivery_id: Optional[str] = None) -> List[Event]:
+        """Map a verified webhook delivery to events using the polling event builders
+        
+        Deliveries for unmonitored repositories or event types, and actions
+        polling would not report (closed PRs and issues, successful runs),
+        produce no events. A replayed ``delivery_id`` (X-GitHub-Delivery) is
+        ignored. Returned events are not marked seen: call ``commit_webhook``
+        once they have been processed.
+        """
+        
+        if delivery_id:
+            if f"delivery_{delivery_id}" in self.seen_events or delivery_id in self._inflight_deliveries:
+                self.webhook_replays += 1
+                logger.warning(f"Ignoring replayed GitHub webhook delivery {delivery_id}")
+                return []
+        
+        events = self._webhook_events(event_name, payload)
+        
+        if delivery_id:
+            if events:
+                self._inflight_deliveries.add(delivery_id)
+            else:
+                # Nothing to process, so nothing a redelivery could recover
+                self._record_delivery(delivery_id)
+        
+        return events
+    
+    def commit_webhook(self, delivery_id: Optional[str], events: List[Event], complete: bool = True):
+        """Mark processed webhook events seen; remember the delivery once all were processed
+        
+        Polling cursors are left alone since a poll may be in flight. After a
+        partial batch the delivery is forgotten, so a redelivery of the same
+        GUID re-emits only the unprocessed events.
+        """
+        
+        self._mark_seen(events)
+        
+        if delivery_id:
+            self._inflight_deliveries.discard(delivery_id)
+            if complete:
+                self._record_delivery(delivery_id)
+    
+    def _record_delivery(self, delivery_id: str):
+        self.seen_events.add(f"delivery_{delivery_id}")
+        self._poll_state_dirty = True
+    
+    def _webhook_events(self, event_name: str, payload: Dict[str, Any]) -> List[Event]:
+        """Build the unseen events a webhook delivery maps to"""
+        
+        full_name = (payload.get('repository') or {}).get('full_name')
+        repo = next((r for r in self.repositories if r.full_name == full_name), None)
+        event_type = WEBHOOK_EVENT_TYPES.get(event_name)
+        
+        if not repo or event_type not in repo.monitored_events:
+            logger.debug(f"Ignoring {event_name} webhook for {full_name}")
+            return []
+        
+        self.webhook_deliveries += 1
+        events = []
+        
+        if event_name == 'push':
+            for commit in payload.get('commits', []):
+                event = self._build_push_event(
+                    repo,
+                    sha=commit['id'],
+                    message=commit['message'],
+                    author=commit['author']['name'],
+                    url=commit['url'],
+                    committed_at=self._parse_time(commit['timestamp'])
+                )
+                if event:
+                    events.append(event)
+        
+        elif event_name == 'pull_request':
+            pr = payload['pull_request']
+            if pr['state'] == 'open':
+                events.append(self._build_pr_event(repo, pr, self._parse_time(pr['updated_at'])))
+        
+        elif event_name == 'issues':
+            issue = payload['issue']
+            if issue['state'] == 'open':
+                events.append(self._build_issue_event(repo, issue, self._parse_time(issue['updated_at'])))
+        
+        elif event_name == 'workflow_run':
+            run = payload['workflow_run']
+            if payload.get('action') == 'completed' and run.get('conclusion') == 'failure':
+                events.append(self._build_workflow_event(repo, run, self._parse_time(run['updated_at'])))
+        
+        elif payload.get('action') in ('create', 'created', 'reopened'):
+            events.append(self._build_security_event(repo))
+        
+        return self._unseen(events)
+    
     async def health_check(self) -> bool:
         """Check GitHub monitor health"""
         
@@ -394,6 +1075,8 @@ class GitHubMonitor:
             # Test API connectivity
             url = f"{self.base_url}/rate_limit"
             async with self.session.get(url) as response:
+                self.scheduler.update_rate_limit(response.headers, response.status)
+                
                 if response.status == 200:
                     rate_limit_data = await response.json()
                     remaining = rate_limit_data['rate']['remaining']
@@ -408,6 +1091,10 @@ class GitHubMonitor:
         except Exception as e:
             logger.error(f"GitHub monitor health check failed: {e}")
             return False
+    
+    def next_poll_delay(self, default: float) -> float:
+        """Seconds until the next repository is due for polling, at most ``default``"""
+        return self.scheduler.next_poll_delay(default)
 
 # Example configuration for testing
 async def test_github_monitor():
@@ -455,6 +1142,52 @@ async def test_github_monitor():
         print(f"❌ Test failed: {e}")
         await monitor.stop()
 
+def test_webhook_verification():
+    """Test webhook signature checks and delivery replay protection"""
+    
+    print("🔐 Testing PADA GitHub Webhook Verification")
+    print("=" * 50)
+    
+    secret = 'test-webhook-secret'
+    monitor = GitHubMonitor({
+        'webhook_secret': secret,
+        'poll_state_file': None,
+        'response_cache_file': None,
+        'repositories': [
+            {'owner': 'omar', 'name': 'pada', 'events': ['security_alert'], 'webhook': True}
+        ]
+    })
+    
+    payload = {'action': 'created', 'repository': {'full_name': 'omar/pada'}, 'alert': {'number': 1}}
+    body = json.dumps(payload).encode('utf-8')
+    signature = 'sha256=' + hmac.new(secret.encode('utf-8'), body, hashlib.sha256).hexdigest()
+    
+    checks = {
+        'valid signature accepted': monitor.verify_webhook(body, signature),
+        'tampered body rejected': not monitor.verify_webhook(body.replace(b'created', b'dismissed'), signature),
+        'missing header rejected': not monitor.verify_webhook(body, None),
+        'malformed header rejected': not monitor.verify_webhook(body, 'sha256=\u00e9'),
+        'wrong secret rejected': not verify_webhook_signature('other-secret', body, signature)
+    }
+    
+    # A delivery whose processing failed can be redelivered under the same GUID
+    failed = monitor.handle_webhook('dependabot_alert', payload, delivery_id='delivery-1')
+    monitor.commit_webhook('delivery-1', [], complete=False)
+    redelivered = monitor.handle_webhook('dependabot_alert', payload, delivery_id='delivery-1')
+    checks['first delivery produces an event'] = len(failed) == 1
+    checks['failed delivery can be redelivered'] = len(redelivered) == 1 and monitor.webhook_replays == 0
+    
+    monitor.commit_webhook('delivery-1', redelivered)
+    replayed = monitor.handle_webhook('dependabot_alert', payload, delivery_id='delivery-1')
+    checks['replayed delivery ignored'] = replayed == [] and monitor.webhook_replays == 1
+    checks['processed event marked seen'] = monitor._unseen(redelivered) == []
+    
+    for name, passed in checks.items():
+        print(f"   {'✅' if passed else '❌'} {name}")
+    
+    return all(checks.values())
+
 if __name__ == "__main__":
     import asyncio
+    test_webhook_verification()
     asyncio.run(test_github_monitor())
\ No newline at end of file
@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+"""
+PADA GitHub Stand-in - Local GitHub REST API server for load testing
+Serves recorded or synthetic repository activity at configurable volume and latency
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import random
+import re
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Any
+
+from aiohttp import web
+
+logger = logging.getLogger(__name__)
+
+# Listing endpoints GitHubMonitor polls, relative to /repos/{owner}/{name}/
+LISTING_ENDPOINTS = ['commits', 'pulls', 'issues', 'actions/runs']
+
+# One aliased repository selection of GitHubMonitor's batched GraphQL query
+GRAPHQL_REPOSITORY = re.compile(r'(r\d+): repository\(owner: \$(\w+), name: \$(\w+)\)')
+
+# REST mergeable flag -> GraphQL MergeableState
+GRAPHQL_MERGEABLE = {True: 'MERGEABLE', False: 'CONFLICTING', None: 'UNKNOWN'}
+
+class GitHubStandIn:
+    """Local aiohttp server answering the GitHub endpoints GitHubMonitor uses
+    
+    Every listing endpoint of every repository gains ``items_per_second``
+    synthetic items, served newest first with ``Link: rel=next`` paging
+    and ETags. A ``fixtures_dir`` containing recorded responses (for
+    example ``commits.json`` or ``actions_runs.json``) overrides the
+    synthetic data for that endpoint. ``POST /graphql`` answers the
+    aliased batch queries of ``fetch_mode: graphql`` from the same items.
+    """
+    
+    def __init__(self, repositories: List[str], items_per_second: float = 1.0,
+                 latency_ms: float = 0.0, latency_jitter_ms: float = 0.0,
+                 important_ratio: float = 0.5, fixtures_dir: Optional[str] = None,
+                 host: str = '127.0.0.1', port: int = 0):
+        self.repositories = set(repositories)
+        self.items_per_second = items_per_second
+        self.latency_ms = latency_ms
+        self.latency_jitter_ms = latency_jitter_ms
+        self.important_ratio = important_ratio
+        self.fixtures = self._load_fixtures(Path(fixtures_dir)) if fixtures_dir else {}
+        self.host = host
+        self.port = port
+        
+        self.started_at = time.time()
+        self.runner: Optional[web.AppRunner] = None
+        self.base_url: Optional[str] = None
+        
+        self.requests = defaultdict(int)
+        self.not_modified = 0
+        self.bytes_sent = 0
+    
+    def _load_fixtures(self, fixtures_dir: Path) -> Dict[str, Any]:
+        fixtures = {}
+        for endpoint in LISTING_ENDPOINTS:
+            fixture_file = fixtures_dir / f"{endpoint.replace('/', '_')}.json"
+            if fixture_file.exists():
+                fixtures[endpoint] = json.loads(fixture_file.read_text(encoding='utf-8'))
+        logger.info(f"Loaded {len(fixtures)} recorded GitHub fixtures")
+        return fixtures
+    
+    async def start(self) -> str:
+        """Start serving; returns the base URL to use as ``github.api_url``"""
+        
+        app = web.Application()
+        app.router.add_get('/rate_limit', self._rate_limit)
+        app.router.add_post('/graphql', self._graphql)
+        app.router.add_get('/repos/{owner}/{name}/{endpoint:.+}', self._repository_endpoint)
+        
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, self.host, self.port)
+        await site.start()
+        
+        port = self.runner.addresses[0][1]
+        self.base_url = f"http://{self.host}:{port}"
+        self.started_at = time.time()
+        
+        logger.info(f"GitHub stand-in serving {len(self.repositories)} repositories at {self.base_url}")
+        return self.base_url
+    
+    async def stop(self):
+        if self.runner:
+            await self.runner.cleanup()
+    
+    def _headers(self) -> Dict[str, str]:
+        # Effectively unlimited, so the poll scheduler never throttles a benchmark
+        return {
+            'X-RateLimit-Limit': '1000000',
+            'X-RateLimit-Remaining': '1000000',
+            'X-RateLimit-Reset': str(int(time.time()) + 3600)
+        }
+    
+    async def _simulate_latency(self):
+        if self.latency_ms or self.latency_jitter_ms:
+            delay = random.gauss(self.latency_ms, self.latency_jitter_ms) / 1000
+            await asyncio.sleep(max(0.0, delay))
+    
+    async def _rate_limit(self, request: web.Request) -> web.Response:
+        self.requests['rate_limit'] += 1
+        body = {'rate': {'limit': 1000000, 'remaining': 1000000, 'reset': int(time.time()) + 3600}}
+        return web.json_response(body, headers=self._headers())
+    
+    async def _repository_endpoint(self, request: web.Request) -> web.Response:
+        full_name = f"{request.match_info['owner']}/{request.match_info['name']}"
+        endpoint = request.match_info['endpoint']
+        self.requests[endpoint] += 1
+        
+        await self._simulate_latency()
+        
+        if full_name not in self.repositories or endpoint not in LISTING_ENDPOINTS:
+            # Includes vulnerability-alerts: 404 means no alerts
+            return web.json_response({'message': 'Not Found'}, status=404, headers=self._headers())
+        
+        per_page = int(request.query.get('per_page', 30))
+        page = int(request.query.get('page', 1))
+        headers = self._headers()
+        
+        if endpoint in self.fixtures:
+            items, has_next = self.fixtures[endpoint], False
+            etag = f'"fixture-{endpoint}"'
+        else:
+            total = int((time.time() - self.started_at) * self.items_per_second)
+            newest = total - 1 - (page - 1) * per_page
+            indices = range(newest, max(newest - per_page, -1), -1)
+            has_next = newest - per_page >= 0
+            etag = f'"{endpoint}-{total}-{page}-{per_page}"'
+            
+            if request.headers.get('If-None-Match') == etag:
+                self.not_modified += 1
+                return web.Response(status=304, headers=headers)
+            
+            items = [self._synthetic_item(full_name, endpoint, index) for index in indices]
+        
+        if has_next:
+            query = dict(request.query, page=str(page + 1))
+            headers['Link'] = f'<{request.url.with_query(query)}>; rel="next"'
+        headers['ETag'] = etag
+        
+        body = {'total_count': len(items), 'workflow_runs': items} if endpoint == 'actions/runs' else items
+        payload = json.dumps(body)
+        self.bytes_sent += len(payload)
+        
+        return web.Response(text=payload, content_type='application/json', headers=headers)
+    
+    def _newest_items(self, full_name: str, endpoint: str, count: int) -> List[Dict[str, Any]]:
+        """The newest ``count`` items of an endpoint, from its fixture when there is one"""
+        
+        if endpoint in self.fixtures:
+            return self.fixtures[endpoint][:count]
+        
+        total = int((time.time() - self.started_at) * self.items_per_second)
+        return [self._synthetic_item(full_name, endpoint, index) for index in range(total - 1, max(total - 1 - count, -1), -1)]
+    
+    async def _graphql(self, request: web.Request) -> web.Response:
+        """Answer a batched repository query by matching its aliases, not by parsing GraphQL
+        
+        Each ``rN: repository(...)`` selection gets the sections it names
+        (commits, runs, pullRequests, issues, vulnerabilityAlerts) built
+        from the REST items reshaped into GraphQL nodes.
+        """
+        
+        self.requests['graphql'] += 1
+        await self._simulate_latency()
+        
+        body = await request.json()
+        query = body['query']
+        variables = body.get('variables') or {}
+        
+        matches = list(GRAPHQL_REPOSITORY.finditer(query))
+        data = {}
+        errors = []
+        
+        for position, match in enumerate(matches):
+            alias, owner_variable, name_variable = match.groups()
+            index = alias[1:]
+            selection = query[match.end():matches[position + 1].start() if position + 1 < len(matches) else len(query)]
+            full_name = f"{variables.get(owner_variable)}/{variables.get(name_variable)}"
+            
+            if full_name not in self.repositories:
+                data[alias] = None
+                errors.append({'message': f"Could not resolve to a Repository with the name '{full_name}'."})
+                continue
+            
+            data[alias] = self._graphql_repository(full_name, selection, variables, index)
+        
+        payload = json.dumps({'data': data, 'errors': errors} if errors else {'data': data})
+        self.bytes_sent += len(payload)
+        
+        return web.Response(text=payload, content_type='application/json', headers=self._headers())
+    
+    def _graphql_repository(self, full_name: str, selection: str, variables: Dict[str, Any], index: str) -> Dict[str, Any]:
+        """GraphQL node for one repository with only the selected sections"""
+        
+        page_size = int(re.search(r'first: (\d+)', selection).group(1)) if 'first:' in selection else 25
+        node = {}
+        
+        def since(variable: str) -> Optional[datetime]:
+            value = variables.get(f"{variable}{index}")
+            return datetime.fromisoformat(value.replace('Z', '+00:00')) if value else None
+        
+        def updated_after(item: Dict[str, Any], field: str, cutoff: Optional[datetime]) -> bool:
+            return cutoff is None or datetime.fromisoformat(item[field].replace('Z', '+00:00')) >= cutoff
+        
+        if 'commits:' in selection:
+            cutoff = since('commitsSince')
+            commits = [
+                commit for commit in self._newest_items(full_name, 'commits', page_size)
+                if updated_after(commit['commit']['committer'], 'date', cutoff)
+            ]
+            node['commits'] = {'target': {'history': {'nodes': [
+                {
+                    'oid': commit['sha'],
+                    'message': commit['commit']['message'],
+                    'committedDate': commit['commit']['committer']['date'],
+                    'url': commit['html_url'],
+                    'author': {'name': commit['commit']['author']['name']}
+                }
+                for commit in commits
+            ]}}}
+        
+        if 'runs:' in selection:
+            runs = self._newest_items(full_name, 'actions/runs', 10)
+            node['runs'] = {'name': 'main', 'target': {'history': {'nodes': [
+                {'checkSuites': {'nodes': [{
+                    'conclusion': (run.get('conclusion') or '').upper(),
+                    'updatedAt': run['updated_at'],
+                    'workflowRun': {'databaseId': run['id'], 'url': run['html_url'], 'workflow': {'name': run['name']}}
+                }]}}
+                for run in runs
+            ]}}}
+        
+        if 'pullRequests(' in selection:
+            node['pullRequests'] = {'nodes': [
+                {
+                    'number': pr['number'],
+                    'title': pr['title'],
+                    'updatedAt': pr['updated_at'],
+                    'isDraft': pr.get('draft', False),
+                    'mergeable': GRAPHQL_MERGEABLE.get(pr.get('mergeable')),
+                    'url': pr['html_url'],
+                    'author': {'login': pr['user']['login']}
+                }
+                for pr in self._newest_items(full_name, 'pulls', page_size)
+            ]}
+        
+        if 'issues(' in selection:
+            cutoff = since('issuesSince')
+            node['issues'] = {'nodes': [
+                {
+                    'number': issue['number'],
+                    'title': issue['title'],
+                    'updatedAt': issue['updated_at'],
+                    'url': issue['html_url'],
+                    'author': {'login': issue['user']['login']},
+                    'labels': {'nodes': [{'name': label['name']} for label in issue['labels']]}
+                }
+                for issue in self._newest_items(full_name, 'issues', page_size)
+                if updated_after(issue, 'updated_at', cutoff)
+            ]}
+        
+        if 'vulnerabilityAlerts(' in selection:
+            node['vulnerabilityAlerts'] = {'totalCount': 0}
+        
+        return node
+    
+    def _synthetic_item(self, full_name: str, endpoint: str, index: int) -> Dict[str, Any]:
+        """Deterministic item ``index`` of an endpoint, created at started_at + index / rate"""
+        
+        created = datetime.fromtimestamp(self.started_at + index / self.items_per_second, timezone.utc)
+        timestamp = created.isoformat().replace('+00:00', 'Z')
+        important = (index % 100) < self.important_ratio * 100
+        url = f"https://github.com/{full_name}"
+        
+        if endpoint == 'commits':
+            sha = hashlib.sha1(f"{full_name}-{index}".encode()).hexdigest()
+            return {
+                'sha': sha,
+                'html_url': f"{url}/commit/{sha}",
+                'commit': {
+                    'message': f"Fix crash in handler {index}" if important else f"Refactor module {index}",
+                    'author': {'name': 'benchmark', 'date': timestamp},
+                    'committer': {'name': 'benchmark', 'date': timestamp}
+                }
+            }
+        
+        if endpoint == 'pulls':
+            return {
+                'number': index + 1,
+                'title': f"Docs: fix typo {index}" if important else f"Feature {index}",
+                'updated_at': timestamp,
+                'mergeable': True if important else None,
+                'draft': False,
+                'user': {'login': 'benchmark'},
+                'html_url': f"{url}/pull/{index + 1}"
+            }
+        
+        if endpoint == 'issues':
+            labels = [['bug'], ['enhancement'], []][index % 3]
+            return {
+                'number': index + 1,
+                'title': f"Issue {index}",
+                'updated_at': timestamp,
+                'labels': [{'name': label} for label in labels],
+                'user': {'login': 'benchmark'},
+                'html_url': f"{url}/issues/{index + 1}"
+            }
+        
+        return {
+            'id': index + 1,
+            'name': 'CI',
+            'conclusion': 'failure',
+            'head_branch': 'main',
+            'created_at': timestamp,
+            'updated_at': timestamp,
+            'html_url': f"{url}/actions/runs/{index + 1}"
+        }
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        return {
+            'requests': dict(self.requests),
+            'not_modified': self.not_modified,
+            'bytes_sent': self.bytes_sent
+        }
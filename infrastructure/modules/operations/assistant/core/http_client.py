@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+PADA HTTP Client - Shared, pooled HTTP sessions for all PADA components
+One connector (keep-alive, DNS cache) behind every session, with retries and latency histograms
+"""
+
+import asyncio
+import bisect
+import logging
+import random
+import time
+from typing import Dict, List, Optional, Any
+from urllib.parse import urlsplit
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (ms) of the latency histogram buckets; the last bucket is open-ended
+LATENCY_BUCKETS_MS = [10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000]
+
+# Methods retried by default. PUT and DELETE are left out although idempotent in
+# principle: GitHub mutations such as a merge PUT fail when repeated after a
+# first attempt that succeeded but whose response was lost.
+RETRIED_METHODS = {'GET', 'HEAD', 'OPTIONS'}
+
+class LatencyHistogram:
+    """Fixed-bucket request latency histogram"""
+    
+    def __init__(self, buckets_ms: Optional[List[float]] = None):
+        self.buckets_ms = buckets_ms or LATENCY_BUCKETS_MS
+        self.counts = [0] * (len(self.buckets_ms) + 1)
+        self.total = 0
+        self.sum_ms = 0.0
+        self.errors = 0
+    
+    def observe(self, elapsed_ms: float):
+        self.counts[bisect.bisect_left(self.buckets_ms, elapsed_ms)] += 1
+        self.total += 1
+        self.sum_ms += elapsed_ms
+    
+    def quantile(self, q: float) -> Optional[float]:
+        """Upper bound of the bucket holding the q-th quantile"""
+        
+        if not self.total:
+            return None
+        
+        rank = q * self.total
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return self.buckets_ms[index] if index < len(self.buckets_ms) else float('inf')
+        return float('inf')
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'count': self.total,
+            'errors': self.errors,
+            'mean_ms': round(self.sum_ms / self.total, 1) if self.total else None,
+            'p50_ms': self.quantile(0.5),
+            'p95_ms': self.quantile(0.95),
+            'buckets': dict(zip([str(b) for b in self.buckets_ms] + ['+Inf'], self.counts))
+        }
+    
+    def prometheus_lines(self, name: str, labels: Optional[Dict[str, str]] = None) -> List[str]:
+        """Render as a Prometheus histogram in seconds (without HELP/TYPE lines)"""
+        
+        label_text = ','.join(f'{key}="{value}"' for key, value in (labels or {}).items())
+        prefix = f"{label_text}," if label_text else ''
+        
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets_ms, self.counts):
+            cumulative += count
+            lines.append(f'{name}_bucket{{{prefix}le="{bound / 1000:g}"}} {cumulative}')
+        lines.append(f'{name}_bucket{{{prefix}le="+Inf"}} {self.total}')
+        
+        suffix = f"{{{label_text}}}" if label_text else ''
+        lines.append(f"{name}_sum{suffix} {self.sum_ms / 1000:.6f}")
+        lines.append(f"{name}_count{suffix} {self.total}")
+        return lines
+
+class HTTPClientFactory:
+    """Owns the shared connector and hands out sessions that use it
+    
+    Sessions differ only in default headers and timeout; connections,
+    keep-alive and DNS lookups are shared. Per-host concurrency limits
+    can be tightened below the connector-wide ``max_connections_per_host``.
+    """
+    
+    def __init__(self, http_config: Optional[Dict[str, Any]] = None):
+        http_config = http_config or {}
+        self.max_connections = http_config.get('max_connections', 100)
+        self.max_connections_per_host = http_config.get('max_connections_per_host', 10)
+        self.keepalive_timeout = http_config.get('keepalive_timeout', 30)
+        self.dns_cache_ttl = http_config.get('dns_cache_ttl', 300)
+        self.max_retries = http_config.get('max_retries', 3)
+        self.backoff_base = http_config.get('backoff_base', 0.5)
+        self.backoff_max = http_config.get('backoff_max', 10.0)
+        self.retry_statuses = set(http_config.get('retry_statuses', [502, 503, 504]))
+        
+        self.connector: Optional[aiohttp.TCPConnector] = None
+        self.sessions: List['PooledSession'] = []
+        self.host_limits: Dict[str, asyncio.Semaphore] = {}
+        self.latency: Dict[str, LatencyHistogram] = {}
+        self.retries = 0
+    
+    def session(self, name: str, headers: Optional[Dict[str, str]] = None,
+                timeout: float = 30) -> 'PooledSession':
+        """Create a session for a component on the shared connector"""
+        
+        if self.connector is None or self.connector.closed:
+            self.connector = aiohttp.TCPConnector(
+                limit=self.max_connections,
+                limit_per_host=self.max_connections_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                use_dns_cache=True,
+                ttl_dns_cache=self.dns_cache_ttl
+            )
+        
+        client_session = aiohttp.ClientSession(
+            connector=self.connector,
+            connector_owner=False,
+            headers=headers,
+            timeout=aiohttp.ClientTimeout(total=timeout)
+        )
+        
+        session = PooledSession(self, name, client_session)
+        self.sessions.append(session)
+        return session
+    
+    def set_host_limit(self, host: str, limit: int):
+        """Cap concurrent requests to one host below the connector-wide limit"""
+        self.host_limits[host] = asyncio.Semaphore(limit)
+    
+    def backoff_delay(self, attempt: int) -> float:
+        """Full-jitter exponential backoff"""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+    
+    def observe(self, host: str, elapsed_ms: float, failed: bool = False):
+        histogram = self.latency.setdefault(host, LatencyHistogram())
+        if failed:
+            histogram.errors += 1
+        else:
+            histogram.observe(elapsed_ms)
+    
+    async def close(self):
+        """Close every session, then the shared connector"""
+        
+        for session in self.sessions:
+            await session.close()
+        self.sessions.clear()
+        
+        if self.connector and not self.connector.closed:
+            await self.connector.close()
+        
+        logger.info("HTTP client factory closed")
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get connection pool and latency statistics"""
+        
+        return {
+            'sessions': [session.name for session in self.sessions],
+            'retries': self.retries,
+            'latency_by_host': {host: histogram.to_dict() for host, histogram in self.latency.items()}
+        }
+
+class PooledSession:
+    """aiohttp session wrapper adding retries, per-host limits and latency tracking
+    
+    ``get``/``post``/``put``/``request`` are used exactly like the aiohttp
+    methods (``async with session.get(url) as response``). Read-only
+    methods are retried on connection errors and ``retry_statuses``;
+    other methods only when called with ``retry=True``.
+    """
+    
+    def __init__(self, factory: HTTPClientFactory, name: str, client_session: aiohttp.ClientSession):
+        self.factory = factory
+        self.name = name
+        self.client_session = client_session
+    
+    @property
+    def closed(self) -> bool:
+        return self.client_session.closed
+    
+    def request(self, method: str, url: str, retry: Optional[bool] = None, **kwargs) -> '_RequestContext':
+        if retry is None:
+            retry = method.upper() in RETRIED_METHODS
+        return _RequestContext(self, method, str(url), retry, kwargs)
+    
+    def get(self, url: str, **kwargs) -> '_RequestContext':
+        return self.request('GET', url, **kwargs)
+    
+    def post(self, url: str, **kwargs) -> '_RequestContext':
+        return self.request('POST', url, **kwargs)
+    
+    def put(self, url: str, **kwargs) -> '_RequestContext':
+        return self.request('PUT', url, **kwargs)
+    
+    async def close(self):
+        if not self.client_session.closed:
+            await self.client_session.close()
+
+class _RequestContext:
+    """Async context manager performing one logical request with retries"""
+    
+    def __init__(self, session: PooledSession, method: str, url: str, retry: bool, kwargs: Dict[str, Any]):
+        self.session = session
+        self.method = method
+        self.url = url
+        self.retry = retry
+        self.kwargs = kwargs
+        self.response: Optional[aiohttp.ClientResponse] = None
+        self.host = urlsplit(url).hostname or ''
+    
+    async def __aenter__(self) -> aiohttp.ClientResponse:
+        factory = self.session.factory
+        attempts = factory.max_retries + 1 if self.retry else 1
+        limit = factory.host_limits.get(self.host)
+        
+        for attempt in range(attempts):
+            last_attempt = attempt == attempts - 1
+            started = time.perf_counter()
+            
+            try:
+                if limit:
+                    async with limit:
+                        response = await self.session.client_session.request(self.method, self.url, **self.kwargs)
+                else:
+                    response = await self.session.client_session.request(self.method, self.url, **self.kwargs)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                factory.observe(self.host, 0, failed=True)
+                if last_attempt:
+                    raise
+                logger.debug(f"{self.method} {self.url} failed ({e!r}), retrying")
+            else:
+                factory.observe(self.host, (time.perf_counter() - started) * 1000)
+                
+                if response.status not in factory.retry_statuses or last_attempt:
+                    self.response = response
+                    return response
+                
+                response.release()
+                logger.debug(f"{self.method} {self.url} returned {response.status}, retrying")
+            
+            factory.retries += 1
+            await asyncio.sleep(factory.backoff_delay(attempt))
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        if self.response is not None:
+            self.response.release()
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+PADA Learning Engine - Notification preferences learned from user feedback
+Helpfulness counts are updated as feedback arrives and answered from memory
+"""
+
+import logging
+from collections import OrderedDict
+from typing import Dict, List, Optional, Any, Tuple
+
+from .models import Event
+from .database import DatabaseBackend
+
+logger = logging.getLogger(__name__)
+
+# learning_patterns row holding the snapshot of the preference table
+SNAPSHOT_PATTERN_TYPE = 'notification_preference'
+SNAPSHOT_PATTERN_ID = 'notification_preference_snapshot'
+
+class PreferenceLearner:
+    """Suppresses notifications for event kinds the user keeps marking unhelpful
+    
+    Each (source, type, severity) key keeps helpful/total feedback counts,
+    halved whenever the total passes ``max_pattern_samples`` so recent
+    feedback outweighs old. ``should_notify`` is a dictionary lookup: a key
+    with at least ``min_feedback_per_pattern`` responses and a helpful rate
+    below ``suppression_threshold`` is suppressed. CRITICAL events are
+    never suppressed. The table is snapshotted to ``learning_patterns`` by
+    ``update_model`` and restored by ``load``.
+    """
+    
+    def __init__(self, db: DatabaseBackend, learning_config: Optional[Dict[str, Any]] = None):
+        self.db = db
+        config = learning_config or {}
+        self.enabled = config.get('enabled', True)
+        self.min_feedback = config.get('min_feedback_per_pattern', 5)
+        self.suppression_threshold = config.get('suppression_threshold', 0.2)
+        self.max_pattern_samples = config.get('max_pattern_samples', 200)
+        self.recent_events_size = config.get('recent_events', 10000)
+        self.min_samples_for_training = config.get('min_samples_for_training', 50)
+        
+        self.patterns: Dict[Tuple[str, str, str], List[float]] = {}  # key -> [helpful, total]
+        self.recent_events: OrderedDict = OrderedDict()  # event_id -> key, for feedback lookups
+        
+        self.loaded = False
+        self._dirty = False
+        self.feedback_processed = 0
+        self.feedback_unmatched = 0
+        self.feedback_looked_up = 0
+        self.suppressed = 0
+    
+    @staticmethod
+    def _key(event: Event) -> Tuple[str, str, str]:
+        return (event.source, event.type, event.severity)
+    
+    async def load(self):
+        """Restore the preference table from its last snapshot"""
+        
+        self.loaded = True
+        
+        try:
+            snapshots = await self.db.get_learning_patterns(SNAPSHOT_PATTERN_TYPE)
+        except Exception as e:
+            logger.warning(f"Could not load notification preferences: {e}")
+            return
+        
+        for snapshot in snapshots:
+            if 'patterns' not in snapshot['data']:
+                continue
+            for pattern in snapshot['data']['patterns']:
+                key = (pattern['source'], pattern['type'], pattern['severity'])
+                self.patterns[key] = [pattern['helpful'], pattern['total']]
+            logger.info(f"Loaded {len(self.patterns)} notification preference patterns")
+            break
+    
+    async def should_notify(self, event: Event) -> bool:
+        """Decide from the in-memory table whether an event is worth a notification"""
+        
+        key = self._key(event)
+        
+        # Remember the event so later feedback can find its key
+        self.recent_events[event.id] = key
+        self.recent_events.move_to_end(event.id)
+        if len(self.recent_events) > self.recent_events_size:
+            self.recent_events.popitem(last=False)
+        
+        if not self.enabled or event.severity == 'CRITICAL':
+            return True
+        
+        counts = self.patterns.get(key)
+        if counts and counts[1] >= self.min_feedback and counts[0] / counts[1] < self.suppression_threshold:
+            self.suppressed += 1
+            logger.debug(f"Notification suppressed by learned preference: {key}")
+            return False
+        
+        return True
+    
+    async def process_feedback(self, event_id: str, feedback_type: str, helpful: bool):
+        """Fold one piece of notification feedback into the table"""
+        
+        if feedback_type != 'notification':
+            return
+        
+        key = self.recent_events.get(event_id)
+        if key is None:
+            # Seen before a restart or outside the recent-event window: one primary-key read
+            try:
+                key = await self.db.get_event_key(event_id)
+            except Exception as e:
+                logger.warning(f"Could not look up event {event_id} for feedback: {e}")
+            
+            if key is None:
+                self.feedback_unmatched += 1
+                logger.debug(f"Feedback for unknown event {event_id} not applied to preferences")
+                return
+            
+            self.feedback_looked_up += 1
+        
+        counts = self.patterns.setdefault(key, [0.0, 0.0])
+        counts[0] += 1 if helpful else 0
+        counts[1] += 1
+        if counts[1] > self.max_pattern_samples:
+            counts[0] /= 2
+            counts[1] /= 2
+        
+        self.feedback_processed += 1
+        self._dirty = True
+    
+    async def update_model(self):
+        """Snapshot the preference table to learning_patterns if it changed"""
+        
+        if not self.loaded:
+            await self.load()
+        
+        if not self._dirty:
+            return
+        
+        total = sum(counts[1] for counts in self.patterns.values())
+        snapshot = {
+            'patterns': [
+                {'source': source, 'type': event_type, 'severity': severity, 'helpful': counts[0], 'total': counts[1]}
+                for (source, event_type, severity), counts in self.patterns.items()
+            ]
+        }
+        
+        await self.db.store_learning_pattern(
+            SNAPSHOT_PATTERN_TYPE,
+            snapshot,
+            min(1.0, total / self.min_samples_for_training) if self.min_samples_for_training else 1.0,
+            pattern_id=SNAPSHOT_PATTERN_ID
+        )
+        self._dirty = False
+        logger.debug(f"Snapshotted {len(self.patterns)} notification preference patterns")
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        return {
+            'patterns': len(self.patterns),
+            'suppressing': sum(
+                1 for helpful, total in self.patterns.values()
+                if total >= self.min_feedback and helpful / total < self.suppression_threshold
+            ),
+            'suppressed': self.suppressed,
+            'feedback_processed': self.feedback_processed,
+            'feedback_unmatched': self.feedback_unmatched,
+            'feedback_looked_up': self.feedback_looked_up
+        }
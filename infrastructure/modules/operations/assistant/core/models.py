@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+PADA Models - Core data structures shared by the service and its components
+Kept free of module imports so every component can depend on it without cycles
+"""
+
+from datetime import datetime
+from typing import Dict, List, Any
+from dataclasses import dataclass
+
+@dataclass
+class Event:
+    """Core event structure for PADA"""
+    id: str
+    source: str
+    type: str
+    title: str
+    description: str
+    severity: str  # CRITICAL, IMPORTANT, HELPFUL, LEARNING
+    timestamp: datetime
+    data: Dict[str, Any]
+    requires_action: bool
+    suggested_actions: List[str]
+
+@dataclass
+class ActionResult:
+    """Result of an autonomous action"""
+    action_id: str
+    action_type: str
+    success: bool
+    rep_score: float
+    human_validation_needed: bool
+    details: Dict[str, Any]
+    timestamp: datetime
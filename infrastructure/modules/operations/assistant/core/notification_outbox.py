@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+PADA Notification Outbox - Durable queue of pending notification deliveries
+Append-only JSON-lines journal replayed on startup, with retry backoff and dead letters
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+import uuid
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import Dict, List, Optional, Any
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class OutboxEntry:
+    """One notification waiting to be delivered through one channel"""
+    id: str
+    event_id: str
+    channel: str
+    title: str
+    message: str
+    severity: str
+    data: Dict[str, Any] = field(default_factory=dict)
+    track: bool = True  # report outcomes to PADADatabase.track_notification
+    status: str = 'pending'  # pending, sent, dead
+    attempts: int = 0
+    next_attempt_at: float = 0.0  # epoch seconds
+    created_at: float = field(default_factory=time.time)
+    last_error: Optional[str] = None
+
+class NotificationOutbox:
+    """Pending deliveries kept in memory and journaled to a segment file
+    
+    Every state change appends the entry's full state as one JSON line, so
+    replaying the journal and keeping the last line per ID restores the
+    queue after a restart. Sent entries are forgotten; entries that run
+    out of attempts move to a bounded dead-letter set. The journal is
+    rewritten with only live entries once it is mostly superseded lines.
+    Without a ``path`` the outbox is in-memory only.
+    
+    In-memory state changes at once; journal lines go to a background
+    writer that appends everything queued since its last write in one
+    call off the event loop (group commit), followed by fsync when
+    ``fsync`` is set. Callers return once their lines are on disk.
+    """
+    
+    def __init__(self, path: Optional[str] = None, max_attempts: int = 6,
+                 backoff_base: float = 5.0, backoff_max: float = 900.0, dead_letter_size: int = 500,
+                 fsync: bool = True):
+        self.path = Path(path) if path else None
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.dead_letter_size = dead_letter_size
+        self.fsync = fsync
+        
+        self.pending: Dict[str, OutboxEntry] = {}
+        self.dead: Dict[str, OutboxEntry] = {}
+        self.journal_lines = 0
+        
+        self._queue: Optional[asyncio.Queue] = None
+        self._writer: Optional[asyncio.Task] = None
+        self.batches_written = 0
+        
+        self.sent_count = 0
+        self.retry_count = 0
+        self.dead_count = 0
+        
+        self._load()
+    
+    def _load(self):
+        if not self.path or not self.path.exists():
+            return
+        
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        entry = OutboxEntry(**json.loads(line))
+                    except (ValueError, TypeError):
+                        # A torn final line from a crash mid-append
+                        continue
+                    self._apply(entry)
+            
+            self._rewrite(*self._snapshot())
+            logger.info(f"Notification outbox resumed with {len(self.pending)} pending, {len(self.dead)} dead deliveries")
+        except Exception as e:
+            logger.warning(f"Could not load notification outbox: {e}")
+    
+    def _apply(self, entry: OutboxEntry):
+        self.pending.pop(entry.id, None)
+        self.dead.pop(entry.id, None)
+        
+        if entry.status == 'pending':
+            self.pending[entry.id] = entry
+        elif entry.status == 'dead':
+            self.dead[entry.id] = entry
+            while len(self.dead) > self.dead_letter_size:
+                self.dead.pop(next(iter(self.dead)))
+    
+    async def _journal(self, entries: List[OutboxEntry]):
+        """Apply the new state of a batch of entries and wait until it is journaled"""
+        
+        for entry in entries:
+            self._apply(entry)
+        
+        if not self.path or not entries:
+            return
+        
+        payload = ''.join(json.dumps(asdict(entry), default=str) + '\n' for entry in entries)
+        
+        if self._writer is None or self._writer.done():
+            self._queue = asyncio.Queue()
+            self._writer = asyncio.create_task(self._write_loop())
+        
+        written = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((payload, len(entries), written))
+        await written
+    
+    async def _write_loop(self):
+        """Append queued journal lines in batches until a None sentinel is dequeued"""
+        
+        while True:
+            batch = [await self._queue.get()]
+            while not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            
+            stop = None in batch
+            batch = [item for item in batch if item is not None]
+            
+            if batch:
+                try:
+                    await asyncio.to_thread(self._append, ''.join(payload for payload, _, _ in batch))
+                    self.journal_lines += sum(lines for _, lines, _ in batch)
+                    self.batches_written += 1
+                    error = None
+                except Exception as e:
+                    logger.error(f"Could not write notification outbox journal: {e}")
+                    error = e
+                
+                for _, _, written in batch:
+                    if not written.done():
+                        if error is None:
+                            written.set_result(None)
+                        else:
+                            written.set_exception(error)
+                
+                live = len(self.pending) + len(self.dead)
+                if error is None and self.journal_lines > 1000 and self.journal_lines > 4 * live:
+                    try:
+                        await asyncio.to_thread(self._rewrite, *self._snapshot())
+                    except Exception as e:
+                        logger.warning(f"Could not compact notification outbox journal: {e}")
+            
+            if stop:
+                return
+    
+    def _append(self, payload: str):
+        """Append one batch of journal lines with a single write"""
+        
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(payload)
+            if self.fsync:
+                f.flush()
+                os.fsync(f.fileno())
+    
+    def _snapshot(self) -> tuple:
+        """Journal lines for every live entry, serialised on the event loop"""
+        
+        entries = list(self.dead.values()) + list(self.pending.values())
+        return ''.join(json.dumps(asdict(entry), default=str) + '\n' for entry in entries), len(entries)
+    
+    def _rewrite(self, payload: str, lines: int):
+        """Atomically replace the journal with one line per live entry"""
+        
+        if not self.path:
+            return
+        
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.path.with_suffix('.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        tmp_file.replace(self.path)
+        self.journal_lines = lines
+    
+    async def enqueue(self, event_id: str, channels: List[str], title: str, message: str, severity: str,
+                data: Optional[Dict[str, Any]] = None, track: bool = True) -> List[OutboxEntry]:
+        """Durably queue one notification for each channel"""
+        
+        entries = [
+            OutboxEntry(
+                id=uuid.uuid4().hex,
+                event_id=event_id,
+                channel=channel,
+                title=title,
+                message=message,
+                severity=severity,
+                data=data or {},
+                track=track
+            )
+            for channel in channels
+        ]
+        await self._journal(entries)
+        return entries
+    
+    def due(self, limit: int, now: Optional[float] = None) -> List[OutboxEntry]:
+        """Pending entries whose next attempt is due, oldest first"""
+        
+        now = time.time() if now is None else now
+        ready = [entry for entry in self.pending.values() if entry.next_attempt_at <= now]
+        ready.sort(key=lambda entry: (entry.next_attempt_at, entry.created_at))
+        return ready[:limit]
+    
+    def next_due_in(self, now: Optional[float] = None) -> Optional[float]:
+        """Seconds until the earliest pending attempt, or None when empty"""
+        
+        if not self.pending:
+            return None
+        now = time.time() if now is None else now
+        return max(0.0, min(entry.next_attempt_at for entry in self.pending.values()) - now)
+    
+    async def record_attempts(self, outcomes: List[tuple]):
+        """Apply ``(entry, success, error)`` outcomes of a dispatched batch"""
+        
+        updated = []
+        now = time.time()
+        
+        for entry, success, error in outcomes:
+            entry.attempts += 1
+            entry.last_error = error
+            
+            if success:
+                entry.status = 'sent'
+                self.sent_count += 1
+            elif entry.attempts >= self.max_attempts:
+                entry.status = 'dead'
+                self.dead_count += 1
+                logger.warning(f"Notification {entry.event_id} via {entry.channel} dead-lettered after {entry.attempts} attempts: {error}")
+            else:
+                entry.next_attempt_at = now + min(self.backoff_max, self.backoff_base * 2 ** (entry.attempts - 1))
+                self.retry_count += 1
+            
+            updated.append(entry)
+        
+        await self._journal(updated)
+    
+    async def retry_dead_letters(self) -> int:
+        """Move every dead-lettered entry back to pending with fresh attempts"""
+        
+        entries = list(self.dead.values())
+        for entry in entries:
+            entry.status = 'pending'
+            entry.attempts = 0
+            entry.next_attempt_at = 0.0
+        await self._journal(entries)
+        return len(entries)
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        return {
+            'pending': len(self.pending),
+            'dead_letters': len(self.dead),
+            'sent': self.sent_count,
+            'retries': self.retry_count,
+            'dead_lettered': self.dead_count,
+            'journal_lines': self.journal_lines,
+            'journal_batches': self.batches_written
+        }
+    
+    async def close(self):
+        """Write out queued journal lines and stop the writer"""
+        
+        if self._writer is not None and not self._writer.done():
+            self._queue.put_nowait(None)
+            await self._writer
@@ -5,19 +5,30 @@ Handles notifications across console, desktop, file, and webhook channels with l
 """
 
 import asyncio
+import gzip
 import json
 import logging
-from datetime import datetime, timedelta, time
+import os
+import shlex
+import shutil
+import sys
+from collections import Counter, deque
+from datetime import datetime, time
 from typing import Dict, List, Optional, Any
 from pathlib import Path
-import aiohttp
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+from time import monotonic, perf_counter
 
 # Import PADA core types
-from .pada_main import Event, ActionResult
+from .models import Event, ActionResult
+from .http_client import HTTPClientFactory, LatencyHistogram
+from .notification_outbox import NotificationOutbox, OutboxEntry
 
 logger = logging.getLogger(__name__)
 
+# Enqueue-to-sent latency spans retries and rate shaping, so its buckets reach 15 minutes
+DELIVERY_LATENCY_BUCKETS_MS = [10, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000, 300000, 900000]
+
 # Optional desktop notifications
 try:
     from plyer import notification as desktop_notification
@@ -26,15 +37,53 @@ except ImportError:
     HAS_DESKTOP_NOTIFICATIONS = False
     logger.warning("plyer not available - desktop notifications disabled")
 
+# Most severe first
+SEVERITY_ORDER = ['CRITICAL', 'IMPORTANT', 'HELPFUL', 'LEARNING']
+
 @dataclass
 class NotificationDelivery:
     """Record of a notification delivery attempt"""
     event_id: str
     channel: str
-    status: str  # sent, failed, filtered
+    status: str  # queued, coalesced, sent, failed, dead, filtered
     timestamp: datetime
     reason: Optional[str] = None
 
+class SlidingWindowCounter:
+    """Count of events over a trailing window, kept in a ring of fixed slots
+    
+    The window is split into ``slots`` buckets and a running total is kept,
+    so adding and counting only clear the slots that expired since the
+    previous call: O(1) amortised, fixed memory, exact to one slot width.
+    """
+    
+    def __init__(self, window_seconds: float, slots: int = 60):
+        self.window_seconds = window_seconds
+        self.slot_width = window_seconds / slots
+        self.counts = [0] * slots
+        self.total = 0
+        self.head = int(monotonic() // self.slot_width)
+    
+    def _advance(self, now: float):
+        index = int(now // self.slot_width)
+        if index <= self.head:
+            return
+        
+        for step in range(1, min(index - self.head, len(self.counts)) + 1):
+            slot = (self.head + step) % len(self.counts)
+            self.total -= self.counts[slot]
+            self.counts[slot] = 0
+        self.head = index
+    
+    def add(self, amount: int = 1, now: Optional[float] = None):
+        self._advance(monotonic() if now is None else now)
+        self.counts[self.head % len(self.counts)] += amount
+        self.total += amount
+    
+    def count(self, now: Optional[float] = None) -> int:
+        self._advance(monotonic() if now is None else now)
+        return self.total
+
 class NotificationChannel:
     """Base class for notification channels"""
     
@@ -52,6 +101,10 @@ class NotificationChannel:
     async def health_check(self) -> bool:
         """Check if this channel is healthy"""
         return self.enabled
+    
+    def queue_depth(self) -> int:
+        """Notifications accepted by send() but not yet handed off"""
+        return 0
 
 class ConsoleChannel(NotificationChannel):
     """Console/terminal notifications"""
@@ -87,53 +140,249 @@ class ConsoleChannel(NotificationChannel):
             return False
 
 class DesktopChannel(NotificationChannel):
-    """Desktop system notifications"""
+    """Desktop system notifications
+    
+    Toasts are written as JSON lines to one long-lived helper process
+    (``desktop_notifier.py`` by default, or ``helper_command``), which
+    acknowledges each with a JSON line, so bursts do not spawn a process
+    per notification. Toasts are rate-shaped by a token bucket
+    (``max_toasts_per_minute``, ``toast_burst``); notifications arriving
+    while it is empty are held and shown as one digest toast when the
+    next token is available.
+    """
+    
+    TIMEOUTS = {
+        'CRITICAL': 10,
+        'IMPORTANT': 7,
+        'HELPFUL': 5,
+        'LEARNING': 3
+    }
+    
+    def __init__(self, name: str, config: Dict[str, Any]):
+        super().__init__(name, config)
+        self.helper_command = config.get('helper_command') or [sys.executable, str(Path(__file__).with_name('desktop_notifier.py'))]
+        if isinstance(self.helper_command, str):
+            self.helper_command = shlex.split(self.helper_command)
+        self.uses_default_helper = not config.get('helper_command')
+        if self.uses_default_helper and not HAS_DESKTOP_NOTIFICATIONS:
+            # Queued entries are dead-lettered at once instead of retried
+            self.enabled = False
+        self.max_message_length = config.get('max_message_length', 200)
+        
+        # Token bucket for toasts
+        self.toast_rate = config.get('max_toasts_per_minute', 6) / 60
+        self.toast_burst = config.get('toast_burst', 3)
+        self._tokens = float(self.toast_burst)
+        self._tokens_at = monotonic()
+        
+        self._helper: Optional[asyncio.subprocess.Process] = None
+        self._reader: Optional[asyncio.Task] = None
+        self._acks = deque()  # ack futures of the current helper process
+        self._held: List[tuple] = []  # (title, message, severity, future)
+        self._held_timer: Optional[asyncio.TimerHandle] = None
+        self._held_tasks = set()
+        self.toasts_shown = 0
+        self.digests_shown = 0
     
     async def send(self, title: str, message: str, severity: str, data: Dict[str, Any] = None) -> bool:
-        if not HAS_DESKTOP_NOTIFICATIONS:
+        if self.uses_default_helper and not HAS_DESKTOP_NOTIFICATIONS:
             logger.warning("Desktop notifications not available")
             return False
         
         try:
-            # Truncate message for desktop notification
-            max_length = self.config.get('max_message_length', 200)
-            if len(message) > max_length:
-                message = message[:max_length-3] + '...'
+            if not self._held and self._take_token():
+                return await self._toast(title, message, severity)
             
-            # Set notification timeout based on severity
-            timeout_map = {
-                'CRITICAL': 10,
-                'IMPORTANT': 7,
-                'HELPFUL': 5,
-                'LEARNING': 3
-            }
-            timeout = timeout_map.get(severity, 5)
+            # Rate-shaped: wait for the next token and share its toast
+            loop = asyncio.get_running_loop()
+            shown = loop.create_future()
+            self._held.append((title, message, severity, shown))
+            if self._held_timer is None:
+                self._held_timer = loop.call_later(self._next_token_in(), self._release_held)
+            return await shown
             
-            # Send desktop notification
-            desktop_notification.notify(
-                title=f"PADA - {title}",
-                message=message,
-                timeout=timeout,
-                app_name='Personal AI Development Assistant'
-            )
-            
-            self.delivery_count += 1
-            self.last_delivery = datetime.utcnow()
+        except Exception as e:
+            logger.error(f"Desktop notification failed: {e}")
+            return False
+    
+    def queue_depth(self) -> int:
+        return sum(1 for entry in self._held if not entry[3].cancelled()) + len(self._acks)
+    
+    def _refill(self):
+        now = monotonic()
+        self._tokens = min(self.toast_burst, self._tokens + (now - self._tokens_at) * self.toast_rate)
+        self._tokens_at = now
+    
+    def _take_token(self) -> bool:
+        self._refill()
+        if self._tokens >= 1:
+            self._tokens -= 1
             return True
-            
+        return False
+    
+    def _next_token_in(self) -> float:
+        self._refill()
+        return max(0.0, (1 - self._tokens) / self.toast_rate) if self.toast_rate else 60.0
+    
+    def _release_held(self):
+        self._held_timer = None
+        
+        # Sends cancelled while held (e.g. by the channel timeout) are dropped,
+        # since the outbox retries those entries itself
+        held = [entry for entry in self._held if not entry[3].cancelled()]
+        self._held = []
+        
+        if held:
+            self._take_token()
+            task = asyncio.create_task(self._show_held(held))
+            self._held_tasks.add(task)
+            task.add_done_callback(self._held_tasks.discard)
+    
+    async def _show_held(self, held: List[tuple]):
+        """Show held notifications as one toast, a digest when there are several"""
+        
+        if len(held) == 1:
+            title, message, severity, _ = held[0]
+        else:
+            severities = [severity for _, _, severity, _ in held]
+            severity = min(severities, key=lambda value: SEVERITY_ORDER.index(value) if value in SEVERITY_ORDER else len(SEVERITY_ORDER))
+            title = f"{len(held)} notifications"
+            message = '\n'.join(held_title for held_title, _, _, _ in held)
+            self.digests_shown += 1
+        
+        try:
+            success = await self._toast(title, message, severity)
         except Exception as e:
             logger.error(f"Desktop notification failed: {e}")
+            success = False
+        
+        for _, _, _, shown in held:
+            if not shown.done():
+                shown.set_result(success)
+    
+    async def _ensure_helper(self):
+        # A helper whose stdout closed is gone even if its exit is not reaped yet
+        if self._helper is not None and self._helper.returncode is None and not self._reader.done():
+            return
+        
+        self._helper = await asyncio.create_subprocess_exec(
+            *self.helper_command,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE
+        )
+        
+        # A fresh ack queue, so the previous helper's reader can only fail its own toasts
+        self._acks = deque()
+        self._reader = asyncio.create_task(self._read_acks(self._helper, self._acks))
+        logger.debug(f"Started desktop notification helper (pid {self._helper.pid})")
+    
+    async def _read_acks(self, helper: asyncio.subprocess.Process, acks: deque):
+        """Resolve one helper's pending toasts in order from its acknowledgement lines"""
+        
+        while True:
+            line = await helper.stdout.readline()
+            if not line:
+                break
+            
+            try:
+                reply = json.loads(line)
+                ok = bool(reply.get('ok'))
+                if not ok:
+                    logger.error(f"Desktop notification failed: {reply.get('error')}")
+            except ValueError:
+                ok = False
+            
+            if acks:
+                ack = acks.popleft()
+                if not ack.done():
+                    ack.set_result(ok)
+        
+        # Helper exited; anything unacknowledged failed and the next toast restarts it
+        if acks:
+            logger.warning(f"Desktop notification helper exited with {len(acks)} toasts unacknowledged")
+        while acks:
+            ack = acks.popleft()
+            if not ack.done():
+                ack.set_result(False)
+    
+    async def _toast(self, title: str, message: str, severity: str) -> bool:
+        await self._ensure_helper()
+        
+        # Truncate message for desktop notification
+        if len(message) > self.max_message_length:
+            message = message[:self.max_message_length-3] + '...'
+        
+        request = {
+            'title': f"PADA - {title}",
+            'message': message,
+            'timeout': self.TIMEOUTS.get(severity, 5),
+            'app_name': 'Personal AI Development Assistant'
+        }
+        
+        ack = asyncio.get_running_loop().create_future()
+        self._acks.append(ack)
+        self._helper.stdin.write((json.dumps(request) + '\n').encode('utf-8'))
+        await self._helper.stdin.drain()
+        
+        if not await ack:
             return False
+        
+        self.toasts_shown += 1
+        self.delivery_count += 1
+        self.last_delivery = datetime.utcnow()
+        return True
+    
+    async def close(self):
+        """Show held notifications, then let the helper exit"""
+        
+        if self._held_timer is not None:
+            self._held_timer.cancel()
+            self._release_held()
+        if self._held_tasks:
+            await asyncio.gather(*self._held_tasks)
+        
+        if self._helper is not None and self._helper.returncode is None:
+            self._helper.stdin.close()
+            try:
+                await asyncio.wait_for(self._helper.wait(), timeout=5)
+            except asyncio.TimeoutError:
+                self._helper.kill()
+        
+        if self._reader is not None:
+            await self._reader
 
 class FileChannel(NotificationChannel):
-    """File-based persistent notifications"""
+    """File-based persistent notifications
+    
+    Entries are handed to a background writer that appends everything
+    queued since its last write in one call (group commit), optionally
+    followed by fsync, off the event loop. The log is rotated when it
+    reaches ``max_bytes`` or, with ``rotate_daily``, when the local date
+    changes; rotated files are gzip-compressed and the newest
+    ``backup_count`` kept.
+    """
     
     def __init__(self, name: str, config: Dict[str, Any]):
         super().__init__(name, config)
         self.log_file = Path(config.get('log_file', 'pada_notifications.log'))
+        self.fsync = config.get('fsync', False)
+        self.max_bytes = config.get('max_bytes', 10 * 1024 * 1024)  # 0 disables size rotation
+        self.rotate_daily = config.get('rotate_daily', False)
+        self.backup_count = config.get('backup_count', 5)
+        self.compress_rotated = config.get('compress_rotated', True)
+        self.max_batch = config.get('max_batch', 500)
         
         # Ensure log directory exists
         self.log_file.parent.mkdir(parents=True, exist_ok=True)
+        
+        self._queue: Optional[asyncio.Queue] = None
+        self._writer: Optional[asyncio.Task] = None
+        self._size = self.log_file.stat().st_size if self.log_file.exists() else 0
+        self._file_date = (
+            datetime.fromtimestamp(self.log_file.stat().st_mtime).date() if self.log_file.exists() else datetime.now().date()
+        )
+        self.batches_written = 0
+        self.rotations = 0
     
     async def send(self, title: str, message: str, severity: str, data: Dict[str, Any] = None) -> bool:
         try:
@@ -146,81 +395,319 @@ class FileChannel(NotificationChannel):
                 'message': message,
                 'data': data
             }
+            line = json.dumps(log_entry, default=str) + '\n'
             
-            # Append to log file
-            with open(self.log_file, 'a', encoding='utf-8') as f:
-                f.write(json.dumps(log_entry) + '\n')
+            if self._writer is None or self._writer.done():
+                self._queue = asyncio.Queue()
+                self._writer = asyncio.create_task(self._write_loop())
             
-            self.delivery_count += 1
-            self.last_delivery = datetime.utcnow()
-            return True
+            written = asyncio.get_running_loop().create_future()
+            self._queue.put_nowait((line, written))
+            return await written
             
         except Exception as e:
             logger.error(f"File notification failed: {e}")
             return False
+    
+    def queue_depth(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+    
+    async def _write_loop(self):
+        """Append queued entries in batches until a None sentinel is dequeued"""
+        
+        while True:
+            batch = [await self._queue.get()]
+            while not self._queue.empty() and len(batch) < self.max_batch:
+                batch.append(self._queue.get_nowait())
+            
+            stop = None in batch
+            batch = [item for item in batch if item is not None]
+            
+            if batch:
+                try:
+                    await asyncio.to_thread(self._write_batch, ''.join(line for line, _ in batch))
+                    success = True
+                    self.delivery_count += len(batch)
+                    self.last_delivery = datetime.utcnow()
+                except Exception as e:
+                    logger.error(f"File notification failed: {e}")
+                    success = False
+                
+                for _, written in batch:
+                    if not written.done():
+                        written.set_result(success)
+            
+            if stop:
+                return
+    
+    def _write_batch(self, payload: str):
+        """Append one batch with a single write, rotating first if due"""
+        
+        encoded = payload.encode('utf-8')
+        today = datetime.now().date()
+        
+        if self._size and (
+            (self.max_bytes and self._size + len(encoded) > self.max_bytes)
+            or (self.rotate_daily and today != self._file_date)
+        ):
+            self._rotate()
+        
+        with open(self.log_file, 'ab') as f:
+            f.write(encoded)
+            if self.fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        
+        self._size += len(encoded)
+        self._file_date = today
+        self.batches_written += 1
+    
+    def _rotate(self):
+        """Move the log aside as ``<stem>.<timestamp><suffix>[.gz]`` and prune old backups"""
+        
+        stamp = datetime.fromtimestamp(self.log_file.stat().st_mtime).strftime('%Y%m%d-%H%M%S-%f')
+        rotated = self.log_file.with_name(f"{self.log_file.stem}.{stamp}{self.log_file.suffix}")
+        self.log_file.replace(rotated)
+        
+        if self.compress_rotated:
+            with open(rotated, 'rb') as src, gzip.open(f"{rotated}.gz", 'wb') as dst:
+                shutil.copyfileobj(src, dst)
+            rotated.unlink()
+        
+        backups = sorted(self.log_file.parent.glob(f"{self.log_file.stem}.*{self.log_file.suffix}*"))
+        for old_backup in backups[:max(0, len(backups) - self.backup_count)]:
+            old_backup.unlink()
+        
+        self._size = 0
+        self.rotations += 1
+        logger.info(f"Rotated notification log to {rotated.name}")
+    
+    async def close(self):
+        """Write out queued entries and stop the writer"""
+        
+        if self._writer is not None and not self._writer.done():
+            self._queue.put_nowait(None)
+            await self._writer
 
 class WebhookChannel(NotificationChannel):
-    """Webhook notifications for external integrations"""
+    """Webhook notifications for external integrations
     
-    def __init__(self, name: str, config: Dict[str, Any]):
+    With ``batch_size`` above 1, notifications are held for up to
+    ``batch_interval_ms`` and POSTed together as a JSON array or NDJSON
+    (``batch_format``), gzip-compressed when ``gzip`` is set and the body
+    reaches ``gzip_min_bytes``. Each ``send`` still reports its own item:
+    a receiver may answer ``{"results": [...]}`` with one boolean (or
+    ``{"ok": bool}`` object) per item, otherwise the HTTP status applies
+    to the whole batch.
+    """
+    
+    def __init__(self, name: str, config: Dict[str, Any], http_client: HTTPClientFactory):
         super().__init__(name, config)
         self.webhook_url = config.get('url')
+        self.http = http_client
         self.session = None
+        
+        self.batch_size = config.get('batch_size', 1)
+        self.batch_interval = config.get('batch_interval_ms', 200) / 1000
+        self.batch_format = config.get('batch_format', 'json')
+        self.compress = config.get('gzip', False)
+        self.compress_min_bytes = config.get('gzip_min_bytes', 1024)
+        
+        self._batch: List[tuple] = []  # (payload, future)
+        self._batch_timer: Optional[asyncio.TimerHandle] = None
+        self._flush_tasks = set()
+        self.requests_sent = 0
     
     async def _ensure_session(self):
         """Ensure HTTP session exists"""
         if not self.session:
-            self.session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=10))
+            self.session = self.http.session(f"notification:{self.name}", timeout=10)
     
     async def send(self, title: str, message: str, severity: str, data: Dict[str, Any] = None) -> bool:
         if not self.webhook_url:
             logger.warning("Webhook URL not configured")
             return False
         
+        payload = {
+            'timestamp': datetime.utcnow().isoformat(),
+            'source': 'PADA',
+            'severity': severity,
+            'title': title,
+            'message': message,
+            'data': data or {}
+        }
+        
+        if self.batch_size <= 1:
+            return (await self._post([payload], batched=False))[0]
+        
+        loop = asyncio.get_running_loop()
+        acknowledged = loop.create_future()
+        self._batch.append((payload, acknowledged))
+        
+        if len(self._batch) >= self.batch_size:
+            self._start_flush()
+        elif self._batch_timer is None:
+            self._batch_timer = loop.call_later(self.batch_interval, self._start_flush)
+        
+        return await acknowledged
+    
+    def queue_depth(self) -> int:
+        return len(self._batch)
+    
+    def _start_flush(self):
+        if self._batch_timer is not None:
+            self._batch_timer.cancel()
+            self._batch_timer = None
+        
+        batch, self._batch = self._batch, []
+        if batch:
+            task = asyncio.create_task(self._flush(batch))
+            self._flush_tasks.add(task)
+            task.add_done_callback(self._flush_tasks.discard)
+    
+    async def _flush(self, batch: List[tuple]):
+        # Sends cancelled while held (e.g. by the channel timeout) are dropped,
+        # since the outbox retries those entries itself
+        batch = [(payload, acknowledged) for payload, acknowledged in batch if not acknowledged.cancelled()]
+        if not batch:
+            return
+        
+        results = await self._post([payload for payload, _ in batch], batched=True)
+        
+        for (_, acknowledged), accepted in zip(batch, results):
+            # A sender that timed out during the POST has already cancelled its future
+            if not acknowledged.done():
+                acknowledged.set_result(accepted)
+    
+    async def _post(self, payloads: List[Dict[str, Any]], batched: bool) -> List[bool]:
+        """POST one or more notifications in a single request; returns per-item acceptance"""
+        
+        failed = [False] * len(payloads)
+        
         try:
             await self._ensure_session()
             
-            payload = {
-                'timestamp': datetime.utcnow().isoformat(),
-                'source': 'PADA',
-                'severity': severity,
-                'title': title,
-                'message': message,
-                'data': data or {}
-            }
+            if batched and self.batch_format == 'ndjson':
+                body = ''.join(json.dumps(payload, default=str) + '\n' for payload in payloads).encode('utf-8')
+                headers = {'Content-Type': 'application/x-ndjson'}
+            else:
+                body = json.dumps(payloads if batched else payloads[0], default=str).encode('utf-8')
+                headers = {'Content-Type': 'application/json'}
             
-            async with self.session.post(self.webhook_url, json=payload) as response:
-                if response.status < 400:
-                    self.delivery_count += 1
-                    self.last_delivery = datetime.utcnow()
-                    return True
-                else:
+            if self.compress and len(body) >= self.compress_min_bytes:
+                body = gzip.compress(body)
+                headers['Content-Encoding'] = 'gzip'
+            
+            async with self.session.post(self.webhook_url, data=body, headers=headers) as response:
+                self.requests_sent += 1
+                
+                if response.status >= 400:
                     logger.error(f"Webhook notification failed: {response.status}")
-                    return False
+                    return failed
+                
+                results = [True] * len(payloads)
+                if batched:
+                    results = await self._item_results(response, len(payloads)) or results
+                
+                accepted = sum(results)
+                if accepted:
+                    self.delivery_count += accepted
+                    self.last_delivery = datetime.utcnow()
+                return results
             
         except Exception as e:
             logger.error(f"Webhook notification failed: {e}")
-            return False
+            return failed
+    
+    @staticmethod
+    async def _item_results(response, count: int) -> Optional[List[bool]]:
+        """Per-item results from a ``{"results": [...]}`` response body, if the receiver sent them"""
+        
+        try:
+            body = await response.json(content_type=None)
+        except Exception:
+            return None
+        
+        results = body.get('results') if isinstance(body, dict) else None
+        if not isinstance(results, list) or len(results) != count:
+            return None
+        
+        return [bool(item.get('ok')) if isinstance(item, dict) else bool(item) for item in results]
     
     async def close(self):
-        """Close HTTP session"""
+        """Send any held batch, then close HTTP session"""
+        
+        self._start_flush()
+        if self._flush_tasks:
+            await asyncio.gather(*self._flush_tasks)
+        
         if self.session:
             await self.session.close()
 
 class NotificationManager:
     """Intelligent notification manager with learning and filtering"""
     
-    def __init__(self, notification_config: Dict[str, Any]):
+    def __init__(self, notification_config: Dict[str, Any], http_client: Optional[HTTPClientFactory] = None,
+                 db=None):
         self.config = notification_config
+        self.http = http_client or HTTPClientFactory()
+        self._owns_http = http_client is None
+        self.db = db
         self.channels = {}
-        self.delivery_history = []
-        self.rate_limit_window = timedelta(hours=1)
+        self.delivery_history = deque(maxlen=self.config.get('history_size', 1000))
         
         # Initialize channels
         self._initialize_channels()
         
-        # Rate limiting
+        # Rate limiting: one sliding window for all notifications, plus
+        # optional per-channel and per-severity budgets (per hour)
         self.max_notifications_per_hour = self.config.get('max_notifications_per_hour', 10)
+        self.channel_rate_limits = self.config.get('channel_rate_limits') or {}
+        self.severity_rate_limits = self.config.get('severity_rate_limits') or {}
+        
+        # Upper bound on one channel's send; channels may override with 'timeout_seconds'
+        self.channel_timeout = self.config.get('channel_timeout_seconds', 15)
+        
+        # Durable outbox drained by a background dispatcher once start() is called
+        self.outbox = NotificationOutbox(
+            self.config.get('outbox_file', 'pada_notification_outbox.jsonl'),
+            max_attempts=self.config.get('outbox_max_attempts', 6),
+            backoff_base=self.config.get('outbox_backoff_base_seconds', 5.0),
+            backoff_max=self.config.get('outbox_backoff_max_seconds', 900.0),
+            dead_letter_size=self.config.get('dead_letter_size', 500),
+            fsync=self.config.get('outbox_fsync', True)
+        )
+        self.outbox_batch_size = self.config.get('outbox_batch_size', 20)
+        self._dispatcher: Optional[asyncio.Task] = None
+        self._outbox_ready = asyncio.Event()
+        self._dispatch_lock = asyncio.Lock()
+        
+        # Digest coalescing: the first event of a (repository, type) group is
+        # sent at once; further ones within the window go out as one digest
+        self.digest_window = self.config.get('digest_window_seconds', 0)
+        self.digest_top_items = self.config.get('digest_top_items', 5)
+        self.digest_groups: Dict[tuple, List[tuple]] = {}
+        self._digest_timers: Dict[tuple, asyncio.TimerHandle] = {}
+        self._digest_tasks = set()
+        self.events_coalesced = 0
+        self.digests_sent = 0
+        
+        # Latency instrumentation: per-attempt send duration and enqueue-to-sent
+        # time per channel, enqueue-to-sent per severity, and attempt outcomes
+        self.send_latency: Dict[str, LatencyHistogram] = {}
+        self.delivery_latency: Dict[str, LatencyHistogram] = {}
+        self.severity_latency: Dict[str, LatencyHistogram] = {}
+        self.channel_attempts: Dict[str, Counter] = {}
+        
+        self.sent_window = SlidingWindowCounter(3600)
+        self.channel_windows = {name: SlidingWindowCounter(3600) for name in self.channel_rate_limits}
+        self.severity_windows = {severity: SlidingWindowCounter(3600) for severity in self.severity_rate_limits}
+        
+        # Delivery counters by status for get_statistics
+        self.delivery_counters = {
+            period: {status: SlidingWindowCounter(seconds, slots) for status in ('sent', 'failed', 'dead', 'filtered')}
+            for period, seconds, slots in (('last_hour', 3600, 60), ('last_day', 86400, 96))
+        }
         
         # Quiet hours
         quiet_hours = self.config.get('quiet_hours', {})
@@ -235,6 +722,10 @@ class NotificationManager:
             'LEARNING': False
         })
         
+        # Routing table: (severity, in quiet hours) -> (channels, filter reason)
+        self.routes: Dict[tuple, tuple] = {}
+        self.rebuild_routes()
+        
         logger.info(f"Notification manager initialized with {len(self.channels)} channels")
     
     def _initialize_channels(self):
@@ -258,7 +749,7 @@ class NotificationManager:
             elif name == 'file':
                 self.channels[name] = FileChannel(name, channel_config)
             elif name == 'webhook':
-                self.channels[name] = WebhookChannel(name, channel_config)
+                self.channels[name] = WebhookChannel(name, channel_config, self.http)
             else:
                 logger.warning(f"Unknown notification channel: {name}")
     
@@ -273,52 +764,131 @@ class NotificationManager:
     
     def _is_quiet_hours(self) -> bool:
         """Check if current time is within quiet hours"""
-        now = datetime.now().time()
-        
-        if self.quiet_start <= self.quiet_end:
-            # Same day quiet hours (e.g., 22:00 to 23:00)
-            return self.quiet_start <= now <= self.quiet_end
-        else:
-            # Overnight quiet hours (e.g., 22:00 to 08:00)
-            return now >= self.quiet_start or now <= self.quiet_end
+        now = datetime.now()
+        return bool(self.quiet_minutes[now.hour * 60 + now.minute])
     
-    def _check_rate_limit(self) -> bool:
-        """Check if we're within rate limits"""
-        now = datetime.utcnow()
-        cutoff = now - self.rate_limit_window
+    def rebuild_routes(self):
+        """Compile filters and channel settings into the routing table
         
-        # Count recent notifications
-        recent_count = len([
-            delivery for delivery in self.delivery_history
-            if delivery.timestamp > cutoff and delivery.status == 'sent'
-        ])
+        Quiet hours become one flag per minute of the day, covering
+        [start, end) and wrapping past midnight. Each (severity, quiet)
+        pair maps to the enabled channels that accept it: channels may
+        restrict ``severities`` and opt out of quiet hours with
+        ``respect_quiet_hours: false``; CRITICAL always ignores them.
+        Call again after changing filters or enabling/disabling channels.
+        """
         
-        return recent_count < self.max_notifications_per_hour
-    
-    def _should_notify(self, severity: str) -> tuple[bool, str]:
-        """Determine if notification should be sent based on filters"""
+        start = self.quiet_start.hour * 60 + self.quiet_start.minute
+        end = self.quiet_end.hour * 60 + self.quiet_end.minute
+        self.quiet_minutes = bytearray(
+            (start <= minute < end) if start <= end else (minute >= start or minute < end)
+            for minute in range(24 * 60)
+        )
         
-        # Check severity filter
+        self.routes = {}
+        for severity in set(SEVERITY_ORDER) | set(self.severity_filters):
+            for quiet in (False, True):
+                self.routes[(severity, quiet)] = self._compile_route(severity, quiet)
+    
+    def _compile_route(self, severity: str, quiet: bool) -> tuple:
         if not self.severity_filters.get(severity, True):
-            return False, f"severity {severity} filtered"
+            return (), f"severity {severity} filtered"
         
-        # Check quiet hours (except for critical)
-        if severity != 'CRITICAL' and self._is_quiet_hours():
-            return False, "quiet hours"
+        channels = []
+        for name, channel in self.channels.items():
+            if not channel.enabled:
+                continue
+            accepted = channel.config.get('severities')
+            if accepted is not None and severity not in accepted:
+                continue
+            if quiet and severity != 'CRITICAL' and channel.config.get('respect_quiet_hours', True):
+                continue
+            channels.append(name)
         
-        # Check rate limit
-        if not self._check_rate_limit():
+        if channels:
+            return tuple(channels), None
+        return (), "quiet hours" if quiet else "no channel routes severity"
+    
+    def _route(self, severity: str) -> tuple:
+        """Channels and filter reason for a severity right now: one table lookup"""
+        
+        now = datetime.now()
+        key = (severity, bool(self.quiet_minutes[now.hour * 60 + now.minute]))
+        route = self.routes.get(key)
+        if route is None:
+            route = self.routes[key] = self._compile_route(*key)
+        return route
+    
+    def _check_rate_limit(self, severity: str) -> tuple[bool, str]:
+        """Check the global and per-severity hourly budgets"""
+        
+        if self.sent_window.count() >= self.max_notifications_per_hour:
             return False, "rate limit exceeded"
         
+        severity_window = self.severity_windows.get(severity)
+        if severity_window and severity_window.count() >= self.severity_rate_limits[severity]:
+            return False, f"rate limit exceeded for {severity}"
+        
         return True, "approved"
     
-    async def send_notification(self, event: Event) -> List[NotificationDelivery]:
-        """Send notification for an event"""
+    def _channel_within_limit(self, channel_name: str) -> bool:
+        window = self.channel_windows.get(channel_name)
+        return window is None or window.count() < self.channel_rate_limits[channel_name]
+    
+    def _record_delivery(self, delivery: NotificationDelivery):
+        self.delivery_history.append(delivery)
+        for counters in self.delivery_counters.values():
+            if delivery.status in counters:
+                counters[delivery.status].add()
+    
+    def _should_notify(self, severity: str) -> tuple[tuple, str]:
+        """Determine the channels a notification goes to, or why it is filtered"""
         
-        # Check if we should notify
-        should_notify, reason = self._should_notify(event.severity)
+        channels, reason = self._route(severity)
+        if not channels:
+            return (), reason
         
-        if not should_notify:
+        within_limit, reason = self._check_rate_limit(severity)
+        return (channels if within_limit else ()), reason
+    
+    async def start(self):
+        """Start the background outbox dispatcher"""
+        
+        if self._dispatcher is None:
+            self._outbox_ready = asyncio.Event()
+            self._dispatcher = asyncio.create_task(self._dispatch_loop())
+            if self.outbox.pending:
+                self._outbox_ready.set()
+    
+    async def send_notification(self, event: Event, track: bool = True) -> List[NotificationDelivery]:
+        """Queue notification for an event on every enabled channel
+        
+        With the dispatcher running, returns "queued" deliveries at once;
+        otherwise the queued sends are dispatched before returning. Outcomes
+        of events stored in the database are reported to
+        ``track_notification`` when ``track`` is set. With digests enabled,
+        events arriving while their group's window is open are held back
+        ("coalesced") and sent as one digest when the window closes.
+        """
+        
+        if self.digest_window and await self._coalesce(event, track):
+            return [NotificationDelivery(
+                event_id=event.id,
+                channel="digest",
+                status="coalesced",
+                timestamp=datetime.utcnow(),
+                reason="grouped into next digest"
+            )]
+        
+        return await self._notify(event, track)
+    
+    async def _notify(self, event: Event, track: bool) -> List[NotificationDelivery]:
+        """Filter, rate-limit and queue one notification (after coalescing)"""
+        
+        # Route by severity and time of day, then apply rate limits
+        routed_channels, reason = self._should_notify(event.severity)
+        
+        if not routed_channels:
             # Record filtered notification
             delivery = NotificationDelivery(
                 event_id=event.id,
@@ -327,7 +897,7 @@ class NotificationManager:
                 timestamp=datetime.utcnow(),
                 reason=reason
             )
-            self.delivery_history.append(delivery)
+            self._record_delivery(delivery)
             logger.debug(f"Notification filtered: {reason}")
             return [delivery]
         
@@ -335,46 +905,264 @@ class NotificationManager:
         title = f"{event.source.upper()}: {event.title}"
         message = event.description
         
-        # Send to all enabled channels
         deliveries = []
+        channel_names = []
         
-        for channel_name, channel in self.channels.items():
-            if not channel.enabled:
-                continue
-            
-            try:
-                success = await channel.send(title, message, event.severity, event.data)
-                
+        for channel_name in routed_channels:
+            if not self._channel_within_limit(channel_name):
                 delivery = NotificationDelivery(
                     event_id=event.id,
                     channel=channel_name,
-                    status="sent" if success else "failed",
+                    status="filtered",
                     timestamp=datetime.utcnow(),
-                    reason=None if success else "channel_error"
+                    reason="channel rate limit exceeded"
                 )
-                
                 deliveries.append(delivery)
-                self.delivery_history.append(delivery)
-                
-                if success:
-                    logger.debug(f"Notification sent via {channel_name}: {event.title}")
-                
-            except Exception as e:
-                logger.error(f"Notification channel {channel_name} failed: {e}")
-                
-                delivery = NotificationDelivery(
+                self._record_delivery(delivery)
+                continue
+            
+            channel_names.append(channel_name)
+        
+        if not channel_names:
+            return deliveries
+        
+        entries = await self.outbox.enqueue(event.id, channel_names, title, message, event.severity, event.data, track)
+        
+        # Budgets count notifications accepted for delivery, not per-channel deliveries
+        self.sent_window.add()
+        if event.severity in self.severity_windows:
+            self.severity_windows[event.severity].add()
+        for channel_name in channel_names:
+            if channel_name in self.channel_windows:
+                self.channel_windows[channel_name].add()
+        
+        if self._dispatcher is not None:
+            self._outbox_ready.set()
+            deliveries.extend(
+                NotificationDelivery(
                     event_id=event.id,
-                    channel=channel_name,
-                    status="failed",
-                    timestamp=datetime.utcnow(),
-                    reason=str(e)
+                    channel=entry.channel,
+                    status="queued",
+                    timestamp=datetime.utcnow()
                 )
-                
-                deliveries.append(delivery)
-                self.delivery_history.append(delivery)
+                for entry in entries
+            )
+            return deliveries
         
+        queued_ids = {entry.id for entry in entries}
+        dispatched = await self.dispatch_pending()
+        deliveries.extend(delivery for entry_id, delivery in dispatched if entry_id in queued_ids)
         return deliveries
     
+    @staticmethod
+    def _digest_key(event: Event) -> tuple:
+        return (event.data.get('repository') or event.source, event.type)
+    
+    async def _coalesce(self, event: Event, track: bool) -> bool:
+        """Hold an event for the digest of its group if the group's window is open
+        
+        Returns False for the first event of a group, which opens a window
+        and is sent normally.
+        """
+        
+        key = self._digest_key(event)
+        
+        if key not in self._digest_timers:
+            loop = asyncio.get_running_loop()
+            self.digest_groups[key] = []
+            self._digest_timers[key] = loop.call_later(self.digest_window, self._close_digest_window, key)
+            return False
+        
+        self.digest_groups[key].append((event, track))
+        self.events_coalesced += 1
+        
+        if track and self.db is not None:
+            try:
+                await self.db.track_notification(event.id, "coalesced", "digest")
+            except Exception as e:
+                logger.warning(f"Could not track notification {event.id}: {e}")
+        
+        return True
+    
+    def _close_digest_window(self, key: tuple):
+        self._digest_timers.pop(key, None)
+        grouped = self.digest_groups.pop(key, [])
+        if grouped:
+            task = asyncio.create_task(self._send_digest(key, grouped))
+            self._digest_tasks.add(task)
+            task.add_done_callback(self._digest_tasks.discard)
+    
+    async def _send_digest(self, key: tuple, grouped: List[tuple]):
+        """Send the events held during one window, as a digest if there are several"""
+        
+        # Delivery outcomes are also reported for the coalesced events' "digest" rows
+        coalesced_ids = [event.id for event, track in grouped if track]
+        
+        try:
+            if len(grouped) == 1:
+                event, track = grouped[0]
+                # A lone follower is sent as itself
+                if coalesced_ids:
+                    event = replace(event, data={**event.data, 'coalesced_event_ids': coalesced_ids})
+                await self._notify(event, track)
+                return
+            
+            digest = self._build_digest(key, [event for event, _ in grouped])
+            digest.data['coalesced_event_ids'] = coalesced_ids
+            await self._notify(digest, track=False)
+            self.digests_sent += 1
+        except Exception as e:
+            logger.error(f"Failed to send notification digest for {key}: {e}")
+    
+    def _build_digest(self, key: tuple, events: List[Event]) -> Event:
+        """Summarise a group of events: counts by severity plus the most severe items"""
+        
+        group, event_type = key
+        rank = {severity: index for index, severity in enumerate(SEVERITY_ORDER)}
+        ordered = sorted(events, key=lambda event: (rank.get(event.severity, len(rank)), event.timestamp))
+        top = ordered[:self.digest_top_items]
+        
+        by_severity: Dict[str, int] = {}
+        for event in events:
+            by_severity[event.severity] = by_severity.get(event.severity, 0) + 1
+        
+        lines = [f"- {event.title}" for event in top]
+        if len(events) > len(top):
+            lines.append(f"... and {len(events) - len(top)} more")
+        
+        return Event(
+            id=f"digest_{events[0].id}_{len(events)}",
+            source=events[0].source,
+            type=f"{event_type}_digest",
+            title=f"{len(events)} more {event_type} events in {group}",
+            description="\n".join(lines),
+            severity=ordered[0].severity,
+            timestamp=datetime.utcnow(),
+            data={
+                'repository': group,
+                'event_type': event_type,
+                'count': len(events),
+                'by_severity': by_severity,
+                'event_ids': [event.id for event in events],
+                'top_items': [
+                    {'id': event.id, 'title': event.title, 'severity': event.severity, 'url': event.data.get('url')}
+                    for event in top
+                ]
+            },
+            requires_action=any(event.requires_action for event in events),
+            suggested_actions=[]
+        )
+    
+    async def flush_digests(self):
+        """Send every pending digest without waiting for its window to close"""
+        
+        for key, timer in list(self._digest_timers.items()):
+            timer.cancel()
+            self._close_digest_window(key)
+        
+        if self._digest_tasks:
+            await asyncio.gather(*self._digest_tasks)
+    
+    async def _dispatch_loop(self):
+        """Drain the outbox whenever entries are queued or a retry falls due"""
+        
+        while True:
+            try:
+                await asyncio.wait_for(self._outbox_ready.wait(), timeout=self.outbox.next_due_in())
+            except asyncio.TimeoutError:
+                pass
+            self._outbox_ready.clear()
+            
+            try:
+                await self.dispatch_pending()
+            except Exception as e:
+                logger.error(f"Notification outbox dispatch failed: {e}")
+                await asyncio.sleep(5)
+    
+    async def dispatch_pending(self) -> List[tuple]:
+        """Send every due outbox entry in concurrent batches
+        
+        Returns ``(entry_id, NotificationDelivery)`` pairs for the attempts made.
+        """
+        
+        results = []
+        
+        async with self._dispatch_lock:
+            while True:
+                batch = self.outbox.due(self.outbox_batch_size)
+                if not batch:
+                    break
+                
+                outcomes = await asyncio.gather(*(self._deliver(entry) for entry in batch))
+                await self.outbox.record_attempts(outcomes)
+                
+                for entry, success, error in outcomes:
+                    if entry.status == 'pending':
+                        status, reason = "failed", f"{error}; retry {entry.attempts}/{self.outbox.max_attempts}"
+                    else:
+                        status, reason = entry.status, error
+                    
+                    delivery = NotificationDelivery(
+                        event_id=entry.event_id,
+                        channel=entry.channel,
+                        status=status,
+                        timestamp=datetime.utcnow(),
+                        reason=reason
+                    )
+                    self._record_delivery(delivery)
+                    results.append((entry.id, delivery))
+                    
+                    if self.db is None:
+                        continue
+                    
+                    tracked = [(entry.event_id, entry.channel)] if entry.track else []
+                    tracked += [(event_id, "digest") for event_id in entry.data.get('coalesced_event_ids', [])]
+                    
+                    for event_id, channel in tracked:
+                        try:
+                            await self.db.track_notification(event_id, "retrying" if entry.status == 'pending' else entry.status, channel)
+                        except Exception as e:
+                            logger.warning(f"Could not track notification {event_id}: {e}")
+        
+        return results
+    
+    async def _deliver(self, entry: OutboxEntry) -> tuple:
+        """Send one outbox entry within its channel's timeout; returns ``(entry, success, error)``"""
+        
+        channel = self.channels.get(entry.channel)
+        if channel is None or not channel.enabled:
+            # Channel removed or disabled since the entry was queued
+            entry.attempts = self.outbox.max_attempts
+            return entry, False, "channel unavailable"
+        
+        timeout = channel.config.get('timeout_seconds', self.channel_timeout)
+        outcomes = self.channel_attempts.setdefault(entry.channel, Counter())
+        started = perf_counter()
+        
+        try:
+            success = await asyncio.wait_for(channel.send(entry.title, entry.message, entry.severity, entry.data), timeout)
+            error = None if success else "channel_error"
+        except asyncio.TimeoutError:
+            logger.warning(f"Notification channel {entry.channel} timed out after {timeout}s")
+            success, error = False, "timeout"
+            outcomes['timeouts'] += 1
+        except Exception as e:
+            logger.error(f"Notification channel {entry.channel} failed: {e}")
+            success, error = False, str(e)
+        
+        outcomes['attempts'] += 1
+        self.send_latency.setdefault(entry.channel, LatencyHistogram()).observe((perf_counter() - started) * 1000)
+        
+        if success:
+            queued_ms = (datetime.now().timestamp() - entry.created_at) * 1000
+            self.delivery_latency.setdefault(entry.channel, LatencyHistogram(DELIVERY_LATENCY_BUCKETS_MS)).observe(queued_ms)
+            self.severity_latency.setdefault(entry.severity, LatencyHistogram(DELIVERY_LATENCY_BUCKETS_MS)).observe(queued_ms)
+            logger.debug(f"Notification sent via {entry.channel}: {entry.title}")
+        else:
+            outcomes['failures'] += 1
+        
+        return entry, success, error
+    
     async def send_action_notification(self, action_result: ActionResult):
         """Send notification about autonomous action result"""
         
@@ -403,7 +1191,7 @@ class NotificationManager:
             suggested_actions=[]
         )
         
-        return await self.send_notification(event)
+        return await self.send_notification(event, track=False)
     
     async def send_human_validation_request(self, event: Event, action_result: ActionResult):
         """Send notification requesting human validation"""
@@ -431,7 +1219,7 @@ class NotificationManager:
             suggested_actions=['review_action']
         )
         
-        return await self.send_notification(validation_event)
+        return await self.send_notification(validation_event, track=False)
     
     async def health_check(self) -> bool:
         """Check notification system health"""
@@ -460,25 +1248,82 @@ class NotificationManager:
             logger.error(f"Notification health check failed: {e}")
             return False
     
-    def get_statistics(self) -> Dict[str, Any]:
-        """Get notification statistics"""
+    def _queue_depths(self) -> Dict[str, Dict[str, int]]:
+        """Outbox entries awaiting dispatch and notifications held inside each channel"""
         
-        now = datetime.utcnow()
-        last_hour = now - timedelta(hours=1)
-        last_day = now - timedelta(days=1)
+        pending = Counter(entry.channel for entry in self.outbox.pending.values())
+        return {
+            name: {'outbox': pending.get(name, 0), 'channel': channel.queue_depth()}
+            for name, channel in self.channels.items()
+        }
+    
+    def get_latency_statistics(self) -> Dict[str, Any]:
+        """Per-channel send/delivery latency, failure and timeout rates, and queue depths"""
         
-        # Count deliveries by time period
-        hour_deliveries = [d for d in self.delivery_history if d.timestamp > last_hour]
-        day_deliveries = [d for d in self.delivery_history if d.timestamp > last_day]
+        queue_depths = self._queue_depths()
+        channels = {}
         
-        # Count by status
-        hour_sent = len([d for d in hour_deliveries if d.status == 'sent'])
-        hour_failed = len([d for d in hour_deliveries if d.status == 'failed'])
-        hour_filtered = len([d for d in hour_deliveries if d.status == 'filtered'])
+        for name in self.channels:
+            outcomes = self.channel_attempts.get(name, Counter())
+            attempts = outcomes['attempts']
+            channels[name] = {
+                'send': self.send_latency[name].to_dict() if name in self.send_latency else None,
+                'enqueue_to_sent': self.delivery_latency[name].to_dict() if name in self.delivery_latency else None,
+                'attempts': attempts,
+                'failure_rate': round(outcomes['failures'] / attempts, 4) if attempts else 0.0,
+                'timeout_rate': round(outcomes['timeouts'] / attempts, 4) if attempts else 0.0,
+                'queue_depth': queue_depths[name]
+            }
         
-        day_sent = len([d for d in day_deliveries if d.status == 'sent'])
-        day_failed = len([d for d in day_deliveries if d.status == 'failed'])
-        day_filtered = len([d for d in day_deliveries if d.status == 'filtered'])
+        return {
+            'channels': channels,
+            'enqueue_to_sent_by_severity': {
+                severity: histogram.to_dict() for severity, histogram in self.severity_latency.items()
+            }
+        }
+    
+    def get_metrics(self) -> List[str]:
+        """Notification metrics in Prometheus text exposition format"""
+        
+        lines = [
+            '# HELP pada_notification_send_duration_seconds Duration of one channel send attempt',
+            '# TYPE pada_notification_send_duration_seconds histogram'
+        ]
+        for name, histogram in self.send_latency.items():
+            lines.extend(histogram.prometheus_lines('pada_notification_send_duration_seconds', {'channel': name}))
+        
+        lines += [
+            '# HELP pada_notification_delivery_latency_seconds Time from enqueue to successful send',
+            '# TYPE pada_notification_delivery_latency_seconds histogram'
+        ]
+        for name, histogram in self.delivery_latency.items():
+            lines.extend(histogram.prometheus_lines('pada_notification_delivery_latency_seconds', {'channel': name}))
+        
+        lines += [
+            '# HELP pada_notification_severity_latency_seconds Time from enqueue to successful send by severity',
+            '# TYPE pada_notification_severity_latency_seconds histogram'
+        ]
+        for severity, histogram in self.severity_latency.items():
+            lines.extend(histogram.prometheus_lines('pada_notification_severity_latency_seconds', {'severity': severity}))
+        
+        for outcome in ('attempts', 'failures', 'timeouts'):
+            metric = f"pada_notification_send_{outcome}_total"
+            lines += [f'# HELP {metric} Channel send {outcome}', f'# TYPE {metric} counter']
+            for name, outcomes in self.channel_attempts.items():
+                lines.append(f'{metric}{{channel="{name}"}} {outcomes[outcome]}')
+        
+        lines += [
+            '# HELP pada_notification_queue_depth Notifications waiting for delivery',
+            '# TYPE pada_notification_queue_depth gauge'
+        ]
+        for name, depths in self._queue_depths().items():
+            for stage, depth in depths.items():
+                lines.append(f'pada_notification_queue_depth{{channel="{name}",stage="{stage}"}} {depth}')
+        
+        return lines
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get notification statistics"""
         
         # Channel statistics
         channel_stats = {}
@@ -489,23 +1334,34 @@ class NotificationManager:
                 'last_delivery': channel.last_delivery.isoformat() if channel.last_delivery else None
             }
         
+        # Delivery counts by time period and status
+        periods = {}
+        for period, counters in self.delivery_counters.items():
+            periods[period] = {status: counter.count() for status, counter in counters.items()}
+            periods[period]['total'] = sum(periods[period].values())
+        
         return {
-            'last_hour': {
-                'sent': hour_sent,
-                'failed': hour_failed,
-                'filtered': hour_filtered,
-                'total': len(hour_deliveries)
-            },
-            'last_day': {
-                'sent': day_sent,
-                'failed': day_failed,
-                'filtered': day_filtered,
-                'total': len(day_deliveries)
-            },
+            **periods,
             'channels': channel_stats,
+            'outbox': self.outbox.get_statistics(),
+            'latency': self.get_latency_statistics(),
+            'digests': {
+                'window_seconds': self.digest_window,
+                'open_groups': len(self._digest_timers),
+                'events_coalesced': self.events_coalesced,
+                'digests_sent': self.digests_sent
+            },
             'rate_limit': {
                 'max_per_hour': self.max_notifications_per_hour,
-                'current_hour_count': hour_sent
+                'current_hour_count': self.sent_window.count(),
+                'channels': {
+                    name: {'max_per_hour': self.channel_rate_limits[name], 'current_hour_count': window.count()}
+                    for name, window in self.channel_windows.items()
+                },
+                'severities': {
+                    severity: {'max_per_hour': self.severity_rate_limits[severity], 'current_hour_count': window.count()}
+                    for severity, window in self.severity_windows.items()
+                }
             },
             'quiet_hours': {
                 'start': self.quiet_start.strftime('%H:%M'),
@@ -517,10 +1373,26 @@ class NotificationManager:
     async def close(self):
         """Close notification manager and cleanup resources"""
         
+        await self.flush_digests()
+        
+        # Undelivered entries stay in the outbox file for the next start
+        if self._dispatcher is not None:
+            self._dispatcher.cancel()
+            try:
+                await self._dispatcher
+            except asyncio.CancelledError:
+                pass
+            self._dispatcher = None
+        
         for channel in self.channels.values():
             if hasattr(channel, 'close'):
                 await channel.close()
         
+        await self.outbox.close()
+        
+        if self._owns_http:
+            await self.http.close()
+        
         logger.info("Notification manager closed")
 
 # Testing
@@ -545,7 +1417,8 @@ async def test_notification_system():
             'LEARNING': False
         },
         'quiet_hours': {'start': '22:00', 'end': '08:00'},
-        'max_notifications_per_hour': 10
+        'max_notifications_per_hour': 10,
+        'outbox_file': None
     }
     
     # Initialize notification manager
@@ -593,6 +1466,145 @@ async def test_notification_system():
         print(f"❌ Test failed: {e}")
         await manager.close()
 
+async def test_desktop_channel():
+    """Test the desktop channel against the fake helper process"""
+    
+    print("🖥️  Testing PADA Desktop Channel")
+    print("=" * 50)
+    
+    import tempfile
+    
+    with tempfile.TemporaryDirectory() as workdir:
+        log_file = Path(workdir) / 'toasts.jsonl'
+        fake_helper = Path(__file__).with_name('fake_desktop_notifier.py')
+        
+        channel = DesktopChannel('desktop', {
+            'helper_command': [sys.executable, str(fake_helper), '--log', str(log_file), '--exit-after', '3'],
+            'max_toasts_per_minute': 120,
+            'toast_burst': 3
+        })
+        
+        try:
+            # Acknowledgements: one helper answers each toast in order
+            acked = await channel.send("First", "Acknowledged", "HELPFUL")
+            rejected = await channel.send("Please reject", "Failed acknowledgement", "HELPFUL")
+            first_pid = channel._helper.pid
+            print(f"📨 Acks: {'✅' if acked and not rejected else '❌'} (ok={acked}, rejected={not rejected})")
+            
+            # Restart: the fake helper exits after its third toast, the next toast starts a new one
+            await channel.send("Third", "Helper exits after this", "HELPFUL")
+            await channel._reader
+            restarted = await channel.send("Fourth", "Shown by a new helper", "IMPORTANT")
+            print(f"🔁 Restart: {'✅' if restarted and channel._helper.pid != first_pid else '❌'}")
+            
+            # Digest: a burst beyond the token bucket is shown as one toast
+            channel._tokens = 0.0
+            burst = await asyncio.gather(*(
+                channel.send(f"Burst {index}", "Held for a digest", "HELPFUL") for index in range(3)
+            ))
+            digest_ok = all(burst) and channel.digests_shown == 1
+            print(f"📦 Digest: {'✅' if digest_ok else '❌'} ({channel.digests_shown} digest toasts)")
+        finally:
+            await channel.close()
+        
+        titles = [json.loads(line)['title'] for line in log_file.read_text().splitlines()]
+        print(f"🪟 Helper received {len(titles)} toasts: {titles}")
+
+async def test_webhook_channel():
+    """Test batched webhook delivery against a local HTTP sink"""
+    
+    print("🪝 Testing PADA Webhook Channel")
+    print("=" * 50)
+    
+    from aiohttp import web
+    
+    received = []
+    
+    async def sink(request):
+        """Decode a delivery; with ?mode=results, reject items whose title contains 'reject'"""
+        
+        body = await request.read()
+        if body[:2] == b'\x1f\x8b':
+            body = gzip.decompress(body)
+        
+        if request.content_type == 'application/x-ndjson':
+            items = [json.loads(line) for line in body.decode('utf-8').splitlines() if line]
+        else:
+            items = json.loads(body)
+        
+        received.append({
+            'content_type': request.content_type,
+            'content_encoding': request.headers.get('Content-Encoding'),
+            'items': items
+        })
+        
+        if request.query.get('mode') == 'results':
+            return web.json_response({'results': [{'ok': 'reject' not in item['title']} for item in items]})
+        return web.json_response({'status': 'ok'})
+    
+    app = web.Application()
+    app.router.add_post('/hook', sink)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    url = f"http://127.0.0.1:{runner.addresses[0][1]}/hook"
+    
+    http = HTTPClientFactory()
+    checks = {}
+    
+    async def send_batch(config: Dict[str, Any], titles: List[str]) -> List[bool]:
+        channel = WebhookChannel('webhook', {'batch_size': len(titles), **config}, http)
+        try:
+            return list(await asyncio.gather(*(channel.send(title, "Batched", "HELPFUL") for title in titles)))
+        finally:
+            await channel.close()
+    
+    try:
+        # JSON array: one request carrying every item
+        results = await send_batch({'url': url}, ["One", "Two", "Three"])
+        request = received[-1]
+        checks['JSON array batch'] = (
+            all(results) and len(received) == 1
+            and request['content_type'] == 'application/json' and len(request['items']) == 3
+        )
+        
+        # NDJSON, gzip-compressed
+        results = await send_batch({'url': url, 'batch_format': 'ndjson', 'gzip': True, 'gzip_min_bytes': 0},
+                                   ["Four", "Five", "Six"])
+        request = received[-1]
+        checks['gzipped NDJSON batch'] = (
+            all(results) and request['content_type'] == 'application/x-ndjson'
+            and request['content_encoding'] == 'gzip' and [item['title'] for item in request['items']] == ["Four", "Five", "Six"]
+        )
+        
+        # Per-item acknowledgements
+        results = await send_batch({'url': f"{url}?mode=results"}, ["Seven", "Please reject", "Nine"])
+        checks['per-item results'] = results == [True, False, True]
+        
+        # A held item whose send timed out (as in _deliver) is never POSTed
+        channel = WebhookChannel('webhook', {'url': url, 'batch_size': 3, 'batch_interval_ms': 200,
+                                             'timeout_seconds': 0.05}, http)
+        try:
+            timed_out = asyncio.wait_for(channel.send("Timed out", "Batched", "HELPFUL"), channel.config['timeout_seconds'])
+            results = await asyncio.gather(timed_out, channel.send("Kept", "Batched", "HELPFUL"), return_exceptions=True)
+        finally:
+            await channel.close()
+        checks['timed-out item not sent'] = (
+            isinstance(results[0], asyncio.TimeoutError) and results[1] is True
+            and [item['title'] for item in received[-1]['items']] == ["Kept"]
+        )
+    finally:
+        await http.close()
+        await runner.cleanup()
+    
+    for name, passed in checks.items():
+        print(f"   {'✅' if passed else '❌'} {name}")
+    
+    return all(checks.values())
+
 if __name__ == "__main__":
     import asyncio
-    asyncio.run(test_notification_system())
\ No newline at end of file
+    asyncio.run(test_notification_system())
+    asyncio.run(test_desktop_channel())
+    asyncio.run(test_webhook_channel())
\ No newline at end of file
@@ -8,21 +8,25 @@ import asyncio
 import logging
 from datetime import datetime
 from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict
+from dataclasses import asdict
 from pathlib import Path
 import json
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Request
+from fastapi.responses import PlainTextResponse
 from pydantic import BaseModel
 import uvicorn
 
 # Import our modules
-from .database import PADADatabase
+from .models import Event, ActionResult
+from .database import create_database
 from .rep_integration import REPValidator
 from .github_monitor import GitHubMonitor
 from .notification_system import NotificationManager
 from .learning_engine import PreferenceLearner
 from .autonomous_actions import ActionExecutor
+from .retention import RetentionManager
+from .http_client import HTTPClientFactory
 
 # Configuration
 from .config import PADAConfig
@@ -34,31 +38,6 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-@dataclass
-class Event:
-    """Core event structure for PADA"""
-    id: str
-    source: str
-    type: str
-    title: str
-    description: str
-    severity: str  # CRITICAL, IMPORTANT, HELPFUL, LEARNING
-    timestamp: datetime
-    data: Dict[str, Any]
-    requires_action: bool
-    suggested_actions: List[str]
-
-@dataclass
-class ActionResult:
-    """Result of an autonomous action"""
-    action_id: str
-    action_type: str
-    success: bool
-    rep_score: float
-    human_validation_needed: bool
-    details: Dict[str, Any]
-    timestamp: datetime
-
 class PADAService:
     """Main PADA service orchestrator"""
     
@@ -66,12 +45,20 @@ class PADAService:
         self.config = PADAConfig.load(config_path)
         
         # Initialize components
-        self.db = PADADatabase(self.config.database_url)
-        self.rep_validator = REPValidator(self.config.rep_config)
-        self.github_monitor = GitHubMonitor(self.config.github_config)
-        self.notification_manager = NotificationManager(self.config.notification_config)
-        self.preference_learner = PreferenceLearner(self.db)
-        self.action_executor = ActionExecutor(self.config.action_config, self.rep_validator)
+        self.db = create_database(
+            self.config.database_url,
+            health_retention_days=self.config.database_config.health_retention_days,
+            max_connections=self.config.database_config.max_connections,
+            connection_timeout=self.config.database_config.connection_timeout,
+            command_timeout=self.config.database_config.command_timeout
+        )
+        self.http = HTTPClientFactory(asdict(self.config.http_config))
+        self.rep_validator = REPValidator(asdict(self.config.rep_config))
+        self.github_monitor = GitHubMonitor(asdict(self.config.github_config), self.http)
+        self.notification_manager = NotificationManager(asdict(self.config.notification_config), self.http, self.db)
+        self.preference_learner = PreferenceLearner(self.db, asdict(self.config.learning_config))
+        self.action_executor = ActionExecutor(asdict(self.config.action_config), self.rep_validator, self.http)
+        self.retention_manager = RetentionManager(self.db, asdict(self.config.retention_config))
         
         # Service state
         self.is_running = False
@@ -87,14 +74,17 @@ class PADAService:
         
         # Initialize database
         await self.db.initialize()
+        await self.preference_learner.load()
         
         # Start monitoring services
         await self.github_monitor.start()
+        await self.notification_manager.start()
         
         # Start background tasks
         asyncio.create_task(self.event_processor())
         asyncio.create_task(self.learning_updater())
         asyncio.create_task(self.health_monitor())
+        asyncio.create_task(self.retention_worker())
         
         self.is_running = True
         logger.info("PADA service started successfully")
@@ -107,6 +97,17 @@ class PADAService:
         
         # Stop monitoring services
         await self.github_monitor.stop()
+        await self.notification_manager.close()
+        await self.action_executor.close()
+        
+        # Keep feedback received since the last learning update
+        try:
+            await self.preference_learner.update_model()
+        except Exception as e:
+            logger.error(f"Could not save learned preferences: {e}")
+        
+        # Close shared HTTP connections once no component can use them
+        await self.http.close()
         
         # Close database connections
         await self.db.close()
@@ -126,11 +127,8 @@ class PADAService:
         should_notify = await self.preference_learner.should_notify(event)
         
         if should_notify:
-            # Send notification
+            # Queue notification; delivery outcomes are tracked for learning by the outbox dispatcher
             await self.notification_manager.send_notification(event)
-            
-            # Track notification for learning
-            await self.db.track_notification(event.id, "sent")
         
         # Check if autonomous action is needed and safe
         if event.requires_action and len(event.suggested_actions) > 0:
@@ -207,6 +205,20 @@ class PADAService:
         
         return action_result
     
+    async def process_webhook_events(self, events: List[Event], delivery_id: Optional[str]):
+        """Process the events of one webhook delivery, then record them as seen"""
+        
+        processed = []
+        try:
+            for event in events:
+                await self.process_event(event)
+                processed.append(event)
+        except Exception as e:
+            logger.error(f"Error processing GitHub webhook delivery {delivery_id}: {e}")
+        finally:
+            self.github_monitor.commit_webhook(delivery_id, processed, complete=len(processed) == len(events))
+            await self.github_monitor.save_poll_state()
+    
     async def event_processor(self):
         """Background task to process events continuously"""
         
@@ -219,12 +231,19 @@ class PADAService:
                 github_events = await self.github_monitor.get_new_events()
                 new_events.extend(github_events)
                 
-                # Process each event
-                for event in new_events:
-                    await self.process_event(event)
+                # Process each event; only processed events are marked seen, and
+                # poll cursors advance only once the whole batch is processed
+                processed = []
+                try:
+                    for event in new_events:
+                        await self.process_event(event)
+                        processed.append(event)
+                finally:
+                    self.github_monitor.commit_events(processed, complete=len(processed) == len(new_events))
+                    await self.github_monitor.save_poll_state()
                 
-                # Sleep between checks
-                await asyncio.sleep(self.config.polling_interval)
+                # Sleep until the next repository is due (polling_interval at most)
+                await asyncio.sleep(self.github_monitor.next_poll_delay(self.config.polling_interval))
                 
             except Exception as e:
                 logger.error(f"Error in event processor: {e}")
@@ -263,8 +282,9 @@ class PADAService:
                 # Log health status
                 logger.info(f"PADA Health: {health_status}")
                 
-                # Store health metrics
+                # Store health metrics and drop samples past their retention window
                 await self.db.store_health_metrics(health_status)
+                await self.db.prune_health_series()
                 
                 # Sleep for health check interval
                 await asyncio.sleep(self.config.health_check_interval)
@@ -272,6 +292,23 @@ class PADAService:
             except Exception as e:
                 logger.error(f"Error in health monitor: {e}")
                 await asyncio.sleep(300)  # 5 minute sleep on error
+    
+    async def retention_worker(self):
+        """Background task to archive expired rows and compact the database"""
+        
+        while self.is_running:
+            try:
+                result = await self.retention_manager.run_cycle()
+                
+                if result['archived'] or result['pages_reclaimed']:
+                    logger.info(f"Retention cycle: {result}")
+                
+                # Sleep for retention interval
+                await asyncio.sleep(self.config.retention_config.interval_seconds)
+                
+            except Exception as e:
+                logger.error(f"Error in retention worker: {e}")
+                await asyncio.sleep(3600)  # 1 hour sleep on error
 
 # FastAPI app for REST API and webhooks
 app = FastAPI(title="PADA - Personal AI Development Assistant", version="1.0.0")
@@ -328,6 +365,44 @@ async def create_event(event_request: EventRequest, background_tasks: Background
     
     return {"status": "accepted", "event_id": event.id}
 
+@app.post("/webhooks/github")
+async def github_webhook(request: Request, background_tasks: BackgroundTasks):
+    """Accept GitHub webhook deliveries signed with the configured secret"""
+    
+    if not pada_service:
+        raise HTTPException(status_code=503, detail="PADA service not ready")
+    
+    if not pada_service.github_monitor.webhook_secret:
+        raise HTTPException(status_code=403, detail="GitHub webhooks not configured")
+    
+    body = await request.body()
+    
+    if not pada_service.github_monitor.verify_webhook(body, request.headers.get('X-Hub-Signature-256')):
+        raise HTTPException(status_code=401, detail="Invalid webhook signature")
+    
+    try:
+        payload = json.loads(body)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Webhook payload is not valid JSON")
+    
+    events = pada_service.github_monitor.handle_webhook(
+        request.headers.get('X-GitHub-Event', ''),
+        payload,
+        delivery_id=request.headers.get('X-GitHub-Delivery')
+    )
+    
+    # Process in background; events are marked seen only once processed
+    if events:
+        background_tasks.add_task(
+            pada_service.process_webhook_events, events, request.headers.get('X-GitHub-Delivery')
+        )
+    
+    return {
+        "status": "accepted",
+        "delivery_id": request.headers.get('X-GitHub-Delivery'),
+        "event_ids": [event.id for event in events]
+    }
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
@@ -352,6 +427,50 @@ async def get_stats():
     stats = await pada_service.db.get_statistics()
     return stats
 
+@app.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics():
+    """Notification and HTTP latency metrics in Prometheus text format"""
+    
+    if not pada_service:
+        raise HTTPException(status_code=503, detail="PADA service not ready")
+    
+    lines = pada_service.notification_manager.get_metrics()
+    
+    lines += [
+        '# HELP pada_http_request_duration_seconds Outbound HTTP request duration',
+        '# TYPE pada_http_request_duration_seconds histogram'
+    ]
+    for host, histogram in pada_service.http.latency.items():
+        lines.extend(histogram.prometheus_lines('pada_http_request_duration_seconds', {'host': host}))
+    
+    return PlainTextResponse('\n'.join(lines) + '\n', media_type='text/plain; version=0.0.4')
+
+@app.get("/events")
+async def list_events(limit: int = 50, event_type: Optional[str] = None, severity: Optional[str] = None,
+                      repository: Optional[str] = None,
+                      before_timestamp: Optional[str] = None, before_id: Optional[str] = None):
+    """Browse stored events newest first using keyset pagination"""
+    
+    if not pada_service:
+        raise HTTPException(status_code=503, detail="PADA service not ready")
+    
+    cursor = (before_timestamp, before_id) if before_timestamp and before_id else None
+    events = await pada_service.db.get_events(
+        limit=min(limit, 500),
+        event_type=event_type,
+        severity=severity,
+        cursor=cursor,
+        projection='summary',
+        data_filters={'repository': repository} if repository else None
+    )
+    
+    next_cursor = pada_service.db.event_cursor(events[-1]) if events else None
+    
+    return {
+        "events": [asdict(event) for event in events],
+        "next_cursor": {"before_timestamp": next_cursor[0], "before_id": next_cursor[1]} if next_cursor else None
+    }
+
 @app.post("/feedback")
 async def user_feedback(event_id: str, feedback_type: str, helpful: bool):
     """User feedback for learning"""
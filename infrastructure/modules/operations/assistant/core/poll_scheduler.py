@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+PADA Poll Scheduler - Rate-limit-aware adaptive polling for GitHub repositories
+Budgets API requests across repositories by priority and recent activity
+"""
+
+import logging
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Any, Mapping
+
+logger = logging.getLogger(__name__)
+
+PRIORITY_ORDER = {'HIGH': 0, 'MEDIUM': 1, 'LOW': 2}
+
+@dataclass
+class RepositorySchedule:
+    """Polling state for one repository"""
+    full_name: str
+    priority: str
+    requests_per_poll: int
+    base_interval: float
+    interval: float
+    next_poll_at: float
+    adaptive: bool = True
+    last_event_count: int = 0
+    polls: int = 0
+
+class PollScheduler:
+    """Decides which repositories are due for polling
+    
+    Each repository starts at its priority's interval. Polls that return
+    events shorten the interval (down to ``min_poll_interval_seconds``);
+    quiet polls lengthen it (up to ``max_poll_interval_seconds``). All
+    intervals are stretched when the remaining GitHub rate limit would not
+    last until the reset time at the planned request rate.
+    """
+    
+    def __init__(self, github_config: Dict[str, Any]):
+        self.priority_intervals = github_config.get('priority_intervals') or {
+            'HIGH': 60,
+            'MEDIUM': 300,
+            'LOW': 900
+        }
+        self.min_interval = github_config.get('min_poll_interval_seconds', 30)
+        self.max_interval = github_config.get('max_poll_interval_seconds', 1800)
+        self.rate_limit_reserve = github_config.get('rate_limit_reserve', 100)
+        self.speedup_factor = 0.5
+        self.backoff_factor = 1.5
+        
+        self.schedules: Dict[str, RepositorySchedule] = {}
+        
+        # Latest rate limit information from response headers
+        self.rate_limit: Optional[int] = None
+        self.rate_remaining: Optional[int] = None
+        self.rate_reset_at: Optional[float] = None
+        self.blocked_until = 0.0
+        self.pressure = 1.0
+    
+    def register(self, full_name: str, priority: str, requests_per_poll: int, interval: Optional[float] = None):
+        """Add a repository; it is due immediately
+        
+        A fixed ``interval`` (used for webhook reconciliation sweeps) replaces
+        the priority interval and is not adapted to activity.
+        """
+        
+        base_interval = interval or self.priority_intervals.get(priority, self.priority_intervals.get('MEDIUM', 300))
+        
+        self.schedules[full_name] = RepositorySchedule(
+            full_name=full_name,
+            priority=priority,
+            requests_per_poll=max(requests_per_poll, 1),
+            base_interval=base_interval,
+            interval=base_interval,
+            next_poll_at=time.time(),
+            adaptive=interval is None
+        )
+    
+    def update_rate_limit(self, headers: Mapping[str, str], status: int = 200):
+        """Record rate limit headers from any GitHub API response"""
+        
+        now = time.time()
+        
+        try:
+            if 'X-RateLimit-Limit' in headers:
+                self.rate_limit = int(headers['X-RateLimit-Limit'])
+            if 'X-RateLimit-Remaining' in headers:
+                self.rate_remaining = int(headers['X-RateLimit-Remaining'])
+            if 'X-RateLimit-Reset' in headers:
+                self.rate_reset_at = float(headers['X-RateLimit-Reset'])
+        except ValueError:
+            logger.debug(f"Unparseable rate limit headers: {dict(headers)}")
+        
+        # Primary limit exhausted or secondary limit hit - stop until GitHub says otherwise.
+        # Any other 403 is a permission error for that endpoint alone.
+        retry_after = headers.get('Retry-After')
+        exhausted = headers.get('X-RateLimit-Remaining') == '0'
+        
+        if status == 429 or (status == 403 and (retry_after or exhausted)):
+            if retry_after and retry_after.isdigit():
+                self.blocked_until = now + int(retry_after)
+            elif self.rate_remaining == 0 and self.rate_reset_at:
+                self.blocked_until = self.rate_reset_at
+            else:
+                self.blocked_until = now + 60
+            
+            logger.warning(f"GitHub rate limit hit - pausing polls for {self.blocked_until - now:.0f}s")
+    
+    def _update_pressure(self, now: float):
+        """Compute how much intervals must stretch to fit the remaining budget"""
+        
+        self.pressure = 1.0
+        
+        # The window has reset since the last response; the old count no longer applies
+        if self.rate_reset_at and self.rate_reset_at <= now:
+            self.rate_remaining = None
+            self.rate_reset_at = None
+        
+        if self.rate_remaining is None or not self.rate_reset_at:
+            return
+        
+        available = self.rate_remaining - self.rate_limit_reserve
+        if available <= 0:
+            self.pressure = float('inf')
+            return
+        
+        planned_rate = sum(s.requests_per_poll / s.interval for s in self.schedules.values())
+        allowed_rate = available / (self.rate_reset_at - now)
+        
+        if planned_rate > allowed_rate:
+            self.pressure = planned_rate / allowed_rate
+    
+    def due_repositories(self) -> List[str]:
+        """Get repositories to poll now, highest priority and most overdue first"""
+        
+        now = time.time()
+        
+        if now < self.blocked_until:
+            return []
+        
+        self._update_pressure(now)
+        
+        if self.pressure == float('inf'):
+            logger.warning(f"GitHub rate limit reserve reached ({self.rate_remaining} remaining) - waiting for reset")
+            self.blocked_until = self.rate_reset_at
+            return []
+        
+        due = sorted(
+            (s for s in self.schedules.values() if s.next_poll_at <= now),
+            key=lambda s: (PRIORITY_ORDER.get(s.priority, 1), s.next_poll_at)
+        )
+        
+        # Never plan more requests this cycle than the budget above the reserve
+        if self.rate_remaining is not None:
+            budget = self.rate_remaining - self.rate_limit_reserve
+            selected = []
+            for schedule in due:
+                if schedule.requests_per_poll > budget:
+                    break
+                budget -= schedule.requests_per_poll
+                selected.append(schedule)
+            due = selected
+        
+        return [schedule.full_name for schedule in due]
+    
+    def record_poll(self, full_name: str, event_count: int):
+        """Adapt a repository's interval to its activity and schedule its next poll"""
+        
+        schedule = self.schedules[full_name]
+        now = time.time()
+        
+        if schedule.adaptive:
+            if event_count > 0:
+                schedule.interval = max(self.min_interval, schedule.interval * self.speedup_factor)
+            else:
+                schedule.interval = min(self.max_interval, schedule.interval * self.backoff_factor)
+        
+        schedule.last_event_count = event_count
+        schedule.polls += 1
+        schedule.next_poll_at = now + schedule.interval * self.pressure
+    
+    def next_poll_delay(self, default: float) -> float:
+        """Seconds until the next repository is due, capped at ``default``"""
+        
+        if not self.schedules:
+            return default
+        
+        now = time.time()
+        next_due = min(s.next_poll_at for s in self.schedules.values())
+        next_due = max(next_due, self.blocked_until)
+        
+        return max(1.0, min(default, next_due - now))
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get scheduler statistics"""
+        
+        now = time.time()
+        
+        return {
+            'rate_limit': {
+                'limit': self.rate_limit,
+                'remaining': self.rate_remaining,
+                'reset_in_seconds': round(self.rate_reset_at - now) if self.rate_reset_at else None,
+                'reserve': self.rate_limit_reserve
+            },
+            'pressure': self.pressure,
+            'blocked_for_seconds': max(0, round(self.blocked_until - now)),
+            'repositories': {
+                name: {
+                    'priority': s.priority,
+                    'interval_seconds': round(s.interval),
+                    'next_poll_in_seconds': max(0, round(s.next_poll_at - now)),
+                    'last_event_count': s.last_event_count,
+                    'polls': s.polls
+                } for name, s in self.schedules.items()
+            }
+        }
@@ -0,0 +1,727 @@
+#!/usr/bin/env python3
+"""
+PADA PostgreSQL Backend - Pooled asyncpg storage for multi-worker deployments
+Implements the PADA storage API on PostgreSQL with JSONB payload columns
+"""
+
+import asyncpg
+import json
+import logging
+import uuid
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Any, Tuple
+
+# Import PADA core types
+from .models import Event, ActionResult
+from .database import DatabaseBackend, HEALTH_RESOLUTIONS, INDEXED_EVENT_FIELDS, RETENTION_TABLES
+
+logger = logging.getLogger(__name__)
+
+EVENT_COLUMNS = [
+    'id', 'source', 'type', 'title', 'description', 'severity',
+    'timestamp', 'data', 'requires_action', 'suggested_actions'
+]
+
+def _utc(value: datetime) -> datetime:
+    """Treat naive datetimes as UTC, as the rest of PADA does"""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+def _data_field_expression(field: str) -> str:
+    """SQL expression for an indexed events.data key, matching its index definition"""
+    if INDEXED_EVENT_FIELDS[field] == 'integer':
+        return f"((data->>'{field}')::bigint)"
+    return f"(data->>'{field}')"
+
+def _row_count(status: str) -> int:
+    """Extract the row count from an asyncpg command status (e.g. 'DELETE 5')"""
+    try:
+        return int(status.split()[-1])
+    except (ValueError, IndexError):
+        return 0
+
+class PostgresDatabase(DatabaseBackend):
+    """Async PostgreSQL database for PADA data storage
+    
+    Uses an asyncpg connection pool shared by all workers of the process.
+    asyncpg prepares every parameterised statement server-side and caches it
+    per connection, so hot-path inserts are parsed and planned once.
+    """
+    
+    def __init__(self, database_url: str, health_retention_days: Optional[Dict[str, float]] = None,
+                 max_connections: int = 10, connection_timeout: int = 30,
+                 command_timeout: Optional[float] = 60, statement_cache_size: int = 256):
+        super().__init__(database_url, health_retention_days)
+        
+        self.max_connections = max_connections
+        self.connection_timeout = connection_timeout  # establishing a connection
+        self.command_timeout = command_timeout  # each statement; None disables
+        self.statement_cache_size = statement_cache_size
+        self.pool: Optional[asyncpg.Pool] = None
+        
+        logger.info(f"PADA PostgreSQL database configured (pool size {max_connections})")
+    
+    async def initialize(self):
+        """Create connection pool and schema"""
+        
+        logger.info("Initializing PADA PostgreSQL database...")
+        
+        self.pool = await asyncpg.create_pool(
+            self.database_url,
+            min_size=1,
+            max_size=self.max_connections,
+            timeout=self.connection_timeout,
+            command_timeout=self.command_timeout,
+            statement_cache_size=self.statement_cache_size
+        )
+        
+        async with self.pool.acquire() as conn:
+            async with conn.transaction():
+                await self._create_tables(conn)
+                await self._create_indexes(conn)
+        
+        logger.info("PADA PostgreSQL database initialized successfully")
+    
+    async def _create_tables(self, conn: asyncpg.Connection):
+        """Create all database tables"""
+        
+        await conn.execute('''
+            CREATE TABLE IF NOT EXISTS events (
+                id TEXT PRIMARY KEY,
+                source TEXT NOT NULL,
+                type TEXT NOT NULL,
+                title TEXT NOT NULL,
+                description TEXT,
+                severity TEXT NOT NULL,
+                timestamp TIMESTAMPTZ NOT NULL,
+                data JSONB,
+                requires_action BOOLEAN DEFAULT FALSE,
+                suggested_actions JSONB,
+                processed_at TIMESTAMPTZ DEFAULT NOW()
+            )
+        ''')
+        
+        await conn.execute('''
+            CREATE TABLE IF NOT EXISTS action_results (
+                action_id TEXT PRIMARY KEY,
+                event_id TEXT REFERENCES events (id),
+                action_type TEXT NOT NULL,
+                success BOOLEAN NOT NULL,
+                rep_score DOUBLE PRECISION NOT NULL,
+                human_validation_needed BOOLEAN DEFAULT FALSE,
+                details JSONB,
+                timestamp TIMESTAMPTZ NOT NULL
+            )
+        ''')
+        
+        await conn.execute('''
+            CREATE TABLE IF NOT EXISTS notifications (
+                id TEXT PRIMARY KEY,
+                event_id TEXT NOT NULL REFERENCES events (id),
+                channel TEXT NOT NULL,
+                status TEXT NOT NULL,
+                sent_at TIMESTAMPTZ DEFAULT NOW(),
+                delivered_at TIMESTAMPTZ,
+                user_action TEXT
+            )
+        ''')
+        
+        await conn.execute('''
+            CREATE TABLE IF NOT EXISTS user_feedback (
+                id TEXT PRIMARY KEY,
+                event_id TEXT REFERENCES events (id),
+                action_id TEXT REFERENCES action_results (action_id),
+                feedback_type TEXT NOT NULL,
+                helpful BOOLEAN NOT NULL,
+                rating INTEGER,
+                comment TEXT,
+                timestamp TIMESTAMPTZ DEFAULT NOW()
+            )
+        ''')
+        
+        await conn.execute('''
+            CREATE TABLE IF NOT EXISTS learning_patterns (
+                id TEXT PRIMARY KEY,
+                pattern_type TEXT NOT NULL,
+                pattern_data JSONB NOT NULL,
+                confidence_score DOUBLE PRECISION NOT NULL,
+                created_at TIMESTAMPTZ DEFAULT NOW(),
+                updated_at TIMESTAMPTZ DEFAULT NOW(),
+                times_applied INTEGER DEFAULT 0,
+                success_rate DOUBLE PRECISION DEFAULT 0.0
+            )
+        ''')
+        
+        await conn.execute('''
+            CREATE TABLE IF NOT EXISTS health_series (
+                component TEXT NOT NULL,
+                resolution INTEGER NOT NULL,
+                bucket BIGINT NOT NULL,
+                sample_count INTEGER NOT NULL,
+                value_sum DOUBLE PRECISION NOT NULL,
+                value_min DOUBLE PRECISION NOT NULL,
+                value_max DOUBLE PRECISION NOT NULL,
+                value_last DOUBLE PRECISION NOT NULL,
+                critical_count INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (component, resolution, bucket)
+            )
+        ''')
+        
+        await conn.execute('''
+            CREATE TABLE IF NOT EXISTS statistics (
+                id TEXT PRIMARY KEY,
+                stat_type TEXT NOT NULL,
+                stat_date DATE NOT NULL,
+                stat_data JSONB NOT NULL,
+                created_at TIMESTAMPTZ DEFAULT NOW()
+            )
+        ''')
+    
+    async def _create_indexes(self, conn: asyncpg.Connection):
+        """Create database indexes for performance"""
+        
+        # Events indexes - same composite keyset layout as the SQLite backend
+        await conn.execute('CREATE INDEX IF NOT EXISTS idx_events_ts_id ON events (timestamp, id)')
+        await conn.execute('CREATE INDEX IF NOT EXISTS idx_events_type_ts ON events (type, timestamp, id)')
+        await conn.execute('CREATE INDEX IF NOT EXISTS idx_events_severity_ts ON events (severity, timestamp, id)')
+        await conn.execute('CREATE INDEX IF NOT EXISTS idx_events_type_severity_ts ON events (type, severity, timestamp, id)')
+        await conn.execute('CREATE INDEX IF NOT EXISTS idx_events_source ON events (source)')
+        
+        # Expression indexes on hot events.data keys
+        for field in INDEXED_EVENT_FIELDS:
+            await conn.execute(
+                f'CREATE INDEX IF NOT EXISTS idx_events_data_{field} '
+                f'ON events ({_data_field_expression(field)}, timestamp, id)'
+            )
+        
+        # Action results indexes
+        await conn.execute('CREATE INDEX IF NOT EXISTS idx_actions_timestamp ON action_results (timestamp)')
+        await conn.execute('CREATE INDEX IF NOT EXISTS idx_actions_type ON action_results (action_type)')
+        await conn.execute('CREATE INDEX IF NOT EXISTS idx_actions_event ON action_results (event_id)')
+        
+        # Notifications indexes
+        await conn.execute('CREATE INDEX IF NOT EXISTS idx_notifications_sent_at ON notifications (sent_at)')
+        await conn.execute('CREATE INDEX IF NOT EXISTS idx_notifications_status ON notifications (status)')
+        await conn.execute('CREATE INDEX IF NOT EXISTS idx_notifications_event ON notifications (event_id)')
+        
+        # Feedback indexes
+        await conn.execute('CREATE INDEX IF NOT EXISTS idx_feedback_timestamp ON user_feedback (timestamp)')
+        await conn.execute('CREATE INDEX IF NOT EXISTS idx_feedback_type ON user_feedback (feedback_type)')
+        await conn.execute('CREATE INDEX IF NOT EXISTS idx_feedback_event ON user_feedback (event_id)')
+        await conn.execute('CREATE INDEX IF NOT EXISTS idx_feedback_action ON user_feedback (action_id)')
+        
+        # Health series index for retention sweeps
+        await conn.execute('CREATE INDEX IF NOT EXISTS idx_health_series_bucket ON health_series (resolution, bucket)')
+    
+    def _event_record(self, event: Event) -> Tuple:
+        """Convert an event to a row tuple in EVENT_COLUMNS order"""
+        return (
+            event.id,
+            event.source,
+            event.type,
+            event.title,
+            event.description,
+            event.severity,
+            _utc(event.timestamp),
+            json.dumps(event.data) if event.data else None,
+            event.requires_action,
+            json.dumps(event.suggested_actions) if event.suggested_actions else None
+        )
+    
+    async def store_event(self, event: Event):
+        """Store an event in the database"""
+        
+        await self.pool.execute('''
+            INSERT INTO events (
+                id, source, type, title, description, severity,
+                timestamp, data, requires_action, suggested_actions
+            ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10)
+        ''', *self._event_record(event))
+        
+        logger.debug(f"Stored event: {event.id}")
+    
+    async def store_events(self, events: List[Event]) -> int:
+        """Bulk-store events with COPY, skipping ids already stored
+        
+        Rows are streamed into a transaction-scoped staging table with the
+        binary COPY protocol and merged with ON CONFLICT DO NOTHING, so a
+        single duplicate does not abort the batch.
+        """
+        
+        if not events:
+            return 0
+        
+        async with self.pool.acquire() as conn:
+            async with conn.transaction():
+                await conn.execute(
+                    'CREATE TEMP TABLE events_staging (LIKE events INCLUDING DEFAULTS) ON COMMIT DROP'
+                )
+                await conn.copy_records_to_table(
+                    'events_staging',
+                    records=[self._event_record(event) for event in events],
+                    columns=EVENT_COLUMNS
+                )
+                status = await conn.execute(
+                    'INSERT INTO events SELECT * FROM events_staging ON CONFLICT (id) DO NOTHING'
+                )
+        
+        inserted = _row_count(status)
+        logger.debug(f"Stored {inserted}/{len(events)} events")
+        return inserted
+    
+    async def store_action_result(self, action_result: ActionResult):
+        """Store an action result in the database"""
+        
+        await self.pool.execute('''
+            INSERT INTO action_results (
+                action_id, action_type, success, rep_score,
+                human_validation_needed, details, timestamp
+            ) VALUES ($1, $2, $3, $4, $5, $6, $7)
+        ''',
+            action_result.action_id,
+            action_result.action_type,
+            action_result.success,
+            action_result.rep_score,
+            action_result.human_validation_needed,
+            json.dumps(action_result.details) if action_result.details else None,
+            _utc(action_result.timestamp)
+        )
+        
+        logger.debug(f"Stored action result: {action_result.action_id}")
+    
+    async def track_notification(self, event_id: str, status: str, channel: str = "default"):
+        """Track notification delivery status; one row per event and channel"""
+        
+        notification_id = f"notif_{event_id}_{channel}"
+        
+        await self.pool.execute('''
+            INSERT INTO notifications (id, event_id, channel, status, delivered_at)
+            VALUES ($1, $2, $3, $4, CASE WHEN $4 = 'sent' THEN NOW() END)
+            ON CONFLICT (id) DO UPDATE SET
+                status = excluded.status,
+                delivered_at = COALESCE(excluded.delivered_at, notifications.delivered_at)
+        ''', notification_id, event_id, channel, status)
+        
+        logger.debug(f"Tracked notification: {notification_id}")
+    
+    async def store_user_feedback(self, event_id: str, feedback_type: str, helpful: bool,
+                                action_id: Optional[str] = None, rating: Optional[int] = None,
+                                comment: Optional[str] = None):
+        """Store user feedback for learning"""
+        
+        feedback_id = str(uuid.uuid4())
+        
+        await self.pool.execute('''
+            INSERT INTO user_feedback (
+                id, event_id, action_id, feedback_type, helpful, rating, comment
+            ) VALUES ($1, $2, $3, $4, $5, $6, $7)
+        ''', feedback_id, event_id, action_id, feedback_type, helpful, rating, comment)
+        
+        logger.debug(f"Stored user feedback: {feedback_id}")
+    
+    async def store_health_metrics(self, health_data: Dict[str, Any]):
+        """Store system health metrics as time-series samples"""
+        
+        rows = [
+            (component, resolution, bucket, value, value, value, value, critical)
+            for component, resolution, bucket, value, critical in self._health_samples(health_data)
+        ]
+        
+        await self.pool.executemany('''
+            INSERT INTO health_series (
+                component, resolution, bucket, sample_count, value_sum,
+                value_min, value_max, value_last, critical_count
+            ) VALUES ($1, $2, $3, 1, $4, $5, $6, $7, $8)
+            ON CONFLICT (component, resolution, bucket) DO UPDATE SET
+                sample_count = health_series.sample_count + 1,
+                value_sum = health_series.value_sum + excluded.value_sum,
+                value_min = LEAST(health_series.value_min, excluded.value_min),
+                value_max = GREATEST(health_series.value_max, excluded.value_max),
+                value_last = excluded.value_last,
+                critical_count = health_series.critical_count + excluded.critical_count
+        ''', rows)
+        
+        logger.debug(f"Stored health metrics: {len(rows) // len(HEALTH_RESOLUTIONS)} components")
+    
+    async def get_health_series(self, component: str, start: datetime, end: Optional[datetime] = None,
+                               resolution: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get health samples for a component within [start, end)"""
+        
+        end = end or datetime.utcnow()
+        bucket_width = self._resolve_health_resolution(start, resolution)
+        
+        rows = await self.pool.fetch('''
+            SELECT bucket, sample_count, value_sum, value_min, value_max, value_last, critical_count
+            FROM health_series
+            WHERE component = $1 AND resolution = $2 AND bucket >= $3 AND bucket < $4
+            ORDER BY bucket
+        ''', component, bucket_width, self._epoch(start), self._epoch(end))
+        
+        return [self._health_point(row) for row in rows]
+    
+    async def prune_health_series(self) -> int:
+        """Delete health samples older than their resolution's retention window"""
+        
+        now = self._epoch(datetime.utcnow())
+        deleted = 0
+        
+        for name, resolution in HEALTH_RESOLUTIONS.items():
+            cutoff = int(now - self.health_retention_days[name] * 86400)
+            status = await self.pool.execute(
+                'DELETE FROM health_series WHERE resolution = $1 AND bucket < $2',
+                resolution, cutoff
+            )
+            deleted += _row_count(status)
+        
+        if deleted:
+            logger.debug(f"Pruned {deleted} expired health samples")
+        
+        return deleted
+    
+    async def get_statistics(self) -> Dict[str, Any]:
+        """Get comprehensive statistics"""
+        
+        stats = {}
+        
+        async with self.pool.acquire() as conn:
+            event_stats = await conn.fetchrow('''
+                SELECT
+                    COUNT(*) as total_events,
+                    COUNT(CASE WHEN severity = 'CRITICAL' THEN 1 END) as critical_events,
+                    COUNT(CASE WHEN severity = 'IMPORTANT' THEN 1 END) as important_events,
+                    COUNT(CASE WHEN requires_action THEN 1 END) as actionable_events
+                FROM events
+                WHERE timestamp > NOW() - INTERVAL '7 days'
+            ''')
+            
+            stats['events'] = {
+                'total_last_7_days': event_stats[0],
+                'critical_last_7_days': event_stats[1],
+                'important_last_7_days': event_stats[2],
+                'actionable_last_7_days': event_stats[3]
+            }
+            
+            action_stats = await conn.fetchrow('''
+                SELECT
+                    COUNT(*) as total_actions,
+                    COUNT(CASE WHEN success THEN 1 END) as successful_actions,
+                    AVG(rep_score) as avg_rep_score,
+                    COUNT(CASE WHEN human_validation_needed THEN 1 END) as human_validation_needed
+                FROM action_results
+                WHERE timestamp > NOW() - INTERVAL '7 days'
+            ''')
+            
+            stats['actions'] = {
+                'total_last_7_days': action_stats[0] or 0,
+                'successful_last_7_days': action_stats[1] or 0,
+                'avg_rep_score': round(action_stats[2] or 0, 3),
+                'human_validation_needed': action_stats[3] or 0
+            }
+            
+            notif_stats = await conn.fetchrow('''
+                SELECT
+                    COUNT(*) as total_notifications,
+                    COUNT(CASE WHEN status = 'sent' THEN 1 END) as sent_notifications,
+                    COUNT(CASE WHEN status = 'delivered' THEN 1 END) as delivered_notifications
+                FROM notifications
+                WHERE sent_at > NOW() - INTERVAL '7 days'
+            ''')
+            
+            stats['notifications'] = {
+                'total_last_7_days': notif_stats[0] or 0,
+                'sent_last_7_days': notif_stats[1] or 0,
+                'delivered_last_7_days': notif_stats[2] or 0
+            }
+            
+            feedback_stats = await conn.fetchrow('''
+                SELECT
+                    COUNT(*) as total_feedback,
+                    COUNT(CASE WHEN helpful THEN 1 END) as positive_feedback,
+                    AVG(rating) as avg_rating
+                FROM user_feedback
+                WHERE timestamp > NOW() - INTERVAL '30 days'
+            ''')
+            
+            stats['learning'] = {
+                'total_feedback_30_days': feedback_stats[0] or 0,
+                'positive_feedback_30_days': feedback_stats[1] or 0,
+                'avg_rating': round(float(feedback_stats[2] or 0), 1)
+            }
+            
+            earliest = await conn.fetchval('''
+                SELECT MIN(bucket)
+                FROM health_series
+                WHERE resolution = $1 AND bucket > EXTRACT(EPOCH FROM NOW() - INTERVAL '7 days')
+            ''', HEALTH_RESOLUTIONS['1m'])
+        
+        if earliest:
+            uptime_hours = (self._epoch(datetime.utcnow()) - earliest) / 3600
+            stats['system'] = {
+                'uptime_hours': round(uptime_hours, 1)
+            }
+        else:
+            stats['system'] = {'uptime_hours': 0}
+        
+        return stats
+    
+    async def get_events(self, limit: int = 100, offset: int = 0,
+                        event_type: Optional[str] = None, severity: Optional[str] = None,
+                        cursor: Optional[Tuple[str, str]] = None,
+                        projection: str = 'full',
+                        data_filters: Optional[Dict[str, Any]] = None) -> List[Event]:
+        """Get events with optional filtering, newest first (see PADADatabase.get_events)"""
+        
+        if projection not in ('full', 'summary'):
+            raise ValueError(f"Unknown event projection: {projection}")
+        
+        columns = 'id, source, type, title, description, severity, timestamp, requires_action, suggested_actions'
+        if projection == 'full':
+            columns += ', data'
+        
+        query, params = self._build_events_query(columns, limit, offset, event_type, severity, cursor, data_filters)
+        rows = await self.pool.fetch(query, *params)
+        
+        return [
+            Event(
+                id=row['id'],
+                source=row['source'],
+                type=row['type'],
+                title=row['title'],
+                description=row['description'],
+                severity=row['severity'],
+                timestamp=row['timestamp'],
+                data=json.loads(row['data']) if projection == 'full' and row['data'] else {},
+                requires_action=bool(row['requires_action']),
+                suggested_actions=json.loads(row['suggested_actions']) if row['suggested_actions'] else []
+            ) for row in rows
+        ]
+    
+    async def get_event_rows(self, limit: int = 100, event_type: Optional[str] = None,
+                            severity: Optional[str] = None,
+                            cursor: Optional[Tuple[str, str]] = None,
+                            data_filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """Get events as plain rows with ``data`` left as JSON text"""
+        
+        columns = ('id, source, type, title, description, severity, timestamp, requires_action, '
+                   'suggested_actions::text AS suggested_actions, data::text AS data')
+        query, params = self._build_events_query(columns, limit, 0, event_type, severity, cursor, data_filters)
+        rows = await self.pool.fetch(query, *params)
+        
+        return [
+            {
+                **dict(row),
+                'timestamp': row['timestamp'].isoformat()
+            } for row in rows
+        ]
+    
+    async def get_event_data(self, event_id: str) -> Dict[str, Any]:
+        """Load and decode the ``data`` payload of a single event"""
+        
+        data = await self.pool.fetchval('SELECT data FROM events WHERE id = $1', event_id)
+        return json.loads(data) if data else {}
+    
+    async def get_event_key(self, event_id: str) -> Optional[Tuple[str, str, str]]:
+        """(source, type, severity) of a single event, or None if it is not stored"""
+        
+        row = await self.pool.fetchrow('SELECT source, type, severity FROM events WHERE id = $1', event_id)
+        return tuple(row) if row else None
+    
+    async def event_exists(self, event_type: Optional[str] = None,
+                          data_filters: Optional[Dict[str, Any]] = None) -> bool:
+        """Check whether any event matches the type and indexed data fields"""
+        
+        query, params = self._build_events_query('1', 1, 0, event_type, None, None, data_filters)
+        return await self.pool.fetchval(query, *params) is not None
+    
+    def _build_events_query(self, columns: str, limit: int, offset: int,
+                            event_type: Optional[str], severity: Optional[str],
+                            cursor: Optional[Tuple[str, str]],
+                            data_filters: Optional[Dict[str, Any]] = None) -> Tuple[str, List[Any]]:
+        """Build the filtered, keyset-ordered events query with $n placeholders"""
+        
+        query = f'SELECT {columns} FROM events'
+        params = []
+        conditions = []
+        
+        if event_type:
+            params.append(event_type)
+            conditions.append(f'type = ${len(params)}')
+        
+        if severity:
+            params.append(severity)
+            conditions.append(f'severity = ${len(params)}')
+        
+        for field, value in self._validate_data_filters(data_filters).items():
+            params.append(value if INDEXED_EVENT_FIELDS[field] == 'integer' else str(value))
+            conditions.append(f'{_data_field_expression(field)} = ${len(params)}')
+        
+        if cursor:
+            params.extend([_utc(datetime.fromisoformat(cursor[0])), cursor[1]])
+            conditions.append(f'(timestamp, id) < (${len(params) - 1}, ${len(params)})')
+        
+        if conditions:
+            query += ' WHERE ' + ' AND '.join(conditions)
+        
+        params.append(limit)
+        query += f' ORDER BY timestamp DESC, id DESC LIMIT ${len(params)}'
+        
+        if offset:
+            params.append(offset)
+            query += f' OFFSET ${len(params)}'
+        
+        return query, params
+    
+    async def get_learning_data(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Get data for machine learning"""
+        
+        async with self.pool.acquire() as conn:
+            notification_feedback = await conn.fetch('''
+                SELECT e.type, e.severity, e.source, f.helpful, f.rating
+                FROM user_feedback f
+                JOIN events e ON f.event_id = e.id
+                WHERE f.feedback_type = 'notification'
+                AND f.timestamp > NOW() - INTERVAL '90 days'
+            ''')
+            
+            action_feedback = await conn.fetch('''
+                SELECT ar.action_type, ar.rep_score, f.helpful, f.rating
+                FROM user_feedback f
+                JOIN action_results ar ON f.action_id = ar.action_id
+                WHERE f.feedback_type = 'action'
+                AND f.timestamp > NOW() - INTERVAL '90 days'
+            ''')
+        
+        return {
+            'notification_patterns': [
+                {
+                    'event_type': row[0],
+                    'severity': row[1],
+                    'source': row[2],
+                    'helpful': bool(row[3]),
+                    'rating': row[4]
+                } for row in notification_feedback
+            ],
+            'action_patterns': [
+                {
+                    'action_type': row[0],
+                    'rep_score': row[1],
+                    'helpful': bool(row[2]),
+                    'rating': row[3]
+                } for row in action_feedback
+            ]
+        }
+    
+    async def store_learning_pattern(self, pattern_type: str, pattern_data: Dict[str, Any],
+                                   confidence_score: float, pattern_id: Optional[str] = None):
+        """Store a learned pattern; an existing ``pattern_id`` is overwritten"""
+        
+        pattern_id = pattern_id or str(uuid.uuid4())
+        
+        await self.pool.execute('''
+            INSERT INTO learning_patterns (
+                id, pattern_type, pattern_data, confidence_score
+            ) VALUES ($1, $2, $3, $4)
+            ON CONFLICT (id) DO UPDATE SET
+                pattern_data = excluded.pattern_data,
+                confidence_score = excluded.confidence_score,
+                updated_at = NOW()
+        ''', pattern_id, pattern_type, json.dumps(pattern_data), confidence_score)
+        
+        logger.debug(f"Stored learning pattern: {pattern_id}")
+    
+    async def get_learning_patterns(self, pattern_type: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get stored learning patterns"""
+        
+        if pattern_type:
+            rows = await self.pool.fetch('''
+                SELECT pattern_data, confidence_score, times_applied, success_rate
+                FROM learning_patterns
+                WHERE pattern_type = $1
+                ORDER BY confidence_score DESC
+            ''', pattern_type)
+            
+            return [
+                {
+                    'data': json.loads(row[0]),
+                    'confidence': row[1],
+                    'times_applied': row[2],
+                    'success_rate': row[3]
+                } for row in rows
+            ]
+        
+        rows = await self.pool.fetch('''
+            SELECT pattern_type, pattern_data, confidence_score, times_applied, success_rate
+            FROM learning_patterns
+            ORDER BY confidence_score DESC
+        ''')
+        
+        return [
+            {
+                'type': row[0],
+                'data': json.loads(row[1]),
+                'confidence': row[2],
+                'times_applied': row[3],
+                'success_rate': row[4]
+            } for row in rows
+        ]
+    
+    async def get_expired_rows(self, table: str, cutoff: datetime, limit: int) -> List[Dict[str, Any]]:
+        """Get up to ``limit`` unreferenced rows of a retention table older than ``cutoff``"""
+        
+        spec = RETENTION_TABLES[table]
+        time_column = spec['time_column']
+        key_column = spec['key_column']
+        
+        conditions = [f'{time_column} < $1']
+        for ref_table, ref_column in spec['referenced_by']:
+            conditions.append(
+                f'NOT EXISTS (SELECT 1 FROM {ref_table} r WHERE r.{ref_column} = {table}.{key_column})'
+            )
+        
+        rows = await self.pool.fetch(f'''
+            SELECT * FROM {table}
+            WHERE {' AND '.join(conditions)}
+            ORDER BY {time_column}
+            LIMIT $2
+        ''', _utc(cutoff), limit)
+        
+        return [dict(row) for row in rows]
+    
+    async def delete_rows(self, table: str, keys: List[str]) -> int:
+        """Delete rows of a retention table by primary key"""
+        
+        if not keys:
+            return 0
+        
+        key_column = RETENTION_TABLES[table]['key_column']
+        status = await self.pool.execute(
+            f'DELETE FROM {table} WHERE {key_column} = ANY($1::text[])',
+            keys
+        )
+        
+        return _row_count(status)
+    
+    async def health_check(self) -> bool:
+        """Check database health"""
+        
+        try:
+            result = await self.pool.fetchval('SELECT 1')
+            
+            if result == 1:
+                logger.debug("Database health check passed")
+                return True
+            else:
+                logger.error("Database health check failed: unexpected result")
+                return False
+        
+        except Exception as e:
+            logger.error(f"Database health check failed: {e}")
+            return False
+    
+    async def close(self):
+        """Close the connection pool"""
+        
+        if self.pool:
+            await self.pool.close()
+            logger.info("Database connection pool closed")
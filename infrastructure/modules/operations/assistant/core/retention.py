@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+PADA Retention - Archival and Compaction for the PADA Database
+Moves expired rows into compressed, date-partitioned archives and reclaims free pages
+"""
+
+import asyncio
+import gzip
+import json
+import logging
+from collections import defaultdict
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Any
+
+from .database import DatabaseBackend, RETENTION_TABLES
+
+logger = logging.getLogger(__name__)
+
+class RetentionManager:
+    """Applies per-table retention with bounded work per cycle"""
+    
+    def __init__(self, db: DatabaseBackend, retention_config: Dict[str, Any]):
+        self.db = db
+        self.config = retention_config
+        self.enabled = retention_config.get('enabled', True)
+        self.archive_dir = Path(retention_config.get('archive_dir', 'pada_archive'))
+        self.table_retention_days = retention_config.get('table_retention_days', {})
+        self.max_rows_per_cycle = retention_config.get('max_rows_per_cycle', 5000)
+        self.batch_size = retention_config.get('batch_size', 500)
+        self.vacuum_pages_per_cycle = retention_config.get('vacuum_pages_per_cycle', 1000)
+        
+        # Totals since startup
+        self.rows_archived = defaultdict(int)
+        self.pages_reclaimed = 0
+        self.last_cycle = None
+        
+        unknown_tables = set(self.table_retention_days) - set(RETENTION_TABLES)
+        if unknown_tables:
+            logger.warning(f"Retention configured for unknown tables: {sorted(unknown_tables)}")
+        
+        logger.info(f"Retention manager initialized for {len(self.table_retention_days)} tables")
+    
+    async def run_cycle(self) -> Dict[str, Any]:
+        """Archive and delete expired rows, then run an incremental vacuum step
+        
+        At most ``max_rows_per_cycle`` rows are moved per call; anything left
+        over is picked up by the next cycle.
+        """
+        
+        if not self.enabled:
+            return {'archived': {}, 'pages_reclaimed': 0}
+        
+        budget = self.max_rows_per_cycle
+        archived = {}
+        
+        # RETENTION_TABLES is ordered so referencing rows go before the rows they reference
+        for table in RETENTION_TABLES:
+            retention_days = self.table_retention_days.get(table)
+            if retention_days is None or budget <= 0:
+                continue
+            
+            cutoff = datetime.utcnow() - timedelta(days=retention_days)
+            moved = 0
+            
+            while budget > 0:
+                rows = await self.db.get_expired_rows(table, cutoff, min(self.batch_size, budget))
+                if not rows:
+                    break
+                
+                await asyncio.to_thread(self._write_archive, table, rows)
+                
+                key_column = RETENTION_TABLES[table]['key_column']
+                deleted = await self.db.delete_rows(table, [row[key_column] for row in rows])
+                
+                moved += deleted
+                budget -= len(rows)
+                
+                if len(rows) < self.batch_size:
+                    break
+            
+            if moved:
+                archived[table] = moved
+                self.rows_archived[table] += moved
+                logger.info(f"Archived {moved} expired rows from {table}")
+        
+        pages = await self.db.incremental_vacuum(self.vacuum_pages_per_cycle)
+        self.pages_reclaimed += pages
+        self.last_cycle = datetime.utcnow()
+        
+        return {'archived': archived, 'pages_reclaimed': pages}
+    
+    def _write_archive(self, table: str, rows: List[Dict[str, Any]]):
+        """Append rows to gzip NDJSON archives partitioned by table and row date
+        
+        Each append adds a new gzip member; concatenated members read back as
+        a single stream with ``gzip.open``.
+        """
+        
+        time_column = RETENTION_TABLES[table]['time_column']
+        partitions = defaultdict(list)
+        
+        for row in rows:
+            partitions[str(row[time_column])[:10]].append(row)
+        
+        table_dir = self.archive_dir / table
+        table_dir.mkdir(parents=True, exist_ok=True)
+        
+        for day, day_rows in partitions.items():
+            archive_file = table_dir / f"{day}.ndjson.gz"
+            payload = ''.join(json.dumps(row, default=str) + '\n' for row in day_rows)
+            
+            with gzip.open(archive_file, 'at', encoding='utf-8') as f:
+                f.write(payload)
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get retention statistics"""
+        
+        return {
+            'enabled': self.enabled,
+            'table_retention_days': self.table_retention_days,
+            'rows_archived': dict(self.rows_archived),
+            'pages_reclaimed': self.pages_reclaimed,
+            'last_cycle': self.last_cycle.isoformat() if self.last_cycle else None
+        }
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+PADA Triage - Declarative keyword rules for GitHub event severity and actions
+Rule tables are compiled once into a single matcher per category
+"""
+
+import re
+from typing import Dict, List, Optional, Any, Iterable
+
+# Rules are checked in order; the first rule with a matching keyword wins.
+# 'commit' and 'pull_request' keywords match anywhere in the lowercased
+# commit message / PR title; 'issue_labels' keywords match whole labels.
+DEFAULT_TRIAGE_RULES: Dict[str, List[Dict[str, Any]]] = {
+    'commit': [
+        {'keywords': ['security', 'urgent', 'hotfix'], 'severity': 'IMPORTANT'},
+        {'keywords': ['fix', 'bug', 'error', 'crash'], 'severity': 'HELPFUL'}
+    ],
+    'pull_request': [
+        # Only applied to mergeable, non-draft PRs
+        {
+            'keywords': ['typo', 'readme', 'docs', 'comment', 'test'],
+            'severity': 'IMPORTANT',
+            'requires_action': True,
+            'suggested_actions': ['merge_safe_pr']
+        }
+    ],
+    'issue_labels': [
+        {'keywords': ['bug', 'critical', 'urgent', 'security'], 'severity': 'CRITICAL'},
+        {'keywords': ['enhancement', 'feature'], 'severity': 'IMPORTANT'}
+    ]
+}
+
+class KeywordMatcher:
+    """Finds the first rule with a keyword occurring anywhere in a text, in one regex pass
+    
+    All keywords are compiled into one alternation inside a lookahead, so
+    every start position is tried once. Each keyword is ranked by the
+    best rule among the keywords it contains, which makes overlapping
+    keywords (``fix`` inside ``hotfix``) resolve exactly as separate
+    substring checks would.
+    """
+    
+    def __init__(self, rules: List[Dict[str, Any]]):
+        self.rules = rules
+        self.rank: Dict[str, int] = {}
+        
+        for index, rule in enumerate(rules):
+            for keyword in rule['keywords']:
+                self.rank.setdefault(keyword.lower(), index)
+        
+        for keyword in self.rank:
+            self.rank[keyword] = min(rank for other, rank in self.rank.items() if other in keyword)
+        
+        if self.rank:
+            alternation = '|'.join(re.escape(keyword) for keyword in sorted(self.rank, key=len, reverse=True))
+            self.pattern = re.compile(f"(?=({alternation}))")
+        else:
+            self.pattern = None
+    
+    def match(self, text: str) -> Optional[Dict[str, Any]]:
+        """Get the first matching rule for a text, or None"""
+        
+        if not self.pattern or not text:
+            return None
+        
+        best = None
+        for found in self.pattern.finditer(text.lower()):
+            rank = self.rank[found.group(1)]
+            if best is None or rank < best:
+                best = rank
+                if best == 0:
+                    break
+        
+        return self.rules[best] if best is not None else None
+
+class LabelMatcher:
+    """Finds the first rule with a keyword equal to one of the given labels"""
+    
+    def __init__(self, rules: List[Dict[str, Any]]):
+        self.rules = rules
+        self.rank: Dict[str, int] = {}
+        
+        for index, rule in enumerate(rules):
+            for keyword in rule['keywords']:
+                self.rank.setdefault(keyword.lower(), index)
+    
+    def match(self, labels: Iterable[str]) -> Optional[Dict[str, Any]]:
+        """Get the first matching rule for a set of lowercased labels, or None"""
+        
+        ranks = [self.rank[label] for label in labels if label in self.rank]
+        return self.rules[min(ranks)] if ranks else None
+
+class TriageRules:
+    """Compiled triage rules; categories missing from ``rules`` use the defaults"""
+    
+    def __init__(self, rules: Optional[Dict[str, List[Dict[str, Any]]]] = None):
+        rules = {**DEFAULT_TRIAGE_RULES, **(rules or {})}
+        
+        self.commit = KeywordMatcher(rules['commit'])
+        self.pull_request = KeywordMatcher(rules['pull_request'])
+        self.issue_labels = LabelMatcher(rules['issue_labels'])